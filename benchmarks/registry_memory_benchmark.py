@@ -0,0 +1,100 @@
+"""
+Benchmark of the memory taken by registering many programmatic injectables, each with
+its own qualifier, as happens with per-tenant registrations.
+
+Compares the current slotted ``Injectable`` against the previous frozen dataclass
+representation with UUID unique ids.
+
+Usage::
+
+    python benchmarks/registry_memory_benchmark.py [--injectables 100000]
+"""
+
+import argparse
+import sys
+import threading
+import time
+import tracemalloc
+import uuid
+from dataclasses import dataclass, field
+from typing import Callable, FrozenSet, Optional, Tuple
+
+from injectable import Injectable
+from injectable.container.namespace import Namespace
+
+
+@dataclass(frozen=True)
+class DataclassInjectable:
+    constructor: callable = field(compare=False)
+    unique_id: str = field(default_factory=lambda: uuid.uuid1().hex)
+    primary: bool = False
+    group: Optional[str] = None
+    singleton: bool = False
+    scope: Optional[str] = None
+    init: Optional[str] = None
+    groups: FrozenSet[str] = frozenset()
+    _singleton_lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+
+
+def register_injectables(injectable_class: Callable, count: int) -> Namespace:
+    namespace = Namespace()
+    for index in range(count):
+        namespace.register_injectable(
+            injectable_class(object), qualifier=f"tenant-{index}"
+        )
+    return namespace
+
+
+def measure(injectable_class: Callable, count: int) -> Tuple[int, float, float]:
+    tracemalloc.start()
+    namespace = register_injectables(injectable_class, count)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del namespace
+    start = time.perf_counter()
+    namespace = register_injectables(injectable_class, count)
+    registration_time = time.perf_counter() - start
+    # building sets from other collections hashes every injectable
+    injectables = [
+        injectable
+        for candidates in namespace.qualifier_registry.values()
+        for injectable in candidates
+    ]
+    start = time.perf_counter()
+    set(injectables)
+    hashing_time = time.perf_counter() - start
+    return size, registration_time, hashing_time
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--injectables", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(f"Registering {args.injectables} injectables with one qualifier each")
+    results = {}
+    for name, injectable_class in (
+        ("dataclass", DataclassInjectable),
+        ("slotted", Injectable),
+    ):
+        size, registration_time, hashing_time = measure(
+            injectable_class, args.injectables
+        )
+        results[name] = size
+        injectable = injectable_class(object)
+        instance_size = sys.getsizeof(injectable)
+        if hasattr(injectable, "__dict__"):
+            instance_size += sys.getsizeof(injectable.__dict__)
+        print(
+            f"  {name + ':':<10} {size / 1024 / 1024:6.1f} MiB,"
+            f" {instance_size} bytes per injectable,"
+            f" registered in {registration_time:.3f}s,"
+            f" set operations in {hashing_time:.3f}s"
+        )
+    print(f"  {results['dataclass'] / results['slotted']:.2f}x less memory")
+
+
+if __name__ == "__main__":
+    main()
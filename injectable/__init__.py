@@ -11,9 +11,21 @@ from injectable.autowiring.autowired_type import Autowired
 from injectable.autowiring.autowired_decorator import autowired
 from injectable.container.injection_container import InjectionContainer
 from injectable.container.injectable import Injectable
+from injectable.container.injection_scope import injection_scope
 from injectable.container.load_injection_container import load_injection_container
+from injectable.container.build_manifest import build_manifest
+from injectable.container.bulk_register import bulk_register
+from injectable.container.load_report import LoadReport
+from injectable.container.manifest import Manifest
+from injectable.container.scan_cache import ScanCache
+from injectable.container.warm_up import warm_up
 from injectable.injection.injectable_factory_decorator import injectable_factory
-from injectable.injection.inject import inject, inject_multiple
+from injectable.injection.inject import (
+    ainject,
+    ainject_multiple,
+    inject,
+    inject_multiple,
+)
 from injectable.injection.injectable_decorator import injectable
 from injectable import errors
 from injectable import testing
@@ -23,7 +35,13 @@ __version__ = "4.0.1"
 
 __all__ = [
     "load_injection_container",
+    "warm_up",
+    "build_manifest",
+    "bulk_register",
+    "Manifest",
+    "LoadReport",
     "InjectionContainer",
+    "ScanCache",
     "Injectable",
     "autowired",
     "Autowired",
@@ -31,6 +49,9 @@ __all__ = [
     "injectable",
     "inject",
     "inject_multiple",
+    "ainject",
+    "ainject_multiple",
+    "injection_scope",
     "errors",
     "testing",
     "constants",
@@ -0,0 +1,98 @@
+"""
+Command line utilities of injectable.
+
+Usage::
+
+    python -m injectable build-manifest <search_path> [-o <output_path>]
+    python -m injectable profile-load <search_path> [--top <count>] [--eager-singletons]
+"""
+
+import argparse
+import os
+import sys
+from typing import List
+
+from injectable.constants import DEFAULT_NAMESPACE, LoadingMode
+from injectable.container.build_manifest import build_manifest
+from injectable.container.load_injection_container import load_injection_container
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m injectable")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    build_manifest_parser = subparsers.add_parser(
+        "build-manifest",
+        help="write a manifest of the modules registering injectables in a path",
+    )
+    build_manifest_parser.add_argument("search_path")
+    build_manifest_parser.add_argument(
+        "-o", "--output", help="manifest file path (default: in the search path)"
+    )
+    build_manifest_parser.add_argument("--default-namespace", default=DEFAULT_NAMESPACE)
+    build_manifest_parser.add_argument("--encoding", default="utf-8")
+
+    profile_load_parser = subparsers.add_parser(
+        "profile-load",
+        help="load the injectables in a path and print the slowest modules",
+    )
+    profile_load_parser.add_argument("search_path")
+    profile_load_parser.add_argument(
+        "--top", type=int, default=10, help="number of modules to print (default: 10)"
+    )
+    profile_load_parser.add_argument(
+        "--mode",
+        choices=[mode.value for mode in LoadingMode],
+        default=LoadingMode.RUN.value,
+    )
+    profile_load_parser.add_argument("--default-namespace", default=DEFAULT_NAMESPACE)
+    profile_load_parser.add_argument("--encoding", default="utf-8")
+    profile_load_parser.add_argument(
+        "--eager-singletons",
+        action="store_true",
+        help="also construct singletons and print the slowest ones",
+    )
+
+    args = parser.parse_args(argv)
+    if args.command == "build-manifest":
+        manifest = build_manifest(
+            args.search_path,
+            args.output,
+            default_namespace=args.default_namespace,
+            encoding=args.encoding,
+        )
+        injectables_count = sum(len(module.injectables) for module in manifest.modules)
+        print(
+            f"Wrote {manifest.filepath}: {len(manifest.modules)} module(s),"
+            f" {injectables_count} injectable(s)"
+        )
+    elif args.command == "profile-load":
+        report = load_injection_container(
+            os.path.abspath(args.search_path),
+            default_namespace=args.default_namespace,
+            encoding=args.encoding,
+            mode=LoadingMode(args.mode),
+            eager_singletons=args.eager_singletons,
+        )
+        print(
+            f"Walked {report.files_walked} file(s), scanned {report.files_scanned}"
+            f" in {report.total_scan_time:.3f}s, matched {report.files_matched},"
+            f" executed {report.files_executed} in {report.total_execution_time:.3f}s"
+        )
+        for namespace, count in sorted(report.registrations.items()):
+            print(f"Registered {count} injectable(s) in {namespace}")
+        slowest_modules = report.slowest_modules(args.top)
+        if slowest_modules:
+            print(f"Slowest {len(slowest_modules)} module(s):")
+        for filepath, seconds in slowest_modules:
+            print(f"  {seconds:8.3f}s  {filepath}")
+        slowest_singletons = report.slowest_singletons(args.top)
+        if slowest_singletons:
+            print(f"Slowest {len(slowest_singletons)} singleton(s):")
+        for unique_id, seconds in slowest_singletons:
+            print(f"  {seconds:8.3f}s  {unique_id}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,13 +1,37 @@
+import asyncio
 import inspect
 from functools import wraps
-from typing import TypeVar, Callable, get_args, _AnnotatedAlias, Union
+from typing import (
+    TypeVar,
+    Callable,
+    get_args,
+    _AnnotatedAlias,
+    Union,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
 
 from injectable.autowiring.autowired_type import _Autowired, Autowired
+from injectable.container.injectable import resolving_for_current_task
 from injectable.errors import AutowiringError
 
 R = TypeVar("R")
 
 
+class _AutowiredParameter(NamedTuple):
+    """
+    Step of an injection plan: how one autowired parameter is detected as supplied by
+    the caller and how its dependency is injected otherwise.
+    """
+
+    name: str
+    #: position in which the parameter can be passed, None for keyword-only ones
+    position: Optional[int]
+    positional_only: bool
+    annotation: _Autowired
+
+
 def autowired(func: Callable[..., R]) -> Callable[..., R]:
     """
     Function decorator to setup dependency injection autowiring.
@@ -32,6 +56,11 @@ def autowired(func: Callable[..., R]) -> Callable[..., R]:
     .. note::
       This decorator accepts no arguments and must be used without trailing parenthesis.
 
+    When decorating an ``async def`` function the dependencies are injected as by
+    :meth:`ainject <injectable.ainject>`, so async factories are supported. When more
+    than one dependency must be injected they're constructed concurrently, regular
+    constructors being run in the event loop's default executor.
+
     Usage::
 
       >>> from injectable import Autowired, autowired
@@ -39,14 +68,18 @@ def autowired(func: Callable[..., R]) -> Callable[..., R]:
       >>> @autowired
       ... def foo(dep: Autowired(...)):
       ...     ...
+
+    .. versionchanged:: 4.1.0
+       Coroutine functions are wrapped by a coroutine function injecting dependencies
+       concurrently.
     """
     signature = inspect.signature(func)
-    autowired_parameters = []
+    plan = []
     for index, parameter in enumerate(signature.parameters.values()):
         annotation = _get_parameter_annotation(parameter)
 
         if not isinstance(annotation, _Autowired):
-            if len(autowired_parameters) == 0 or parameter.kind in [
+            if len(plan) == 0 or parameter.kind in [
                 parameter.KEYWORD_ONLY,
                 parameter.VAR_KEYWORD,
             ]:
@@ -58,30 +91,106 @@ def autowired(func: Callable[..., R]) -> Callable[..., R]:
             raise AutowiringError("Default value assigned to Autowired parameter")
         if parameter.kind in (parameter.VAR_POSITIONAL, parameter.VAR_KEYWORD):
             raise AutowiringError(f"Autowired parameter is of kind {parameter.kind}")
-        autowired_parameters.append(parameter)
+        plan.append(
+            _AutowiredParameter(
+                parameter.name,
+                None if parameter.kind is parameter.KEYWORD_ONLY else index,
+                parameter.kind is parameter.POSITIONAL_ONLY,
+                annotation,
+            )
+        )
 
-    if len(autowired_parameters) == 0:
+    if len(plan) == 0:
         raise AutowiringError("No parameter is typed with 'Autowired'")
 
+    plan = tuple(plan)
+    if inspect.iscoroutinefunction(func):
+        wrapper = _async_wrapper(func, plan)
+    elif any(parameter.positional_only for parameter in plan):
+        wrapper = _positional_only_wrapper(func, plan)
+    else:
+        wrapper = _keyword_wrapper(func, plan)
+    wrapper.__injection_plan__ = plan
+    return wrapper
+
+
+def _keyword_wrapper(
+    func: Callable[..., R], plan: Tuple[_AutowiredParameter, ...]
+) -> Callable[..., R]:
+    # Parameters preceding autowired ones can't be keyword-only nor variadic, so
+    # an autowired parameter is supplied positionally exactly when there are more
+    # positional arguments than its position, and no binding is needed.
     @wraps(func)
     def wrapper(*args, **kwargs) -> R:
-        bound_arguments = signature.bind_partial(*args, **kwargs).arguments
-        args = list(args)
-        for parameter in autowired_parameters:
-            if parameter.name in bound_arguments:
+        positional_count = len(args)
+        for name, position, _, annotation in plan:
+            if name in kwargs or (position is not None and position < positional_count):
                 continue
-            annotation = _get_parameter_annotation(parameter)
-            dependency = annotation.inject()
-            if parameter.kind is parameter.POSITIONAL_ONLY:
-                args.append(dependency)
-            else:
-                kwargs[parameter.name] = dependency
-
+            kwargs[name] = annotation.inject()
         return func(*args, **kwargs)
 
     return wrapper
 
 
+def _positional_only_wrapper(
+    func: Callable[..., R], plan: Tuple[_AutowiredParameter, ...]
+) -> Callable[..., R]:
+    @wraps(func)
+    def wrapper(*args, **kwargs) -> R:
+        positional_count = len(args)
+        injected_args = []
+        for name, position, positional_only, annotation in plan:
+            if position is not None and position < positional_count:
+                continue
+            if positional_only:
+                injected_args.append(annotation.inject())
+            elif name not in kwargs:
+                kwargs[name] = annotation.inject()
+        return func(*args, *injected_args, **kwargs)
+
+    return wrapper
+
+
+def _async_wrapper(
+    func: Callable[..., R], plan: Tuple[_AutowiredParameter, ...]
+) -> Callable[..., R]:
+    @wraps(func)
+    async def wrapper(*args, **kwargs) -> R:
+        positional_count = len(args)
+        missing = [
+            parameter
+            for parameter in plan
+            if not (
+                (
+                    parameter.position is not None
+                    and parameter.position < positional_count
+                )
+                or (not parameter.positional_only and parameter.name in kwargs)
+            )
+        ]
+        if len(missing) == 1:
+            instances = [await missing[0].annotation.ainject()]
+        else:
+            # only worth leaving the loop when constructions can overlap, the tasks
+            # and threads resolving them sharing the task scope of the caller
+            with resolving_for_current_task():
+                instances = await asyncio.gather(
+                    *(
+                        parameter.annotation.ainject(in_executor=True)
+                        for parameter in missing
+                    )
+                )
+        injected_args = []
+        for parameter, instance in zip(missing, instances):
+            if parameter.positional_only:
+                injected_args.append(instance)
+            else:
+                kwargs[parameter.name] = instance
+        return await func(*args, *injected_args, **kwargs)
+
+    return wrapper
+
+
 def _get_parameter_annotation(parameter) -> Union[type, _Autowired]:
     if isinstance(parameter.annotation, _AnnotatedAlias):
         autowired_annotations = list(
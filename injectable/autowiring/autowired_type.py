@@ -7,7 +7,12 @@ from injectable.autowiring.autowiring_utils import (
     is_sequence,
     is_raw_sequence,
 )
-from injectable.injection.inject import inject, inject_multiple
+from injectable.injection.inject import (
+    ainject,
+    ainject_multiple,
+    inject,
+    inject_multiple,
+)
 
 T = TypeVar("T")
 
@@ -90,6 +95,29 @@ class _Autowired:
             optional=self.optional,
         )
 
+    async def ainject(self, in_executor: bool = False) -> T:
+        if self.dependency is None:
+            raise TypeError("No dependency was provided for autowiring")
+        if self.lazy:
+            return self.inject()
+        if self.multiple:
+            return await ainject_multiple(
+                self.dependency,
+                namespace=self.namespace,
+                group=self.group,
+                exclude_groups=self.exclude_groups,
+                optional=self.optional,
+                in_executor=in_executor,
+            )
+        return await ainject(
+            self.dependency,
+            namespace=self.namespace,
+            group=self.group,
+            exclude_groups=self.exclude_groups,
+            optional=self.optional,
+            in_executor=in_executor,
+        )
+
 
 class Autowired:
     """
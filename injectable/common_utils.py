@@ -1,19 +1,28 @@
-import inspect
 import os
+import sys
+from functools import lru_cache
 from typing import AnyStr, Union
 
 
 def get_caller_filepath(steps_back: int = 2) -> AnyStr:
     """
-    Utility function to get the caller's filepath using inspection.
+    Utility function to get the caller's filepath by looking up a single frame of the
+    call stack.
 
     :param steps_back: (optional) 1 step back in the call stack would return the file of
         the caller of this function. Defaults to 2, i.e. the path of the file of the
         caller of this function's caller.
     """
-    frame_info = inspect.stack()[steps_back]
-    filepath = frame_info.filename
-    del frame_info
+    frame = sys._getframe(steps_back)
+    filepath = frame.f_code.co_filename
+    del frame
+    if os.path.isabs(filepath):
+        return _normalize_filepath(filepath)
+    return os.path.abspath(filepath)
+
+
+@lru_cache(maxsize=1024)
+def _normalize_filepath(filepath: str) -> str:
     return os.path.abspath(filepath)
 
 
@@ -21,3 +30,11 @@ def get_dependency_name(dependency: Union[type, callable, str]) -> str:
     if isinstance(dependency, str):
         return dependency
     return dependency.__qualname__
+
+
+def get_type_name(klass: type) -> str:
+    """
+    Returns the module and qualified name of the class, which copies of the class
+    created by executing its module again share.
+    """
+    return f"{klass.__module__}.{klass.__qualname__}"
@@ -1,2 +1,66 @@
+from enum import Enum
+
 #: Default namespace used for registering and searching injectables
 DEFAULT_NAMESPACE = "DEFAULT_NAMESPACE"
+
+#: Entry point group in which installed packages advertise modules with injectables
+DEFAULT_ENTRY_POINT_GROUP = "injectable.modules"
+
+
+class LoadingMode(str, Enum):
+    """
+    Modes in which modules registering injectables are loaded into the injection
+    container.
+
+    .. versionadded:: 4.1.0
+    """
+
+    #: Executes each module with :mod:`runpy`, creating a copy of the module apart
+    #: from the one loaded through regular imports.
+    RUN = "run"
+    #: Imports each module through the regular import system so that it's executed
+    #: only once and injectables are registered from the same module object used by
+    #: the rest of the application. Modules already imported aren't executed again,
+    #: unless imported before the container was last reset, in which case they're
+    #: reloaded in place.
+    IMPORT = "import"
+    #: Registers injectables from metadata extracted statically from each module's
+    #: source and imports the module only when one of its injectables is first
+    #: injected. Modules whose registrations can't be extracted statically are
+    #: imported as in :attr:`IMPORT` mode.
+    LAZY = "lazy"
+
+
+class Scope(str, Enum):
+    """
+    Scopes in which an instance of an injectable is reused instead of being
+    constructed on each injection.
+
+    .. versionadded:: 4.1.0
+    """
+
+    #: One instance per thread, released when the thread ends.
+    THREAD = "thread"
+    #: One instance per :mod:`asyncio` task, or per :mod:`contextvars` context when
+    #: injected outside of a task, released along with the task. Dependencies of
+    #: async ``@autowired`` functions resolved concurrently are resolved as the
+    #: calling task.
+    TASK = "task"
+    #: One instance per :meth:`injection_scope <injectable.injection_scope>` block,
+    #: closed when the block exits. Outside of any such block a new instance is
+    #: constructed on each injection.
+    INJECTION_SCOPE = "injection_scope"
+
+
+class Init(str, Enum):
+    """
+    Moments in which singletons can be constructed other than on their first
+    injection.
+
+    .. versionadded:: 4.1.0
+    """
+
+    #: Constructs the singleton in a background thread started when the injection
+    #: container finishes loading. Injections block only if the construction hasn't
+    #: finished yet and errors raised by it are raised by the first injection.
+    BACKGROUND = "background"
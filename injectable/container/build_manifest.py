@@ -0,0 +1,114 @@
+import inspect
+import os
+from collections import defaultdict
+from typing import Dict, List
+
+from pycollect import module_finder
+
+from injectable.constants import DEFAULT_NAMESPACE
+from injectable.container.injectable import Injectable
+from injectable.container.injection_container import InjectionContainer
+from injectable.container.manifest import (
+    DEFAULT_MANIFEST_FILENAME,
+    Manifest,
+    ManifestInjectable,
+    ManifestModule,
+    file_sha256,
+)
+
+
+def build_manifest(
+    search_path: str,
+    output_path: str = None,
+    *,
+    default_namespace: str = DEFAULT_NAMESPACE,
+    encoding: str = "utf-8",
+) -> Manifest:
+    """
+    Discovers injectables under the search path and writes a
+    :class:`Manifest <injectable.Manifest>` with the modules which register them and
+    what each module registers. Returns the written manifest.
+
+    The manifest can then be passed to
+    :meth:`load_injection_container <injectable.load_injection_container>` to load the
+    injection container without walking nor scanning the search path. This is also
+    available through the command line::
+
+        python -m injectable build-manifest <search_path> [-o <output_path>]
+
+    The Python files walked and the modification times of their directories are
+    recorded too, so that modules registering injectables added later make the
+    manifest stale. Modules added to directories which held no Python files when the
+    manifest was built aren't detected.
+
+    .. note::
+
+        Files already loaded into the injection container by the current process
+        won't be executed again and thus won't be listed in the manifest. Build
+        manifests from a process which didn't load the injection container yet.
+
+    :param search_path: path under which to search for injectables. Can be either a
+            relative path to the current working directory or an absolute path.
+    :param output_path: (optional) path of the manifest file to be written. Defaults
+            to a file named ``injectable-manifest.json`` in the search path.
+    :param default_namespace: (optional) designated namespace for registering
+            injectables which does not explicitly request to be addressed in a
+            specific namespace. Defaults to
+            :const:`injectable.constants.DEFAULT_NAMESPACE`.
+    :param encoding: (optional) defines which encoding to use when reading project files
+            to discover and register injectables. Defaults to ``utf-8``.
+
+    .. versionadded:: 4.1.0
+    """
+    search_path = os.path.abspath(search_path)
+    output_path = os.path.abspath(
+        output_path or os.path.join(search_path, DEFAULT_MANIFEST_FILENAME)
+    )
+    registrations: Dict[str, List[ManifestInjectable]] = defaultdict(list)
+
+    def record(injectable: Injectable, filepath, namespace, klass, qualifier):
+        registrations[filepath].append(
+            ManifestInjectable(
+                name=injectable.constructor.__qualname__,
+                kind="class" if inspect.isclass(injectable.constructor) else "factory",
+                namespace=namespace,
+                klass=klass.__qualname__ if klass else None,
+                qualifier=qualifier,
+                group=injectable.group,
+                primary=injectable.primary,
+                singleton=injectable.singleton,
+                scope=injectable.scope.value if injectable.scope else None,
+                init=injectable.init.value if injectable.init else None,
+                groups=sorted(injectable.groups) or None,
+            )
+        )
+
+    previously_loaded = set(InjectionContainer.LOADED_FILEPATHS)
+    InjectionContainer.REGISTRATION_LISTENERS.append(record)
+    try:
+        InjectionContainer.load_dependencies_from(
+            search_path, default_namespace, encoding
+        )
+    finally:
+        InjectionContainer.REGISTRATION_LISTENERS.remove(record)
+
+    manifest = Manifest(root="", default_namespace=default_namespace)
+    manifest.filepath = output_path
+    manifest.root = manifest.relativize(search_path)
+    for filepath in sorted(InjectionContainer.LOADED_FILEPATHS - previously_loaded):
+        stat = os.stat(filepath)
+        manifest.modules.append(
+            ManifestModule(
+                path=manifest.relativize(filepath),
+                module=module_finder.find_module_name(filepath),
+                size=stat.st_size,
+                mtime=stat.st_mtime_ns,
+                sha256=file_sha256(filepath),
+                injectables=registrations[filepath],
+            )
+        )
+    # written before recording the tree as it may create the file in a directory of it
+    manifest.write()
+    manifest.record_tree()
+    manifest.write()
+    return manifest
@@ -0,0 +1,102 @@
+from typing import Any, Callable, Iterable, List, Mapping, Optional, Tuple, Union
+
+from injectable.constants import DEFAULT_NAMESPACE
+from injectable.container.injectable import Injectable
+from injectable.container.injection_container import InjectionContainer
+from injectable.errors import InjectableLoadError
+from injectable.injection.injection_utils import (
+    validate_groups,
+    validate_init,
+    validate_scope,
+)
+
+#: Options accepted by :class:`Injectable <injectable.Injectable>` for each registration
+_INJECTABLE_OPTIONS = frozenset(
+    {"unique_id", "primary", "group", "groups", "singleton", "scope", "init"}
+)
+
+Registration = Union[
+    Tuple[Callable, Union[type, str]],
+    Tuple[Callable, Union[type, str], Optional[Mapping[str, Any]]],
+]
+
+
+def bulk_register(
+    registrations: Iterable[Registration],
+    *,
+    namespace: str = None,
+) -> List[Injectable]:
+    """
+    Registers many injectables at once, e.g. generated from configuration, without
+    declaring them with decorators. Returns the registered injectables.
+
+    Each registration is a tuple of the constructor, the class or the qualifier the
+    injectable is registered for and, optionally, a mapping of options. Options are
+    those of :meth:`@injectable <injectable.injectable>`: ``unique_id``, ``primary``,
+    ``group``, ``groups``, ``singleton``, ``scope`` and ``init``, as well as
+    ``qualifier`` to also register an injectable for a qualifier besides its class and
+    ``propagate`` to not register it for the base classes of its class.
+
+    Every registration is validated before any of them is registered, raising an
+    :class:`InjectableLoadError <injectable.errors.InjectableLoadError>` for invalid
+    ones. Then the namespace registries are extended in a single pass: classes' bases
+    are looked up once per class, qualifiers are interned and cached resolutions are
+    invalidated only once.
+
+    :param registrations: the constructor, class or qualifier and options, if any, of
+            each injectable.
+    :param namespace: (optional) namespace in which the injectables will be registered.
+            Defaults to :const:`injectable.constants.DEFAULT_NAMESPACE`.
+
+    Usage::
+
+      >>> from injectable import bulk_register
+      >>>
+      >>> bulk_register(
+      ...     (TenantClient, f"client:{tenant}", {"singleton": True})
+      ...     for tenant in tenants
+      ... )
+
+    .. versionadded:: 4.1.0
+    """
+    entries = [_build_entry(registration) for registration in registrations]
+    namespace_entry = InjectionContainer._get_namespace_entry(
+        namespace or DEFAULT_NAMESPACE
+    )
+    namespace_entry.register_bulk(entries)
+    return [injectable for injectable, *_ in entries]
+
+
+def _build_entry(
+    registration: Registration,
+) -> Tuple[Injectable, Optional[type], Optional[str], bool]:
+    if len(registration) not in (2, 3):
+        raise InjectableLoadError(
+            "Registrations must be given as (constructor, class or qualifier, options)"
+        )
+    constructor, target, *rest = registration
+    options = dict(rest[0] or {}) if rest else {}
+    propagate = options.pop("propagate", True)
+    qualifier = options.pop("qualifier", None)
+    if isinstance(target, str):
+        if qualifier is not None:
+            raise InjectableLoadError(
+                f"Registration for qualifier '{target}' cannot have another qualifier"
+            )
+        klass, qualifier = None, target
+    elif isinstance(target, type):
+        klass = target
+    else:
+        raise InjectableLoadError(
+            f"Registrations must be for a class or a qualifier, not {target!r}"
+        )
+    unknown_options = options.keys() - _INJECTABLE_OPTIONS
+    if unknown_options:
+        raise InjectableLoadError(
+            f"Unknown registration options: {', '.join(sorted(unknown_options))}"
+        )
+    singleton = options.get("singleton", False)
+    validate_scope(options.get("scope"), singleton)
+    validate_init(options.get("init"), singleton)
+    options["groups"] = validate_groups(options.get("groups")) or ()
+    return Injectable(constructor, **options), klass, qualifier, propagate
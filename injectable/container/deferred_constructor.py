@@ -0,0 +1,37 @@
+from importlib import import_module
+from typing import Any, Callable, Optional
+
+
+class DeferredConstructor:
+    """
+    Constructor of an injectable registered from static metadata which imports the
+    module defining the injectable only when it's first called.
+
+    :param module_name: name of the module in which the injectable is defined.
+    :param qualname: qualified name of the injectable class or factory in the module.
+    :param is_coroutine_function: (optional) whether the injectable is an async
+            factory. Defaults to False.
+    """
+
+    def __init__(
+        self, module_name: str, qualname: str, is_coroutine_function: bool = False
+    ):
+        self.module_name = module_name
+        self.__qualname__ = qualname
+        self.is_coroutine_function = is_coroutine_function
+        self._target: Optional[Callable] = None
+
+    @property
+    def target(self) -> Callable:
+        if self._target is None:
+            target: Any = import_module(self.module_name)
+            for attribute in self.__qualname__.split("."):
+                target = getattr(target, attribute)
+            self._target = target
+        return self._target
+
+    def __call__(self, *args, **kwargs):
+        return self.target(*args, **kwargs)
+
+    def __repr__(self):
+        return f"DeferredConstructor({self.module_name}.{self.__qualname__})"
@@ -0,0 +1,201 @@
+import fnmatch
+import os
+import re
+from typing import Iterable, List, Optional, Pattern, Tuple
+
+from pycollect import PythonFileCollector
+
+#: Name of the files from which ignore rules are read when honouring gitignore files
+GITIGNORE_FILENAME = ".gitignore"
+
+_Rule = Tuple[Pattern, bool, bool]
+
+
+class FileFilter:
+    """
+    Filter of the files and directories walked when collecting Python files.
+
+    Patterns are globs matched against paths relative to the search path using ``/``
+    as separator, in which ``*`` and ``?`` don't match ``/`` and ``**`` matches any
+    number of nested directories. Patterns without any ``/`` are matched against file
+    and directory names only, wherever they are in the tree.
+
+    :param include: (optional) patterns of the files to collect. Defaults to None, in
+            which case every Python file is collected.
+    :param exclude: (optional) patterns of the files not to collect and of the
+            directories not to descend into. Defaults to None.
+    :param gitignore: (optional) when True, files and directories ignored by
+            ``.gitignore`` files found in the walked directories are also excluded.
+            Defaults to False.
+    """
+
+    def __init__(
+        self,
+        include: Iterable[str] = None,
+        exclude: Iterable[str] = None,
+        gitignore: bool = False,
+    ):
+        self.include = [_compile_glob(pattern) for pattern in include or []]
+        self.exclude = [_compile_glob(pattern) for pattern in exclude or []]
+        self.gitignore = gitignore
+
+    def collect(self, search_path: str) -> List[os.DirEntry]:
+        """
+        Collects the Python files under the search path which pass this filter.
+
+        Excluded directories are pruned from the walk: they're never listed and nothing
+        under them is stat'ed or opened.
+        """
+        files: List[os.DirEntry] = []
+        self._walk(search_path, "", [], files)
+        return files
+
+    def _walk(
+        self,
+        directory: str,
+        relative_directory: str,
+        rules: List[_Rule],
+        files: List[os.DirEntry],
+    ):
+        if self.gitignore:
+            rules = rules + _read_gitignore(directory, relative_directory)
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                relative_path = f"{relative_directory}{entry.name}"
+                if entry.is_dir():
+                    if self._should_prune(entry.name, relative_path, rules):
+                        continue
+                    self._walk(entry.path, f"{relative_path}/", rules, files)
+                elif entry.is_file() and self._should_collect(
+                    entry.name, relative_path, rules
+                ):
+                    files.append(entry)
+
+    def _should_prune(self, name: str, relative_path: str, rules: List[_Rule]) -> bool:
+        if any(
+            fnmatch.fnmatchcase(name, pattern)
+            for pattern in PythonFileCollector.DEFAULT_DIR_EXCLUSION_PATTERNS
+        ):
+            return True
+        if _matches_any(self.exclude, name, relative_path, is_dir=True):
+            return True
+        return _is_ignored(rules, name, relative_path, is_dir=True)
+
+    def _should_collect(
+        self, name: str, relative_path: str, rules: List[_Rule]
+    ) -> bool:
+        if not name.endswith(".py") or name.startswith((".", "~")):
+            return False
+        if self.include and not _matches_any(self.include, name, relative_path):
+            return False
+        if _matches_any(self.exclude, name, relative_path):
+            return False
+        return not _is_ignored(rules, name, relative_path, is_dir=False)
+
+
+def _matches_any(
+    patterns: List[Tuple[Pattern, bool]],
+    name: str,
+    relative_path: str,
+    is_dir: bool = False,
+) -> bool:
+    for pattern, anchored in patterns:
+        if not anchored:
+            if pattern.match(name):
+                return True
+        elif pattern.match(relative_path) or (
+            is_dir and pattern.match(f"{relative_path}/")
+        ):
+            return True
+    return False
+
+
+def _is_ignored(
+    rules: List[_Rule], name: str, relative_path: str, is_dir: bool
+) -> bool:
+    ignored = False
+    for pattern, negated, dir_only in rules:
+        if dir_only and not is_dir:
+            continue
+        if pattern.match(relative_path) or pattern.match(name):
+            ignored = not negated
+    return ignored
+
+
+def _read_gitignore(directory: str, relative_directory: str) -> List[_Rule]:
+    try:
+        with open(os.path.join(directory, GITIGNORE_FILENAME), encoding="utf-8") as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return []
+    rules = []
+    for line in lines:
+        line = line.rstrip()
+        if not line or line.startswith("#"):
+            continue
+        negated = line.startswith("!")
+        line = line[1:] if negated else line
+        dir_only = line.endswith("/")
+        line = line.rstrip("/")
+        if "/" in line:
+            # anchored to the directory of the gitignore file
+            regex, _ = _compile_glob(f"{relative_directory}{line.lstrip('/')}")
+        else:
+            regex, _ = _compile_glob(line)
+        rules.append((regex, negated, dir_only))
+    return rules
+
+
+def _compile_glob(pattern: str) -> Tuple[Pattern, bool]:
+    """
+    Compiles the glob pattern into a regex, returning it along with whether the pattern
+    is matched against relative paths (anchored) or against names.
+    """
+    anchored = "/" in pattern
+    pattern = pattern.lstrip("/")
+    regex = ""
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        if pattern.startswith("**/", index):
+            regex += "(?:.*/)?"
+            index += 3
+            continue
+        if pattern.startswith("**", index):
+            regex += ".*"
+            index += 2
+            continue
+        if char == "*":
+            regex += "[^/]*"
+        elif char == "?":
+            regex += "[^/]"
+        elif char == "[":
+            end = pattern.find("]", index + 1)
+            if end == -1:
+                regex += re.escape(char)
+            else:
+                # as fnmatch does, a leading "!" negates the class
+                content = pattern[index + 1 : end].replace("\\", "\\\\")
+                if content.startswith("!"):
+                    content = f"^{content[1:]}"
+                elif content.startswith(("^", "[")):
+                    content = f"\\{content}"
+                regex += f"[{content}]"
+                index = end
+        else:
+            regex += re.escape(char)
+        index += 1
+    return re.compile(f"{regex}\\Z"), anchored
+
+
+def file_filter_for(
+    include: Optional[Iterable[str]],
+    exclude: Optional[Iterable[str]],
+    gitignore: bool,
+) -> Optional[FileFilter]:
+    """
+    Returns a :class:`FileFilter` for the given options, or None when none is set.
+    """
+    if not include and not exclude and not gitignore:
+        return None
+    return FileFilter(include, exclude, gitignore)
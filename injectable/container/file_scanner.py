@@ -0,0 +1,54 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, List, Optional, TypeVar, Union
+
+T = TypeVar("T")
+
+#: Size of the chunks in which files are read while looking for a marker
+CHUNK_SIZE = 64 * 1024
+
+
+def read_if_contains(
+    filepath: Union[os.DirEntry, str], marker: bytes, chunk_size: int = CHUNK_SIZE
+) -> Optional[bytes]:
+    """
+    Reads the raw bytes of the file in chunks looking for the marker. Returns None
+    as soon as it's known the marker isn't in the file, without decoding nor reading
+    the file as a whole. Otherwise, when the marker is found, the rest of the file is
+    read and its whole content is returned.
+
+    Chunks overlap by ``len(marker) - 1`` bytes so that markers split across chunk
+    boundaries are still found.
+    """
+    overlap = len(marker) - 1
+    chunks = []
+    tail = b""
+    with open(filepath, "rb") as file:
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                return None
+            chunks.append(chunk)
+            if marker in tail + chunk:
+                break
+            tail = chunk[-overlap:] if overlap else b""
+        chunks.append(file.read())
+    return b"".join(chunks)
+
+
+def scan_files(
+    files: Iterable[T], predicate: Callable[[T], bool], workers: int = 1
+) -> List[T]:
+    """
+    Returns the files for which the predicate holds, preserving their order.
+
+    When ``workers`` is greater than 1 the predicate is evaluated concurrently over a
+    thread pool with that many workers, which pays off when per-file I/O latency
+    dominates, e.g. on network or container overlay filesystems.
+    """
+    files = list(files)
+    if workers <= 1 or len(files) <= 1:
+        return [file for file in files if predicate(file)]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(predicate, files))
+    return [file for file, matched in zip(files, results) if matched]
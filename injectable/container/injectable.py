@@ -1,13 +1,68 @@
-import uuid
+import asyncio
+import contextvars
+import inspect
+import itertools
+import sys
+import threading
+import weakref
 
-from dataclasses import dataclass, field
-from typing import Optional
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import FrozenInstanceError
+from typing import Any, Callable, Dict, FrozenSet, Hashable, Iterable, Iterator
+from typing import Optional, Tuple
 
-from cached_property import cached_property
 from lazy_object_proxy import Proxy
 
+from injectable.constants import Init, Scope
+from injectable.container.injection_scope import active_injection_scope
+from injectable.container.singleton_lock import (
+    async_construction,
+    check_async_construction,
+    singleton_lock,
+)
+
+_MISSING = object()
+_unique_ids = itertools.count()
+_background_lock = threading.Lock()
+# shared by injectables without groups, each empty frozenset taking as much memory as
+# a small one
+_NO_GROUPS = frozenset()
+# task on behalf of which dependencies are resolved, when not the current task
+_resolving_for: ContextVar[Optional[asyncio.Task]] = ContextVar(
+    "injectable_resolving_for", default=None
+)
+
+#: Attributes compared for equality and shown by the representation, in order
+_FIELDS = ("unique_id", "primary", "group", "singleton", "scope", "init", "groups")
+
+
+class _InstanceState:
+    # Instances constructed by singletons and scoped injectables and what's needed to
+    # construct them are kept apart so that transient injectables, the most common,
+    # don't carry them.
+    __slots__ = (
+        "lock",
+        "instance",
+        "construction",
+        "background_thread",
+        "background_error",
+        "scoped_instances",
+        "task_instances",
+        "task_constructions",
+    )
+
+    def __init__(self, lock: Optional[threading.Lock] = None, scoped_instances=None):
+        self.lock = lock
+        self.instance = _MISSING
+        self.construction: Optional[asyncio.Future] = None
+        self.background_thread: Optional[threading.Thread] = None
+        self.background_error: Optional[BaseException] = None
+        self.scoped_instances = scoped_instances
+        self.task_instances: Optional[weakref.WeakKeyDictionary] = None
+        self.task_constructions: Optional[Dict[asyncio.Task, asyncio.Future]] = None
+
 
-@dataclass(frozen=True)
 class Injectable:
     """
     Injectable is the low-level container class in which information regarding an
@@ -16,34 +71,416 @@ class Injectable:
     This class is not meant for direct usage. It should be used in conjunction with
     the :py:mod:`injectable.testing` module utilities for testing purposes only.
 
+    Injectables are immutable and compare equal when all their attributes but the
+    constructor are equal.
+
     :param constructor: callable to be used as constructor when injecting.
     :param unique_id: (optional) unique identifier for the injectable which prevents
-            duplicates of the same injectable to be registered. Defaults to a UUID
-            generated at initialization time.
+            duplicates of the same injectable to be registered. Defaults to a
+            sequential identifier generated at initialization time.
     :param primary: (optional) marks the injectable as primary for resolution in
             ambiguous cases. Defaults to False.
     :param group: (optional) group to be assigned to the injectable. Defaults to None.
     :param singleton: (optional) when True the injectable will be a singleton, i.e. only
             one instance of it will be created and shared globally. Defaults to False.
+    :param scope: (optional) :class:`Scope <injectable.constants.Scope>` in which a
+            single instance is reused, i.e. one instance per thread, per asyncio
+            task or per :meth:`injection_scope <injectable.injection_scope>`. Cannot
+            be used along with ``singleton``. Defaults to None.
+    :param init: (optional) :class:`Init <injectable.constants.Init>` moment in which
+            a singleton is constructed other than on its first injection, i.e.
+            ``"background"`` to construct it in a background thread once the
+            injection container is loaded. Defaults to None.
+    :param groups: (optional) additional groups to be assigned to the injectable, which
+            belongs to each of them as well as to ``group``. Defaults to no groups.
+
+    .. versionchanged:: 4.1.0
+       Singletons are constructed exactly once even when injected concurrently from
+       multiple threads, and cyclic dependencies between singletons raise a
+       :class:`CyclicDependencyError <injectable.errors.CyclicDependencyError>`.
+
+    .. versionchanged:: 4.1.0
+       Added the ``scope``, ``init`` and ``groups`` parameters.
+
+    .. versionchanged:: 4.1.0
+       Injectables are slotted objects with a precomputed hash and default unique ids
+       are sequential instead of UUIDs. They are no longer dataclasses. Copies and
+       unpickled injectables don't share the instances constructed by the original.
     """
 
-    constructor: callable = field(compare=False)
-    unique_id: str = field(default_factory=lambda: uuid.uuid1().hex)
-    primary: bool = False
-    group: Optional[str] = None
-    singleton: bool = False
+    constructor: Callable
+    unique_id: str
+    primary: bool
+    group: Optional[str]
+    singleton: bool
+    scope: Optional[Scope]
+    init: Optional[Init]
+    groups: FrozenSet[str]
+
+    __slots__ = (
+        "constructor",
+        *_FIELDS,
+        "_hash",
+        "_is_async",
+        "_factory",
+        "_state",
+    )
 
-    @cached_property
+    def __init__(
+        self,
+        constructor: Callable,
+        unique_id: str = None,
+        primary: bool = False,
+        group: Optional[str] = None,
+        singleton: bool = False,
+        scope: Optional[Scope] = None,
+        init: Optional[Init] = None,
+        groups: Iterable[str] = (),
+    ):
+        if unique_id is None:
+            unique_id = f"injectable-{next(_unique_ids)}"
+        if isinstance(groups, str):
+            raise ValueError("Groups must be given as a collection of group names")
+        groups = {sys.intern(group) for group in groups}
+        if group is not None:
+            groups.add(group)
+        groups = frozenset(groups) if groups else _NO_GROUPS
+        if init is not None:
+            if not singleton:
+                raise ValueError("Only singleton injectables can have an init")
+            init = Init(init)
+        # only singletons are constructed under a lock
+        state = _InstanceState(threading.Lock()) if singleton else None
+        if scope is not None:
+            if singleton:
+                raise ValueError("A singleton injectable cannot have a scope")
+            scope = Scope(scope)
+            if scope is Scope.THREAD:
+                state = _InstanceState(scoped_instances=threading.local())
+            elif scope is Scope.TASK:
+                # instances are held per task, released along with it, and per
+                # context outside of tasks
+                state = _InstanceState(
+                    scoped_instances=ContextVar(f"injectable:{unique_id}")
+                )
+                state.task_instances = weakref.WeakKeyDictionary()
+                state.task_constructions = {}
+        _set = object.__setattr__
+        _set(self, "constructor", constructor)
+        _set(self, "unique_id", unique_id)
+        _set(self, "primary", primary)
+        _set(self, "group", group)
+        _set(self, "singleton", singleton)
+        _set(self, "scope", scope)
+        _set(self, "init", init)
+        _set(self, "groups", groups)
+        # equal injectables share their unique id
+        _set(self, "_hash", hash(unique_id))
+        _set(self, "_is_async", None)
+        _set(self, "_factory", None)
+        _set(self, "_state", state)
+
+    def __setattr__(self, name: str, value: Any):
+        raise FrozenInstanceError(f"cannot assign to field '{name}'")
+
+    def __delattr__(self, name: str):
+        raise FrozenInstanceError(f"cannot delete field '{name}'")
+
+    def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._hash == other._hash and all(
+            getattr(self, name) == getattr(other, name) for name in _FIELDS
+        )
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __reduce__(self) -> Tuple[type, Tuple[Any, ...]]:
+        # slots can't be restored through the frozen __setattr__, so copies and
+        # unpickled injectables are initialized anew, without constructed instances
+        return self.__class__, (
+            self.constructor,
+            *(getattr(self, name) for name in _FIELDS),
+        )
+
+    def __repr__(self) -> str:
+        attributes = ", ".join(
+            f"{name}={getattr(self, name)!r}" for name in ("constructor", *_FIELDS)
+        )
+        return f"{self.__class__.__qualname__}({attributes})"
+
+    @property
+    def is_async(self) -> bool:
+        """
+        Whether the constructor is an async factory, in which case instances can only
+        be injected through :meth:`ainject <injectable.ainject>`.
+        """
+        is_async = self._is_async
+        if is_async is None:
+            is_async = inspect.iscoroutinefunction(self.constructor) or (
+                getattr(self.constructor, "is_coroutine_function", False) is True
+            )
+            object.__setattr__(self, "_is_async", is_async)
+        return is_async
+
+    @property
+    def singleton_constructed(self) -> bool:
+        """
+        Whether the singleton instance of this injectable was already constructed.
+
+        .. versionadded:: 4.1.0
+        """
+        state = self._state
+        return state is not None and state.instance is not _MISSING
+
+    @property
     def singleton_instance(self):
-        return self.constructor()
+        # lock-free once constructed, the instance is only published when complete
+        state = self._state
+        instance = state.instance
+        if instance is not _MISSING:
+            return instance
+        if self.is_async:
+            self._raise_async()
+        with singleton_lock(self, state.lock):
+            if state.instance is _MISSING:
+                # a failed background construction is raised once, then retried
+                error = state.background_error
+                if error is not None:
+                    state.background_error = None
+                    raise error
+                state.instance = self.constructor()
+        return state.instance
+
+    def start_background_construction(self) -> bool:
+        """
+        Starts constructing the singleton instance in a background daemon thread,
+        returning whether a construction was started. Nothing is started when the
+        instance was already constructed, when a background construction was already
+        started or when the constructor is an async factory.
 
-    @cached_property
+        Injections made before the construction finishes block until it does. An
+        error raised by the construction is raised by the first injection after it
+        and later injections attempt to construct the instance again.
+
+        .. versionadded:: 4.1.0
+        """
+        if not self.singleton or self.is_async or self.singleton_constructed:
+            return False
+        thread = threading.Thread(
+            target=self._construct_in_background,
+            name=f"injectable-init-{self.unique_id}",
+            daemon=True,
+        )
+        state = self._state
+        with _background_lock:
+            if state.background_thread is not None:
+                return False
+            state.background_thread = thread
+        thread.start()
+        return True
+
+    def _construct_in_background(self):
+        state = self._state
+        with singleton_lock(self, state.lock):
+            if state.instance is not _MISSING:
+                return
+            try:
+                state.instance = self.constructor()
+            except BaseException as error:
+                state.background_error = error
+
+    @property
     def factory(self):
-        if self.singleton:
-            return lambda: self.singleton_instance
-        return self.constructor
+        factory = self._factory
+        if factory is None:
+            if self.singleton:
+                factory = self._get_singleton_instance
+            elif self.scope is not None:
+                factory = self._scoped_instance
+            elif self.is_async:
+                factory = self._raise_async
+            else:
+                factory = self.constructor
+            object.__setattr__(self, "_factory", factory)
+        return factory
+
+    def _get_singleton_instance(self):
+        return self.singleton_instance
+
+    def _scoped_instance(self):
+        instance = self._get_scoped()
+        if instance is _MISSING:
+            if self.is_async:
+                self._raise_async()
+            scope = None
+            if self.scope is Scope.INJECTION_SCOPE:
+                scope = active_injection_scope()
+            if scope is None:
+                # thread and task scoped instances aren't shared across threads
+                return self._set_scoped(self.constructor())
+            with scope.lock(self):
+                instance = self._get_scoped()
+                if instance is _MISSING:
+                    instance = self._set_scoped(self.constructor())
+        return instance
+
+    async def _aget_scoped_instance(self):
+        instance = self._get_scoped()
+        if instance is not _MISSING:
+            return instance
+        if not self.is_async:
+            return self._scoped_instance()
+        key = self
+        if self.scope is Scope.INJECTION_SCOPE:
+            scope = active_injection_scope()
+            if scope is None:
+                return await self.constructor()
+            constructions = scope.constructions
+        elif self.scope is Scope.THREAD:
+            storage = self._state.scoped_instances
+            constructions = getattr(storage, "constructions", None)
+            if constructions is None:
+                constructions = storage.constructions = {}
+        else:
+            # tasks resolving dependencies on behalf of the same task share them
+            constructions = self._state.task_constructions
+            key = _current_task()
+        check_async_construction(self)
+        construction = constructions.get(key)
+        if construction is None:
+            construction = asyncio.ensure_future(
+                self._aconstruct_scoped(constructions, key)
+            )
+            constructions[key] = construction
+        return await asyncio.shield(construction)
+
+    async def _aconstruct_scoped(self, constructions: dict, key: Hashable):
+        if self.scope is Scope.TASK:
+            # constructed on behalf of the requesting task
+            _resolving_for.set(key)
+        try:
+            with async_construction(self):
+                instance = await self.constructor()
+            return self._set_scoped(instance)
+        finally:
+            del constructions[key]
+
+    def _get_scoped(self) -> Any:
+        if self.scope is Scope.INJECTION_SCOPE:
+            scope = active_injection_scope()
+            return _MISSING if scope is None else scope.get(self, _MISSING)
+        state = self._state
+        if self.scope is Scope.THREAD:
+            return getattr(state.scoped_instances, "instance", _MISSING)
+        task = _current_task()
+        if task is None:
+            return state.scoped_instances.get(_MISSING)
+        return state.task_instances.get(task, _MISSING)
+
+    def _set_scoped(self, instance: Any) -> Any:
+        if self.scope is Scope.INJECTION_SCOPE:
+            scope = active_injection_scope()
+            return instance if scope is None else scope.set(self, instance)
+        state = self._state
+        if self.scope is Scope.THREAD:
+            state.scoped_instances.instance = instance
+            return instance
+        task = _current_task()
+        if task is None:
+            state.scoped_instances.set(instance)
+        else:
+            state.task_instances[task] = instance
+        return instance
 
     def get_instance(self, *, lazy: bool = False):
         if lazy:
             return Proxy(self.factory)
         return self.factory()
+
+    async def aget_instance(self, *, in_executor: bool = False):
+        """
+        Returns an instance awaiting the constructor when it's an async factory.
+
+        Concurrent requests for a singleton, or for a scoped injectable within the
+        same scope, not constructed yet share a single construction which is not
+        cancelled when any of the requests is. Requests made while constructing the
+        instance itself, directly or through other async injectables, raise a
+        :class:`CyclicDependencyError <injectable.errors.CyclicDependencyError>`
+        instead of awaiting forever.
+
+        :param in_executor: (optional) when True a regular constructor is run in the
+                event loop's default executor instead of blocking the loop, unless
+                it's a singleton already constructed or a scoped injectable, whose
+                instances are bound to the calling thread or task. Defaults to False.
+
+        .. versionadded:: 4.1.0
+        """
+        if self.scope is not None:
+            # scoped instances are bound to the calling thread and context
+            return await self._aget_scoped_instance()
+        if not self.is_async:
+            if not in_executor or self.singleton_constructed:
+                return self.get_instance()
+            loop = asyncio.get_running_loop()
+            # the constructor's injections must see the caller's context, e.g. its
+            # injection scope
+            return await loop.run_in_executor(
+                None, contextvars.copy_context().run, self.get_instance
+            )
+        if not self.singleton:
+            return await self.constructor()
+        state = self._state
+        instance = state.instance
+        if instance is not _MISSING:
+            return instance
+        check_async_construction(self)
+        construction = state.construction
+        if construction is None:
+            construction = asyncio.ensure_future(self._aconstruct_singleton())
+            state.construction = construction
+        return await asyncio.shield(construction)
+
+    async def _aconstruct_singleton(self):
+        state = self._state
+        try:
+            with async_construction(self):
+                instance = await self.constructor()
+            state.instance = instance
+        finally:
+            # failed constructions are retried by later requests
+            state.construction = None
+        return instance
+
+    def _raise_async(self):
+        name = getattr(self.constructor, "__qualname__", self.unique_id)
+        raise TypeError(
+            f"Injectable '{name}' has an async factory and must be injected with"
+            " 'ainject' or 'ainject_multiple'"
+        )
+
+
+def _current_task() -> Optional[asyncio.Task]:
+    task = _resolving_for.get()
+    if task is not None:
+        return task
+    try:
+        return asyncio.current_task()
+    except RuntimeError:
+        return None
+
+
+@contextmanager
+def resolving_for_current_task() -> Iterator[None]:
+    """
+    Makes the tasks and executor threads started within the block, e.g. to resolve
+    dependencies concurrently, resolve task scoped dependencies as the current task.
+    """
+    token = _resolving_for.set(_current_task())
+    try:
+        yield
+    finally:
+        _resolving_for.reset(token)
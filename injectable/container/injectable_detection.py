@@ -0,0 +1,106 @@
+import ast
+import threading
+from typing import Set
+
+#: String which every source registering injectables contains
+DETECTION_MARKER = "injectable"
+#: Names of the decorators which register injectables
+DECORATOR_NAMES = frozenset({"injectable", "injectable_factory"})
+#: Strings searched for by the substring scanner
+MARKERS = ("@injectable", "injectable(", "@injectable_factory", "injectable_factory(")
+
+
+def contains_injectable_markers(source: str) -> bool:
+    """
+    Substring scanner which looks for any of the :const:`MARKERS` in the source.
+    """
+    return any(marker in source for marker in MARKERS)
+
+
+def contains_injectables(source: str) -> bool:
+    """
+    Parses the source and looks for actual usages of the ``injectable`` and
+    ``injectable_factory`` decorators, either applied as decorators or called directly,
+    including aliases imported from the ``injectable`` package.
+
+    Mentions of these names in comments, strings or as part of other identifiers are
+    ignored. Sources which can't be parsed fall back to the substring scanner so that
+    any errors surface when they are executed.
+    """
+    if DETECTION_MARKER not in source:
+        return False
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        return contains_injectable_markers(source)
+    names = _collect_decorator_aliases(tree)
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call):
+            if _is_decorator_reference(node.func, names):
+                return True
+        elif isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+            if any(
+                _is_decorator_reference(decorator, names)
+                for decorator in node.decorator_list
+            ):
+                return True
+    return False
+
+
+def _collect_decorator_aliases(tree: ast.AST) -> Set[str]:
+    names = set(DECORATOR_NAMES)
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.ImportFrom):
+            continue
+        if not _is_injectable_module(node.module):
+            continue
+        for alias in node.names:
+            if alias.name in DECORATOR_NAMES:
+                names.add(alias.asname or alias.name)
+    return names
+
+
+def _is_injectable_module(module_name: str) -> bool:
+    return module_name is not None and (
+        module_name == "injectable" or module_name.startswith("injectable.")
+    )
+
+
+def _is_decorator_reference(node: ast.expr, names: Set[str]) -> bool:
+    if isinstance(node, ast.Name):
+        return node.id in names
+    if isinstance(node, ast.Attribute):
+        # e.g. ``injectable.injectable`` or ``di.injectable_factory``
+        return node.attr in DECORATOR_NAMES
+    return False
+
+
+class DetectionStats:
+    """
+    Counters of how the files scanned for injectables were classified, compared with
+    what the substring scanner would have done.
+
+    * ``files_scanned``: files which were read and scanned;
+    * ``files_matched``: files found to register injectables;
+    * ``files_skipped``: files matched by the substring scanner which don't actually
+      register injectables and therefore weren't executed;
+    * ``files_added``: files which register injectables through aliases and would
+      have been missed by the substring scanner.
+    """
+
+    def __init__(self):
+        self.files_scanned = 0
+        self.files_matched = 0
+        self.files_skipped = 0
+        self.files_added = 0
+        self._lock = threading.Lock()
+
+    def count(self, matched: bool, matched_by_markers: bool):
+        with self._lock:
+            self.files_scanned += 1
+            if matched:
+                self.files_matched += 1
+            if matched_by_markers and not matched:
+                self.files_skipped += 1
+            elif matched and not matched_by_markers:
+                self.files_added += 1
@@ -1,15 +1,40 @@
+import logging
 import os
+import pkgutil
+import sys
+import time
 import warnings
+from contextlib import contextmanager
+from functools import lru_cache
+from importlib import import_module, reload
+from importlib.metadata import EntryPoint, entry_points
+from importlib.machinery import ModuleSpec
+from importlib.util import find_spec
 from runpy import run_path, run_module
-from typing import Dict, Optional, Callable
-from typing import Set
+from typing import Dict, Iterable, Iterator, List, Optional, Callable, Tuple
+from typing import Set, Union
 
 from pycollect import PythonFileCollector, module_finder
 
+from injectable.container.deferred_constructor import DeferredConstructor
 from injectable.container.injectable import Injectable
+from injectable.container.file_filter import FileFilter
+from injectable.container.file_scanner import read_if_contains, scan_files
+from injectable.container.injectable_detection import (
+    DETECTION_MARKER,
+    DetectionStats,
+    contains_injectables,
+    contains_injectable_markers,
+)
+from injectable.container.load_report import LoadReport
+from injectable.container.manifest import Manifest
 from injectable.container.namespace import Namespace
+from injectable.container.scan_cache import ScanCache
+from injectable.container.static_registrations import extract_registrations
 from injectable.common_utils import get_caller_filepath
-from injectable.constants import DEFAULT_NAMESPACE
+from injectable.constants import DEFAULT_NAMESPACE, Init, LoadingMode, Scope
+from injectable.errors.frozen_container_error import FrozenContainerError
+from injectable.errors.injectable_load_error import InjectableLoadError
 
 
 class InjectionContainer:
@@ -34,7 +59,14 @@ class InjectionContainer:
 
     LOADING_DEFAULT_NAMESPACE: Optional[str] = None
     LOADING_FILEPATH: Optional[str] = None
+    #: whether the file being loaded is executed by runpy as a throwaway copy
+    LOADING_COPY: bool = False
     LOADED_FILEPATHS: Set[str] = set()
+    DETECTION_STATS: DetectionStats = DetectionStats()
+    REGISTRATION_LISTENERS: List[Callable[..., None]] = []
+    DECORATIONS: Dict[str, Dict[str, Callable[[], None]]] = {}
+    LOAD_REPORT: Optional[LoadReport] = None
+    FROZEN: bool = False
     NAMESPACES: Dict[str, Namespace] = {}
 
     def __new__(cls):
@@ -82,16 +114,18 @@ class InjectionContainer:
             DeprecationWarning,
             2,
         )
-        cls.LOADING_DEFAULT_NAMESPACE = default_namespace
-        if default_namespace not in cls.NAMESPACES:
-            cls.NAMESPACES[default_namespace] = Namespace()
+        cls._ensure_not_frozen()
         if search_path is None:
             search_path = os.path.dirname(get_caller_filepath())
         elif not os.path.isabs(search_path):
             caller_path = os.path.dirname(get_caller_filepath())
             search_path = os.path.normpath(os.path.join(caller_path, search_path))
-        cls._link_dependencies(search_path)
-        cls.LOADING_DEFAULT_NAMESPACE = None
+        cls.LOADING_DEFAULT_NAMESPACE = default_namespace
+        try:
+            cls._get_namespace_entry(default_namespace)
+            cls._link_dependencies(search_path)
+        finally:
+            cls.LOADING_DEFAULT_NAMESPACE = None
 
     @classmethod
     def _register_injectable(
@@ -103,13 +137,19 @@ class InjectionContainer:
         namespace: str = None,
         group: str = None,
         singleton: bool = False,
+        scope: Optional[Scope] = None,
+        init: Optional[Init] = None,
+        groups: Iterable[str] = None,
     ):
         unique_id = f"{klass.__qualname__}@{filepath}"
-        injectable = Injectable(klass, unique_id, primary, group, singleton)
-        namespace_entry = cls._get_namespace_entry(
-            namespace or cls.LOADING_DEFAULT_NAMESPACE
+        injectable = Injectable(
+            klass, unique_id, primary, group, singleton, scope, init, groups or ()
         )
+        namespace = namespace or cls.LOADING_DEFAULT_NAMESPACE
+        namespace_entry = cls._get_namespace_entry(namespace)
         namespace_entry.register_injectable(injectable, klass, qualifier)
+        for listener in cls.REGISTRATION_LISTENERS:
+            listener(injectable, filepath, namespace, klass, qualifier)
 
     @classmethod
     def _register_factory(
@@ -122,78 +162,485 @@ class InjectionContainer:
         namespace: str = None,
         group: str = None,
         singleton: bool = False,
+        scope: Optional[Scope] = None,
+        init: Optional[Init] = None,
+        groups: Iterable[str] = None,
     ):
         unique_id = f"{factory.__qualname__}@{filepath}"
-        injectable = Injectable(factory, unique_id, primary, group, singleton)
-        namespace_entry = cls._get_namespace_entry(
-            namespace or cls.LOADING_DEFAULT_NAMESPACE
+        injectable = Injectable(
+            factory, unique_id, primary, group, singleton, scope, init, groups or ()
         )
+        namespace = namespace or cls.LOADING_DEFAULT_NAMESPACE
+        namespace_entry = cls._get_namespace_entry(namespace)
         namespace_entry.register_injectable(injectable, dependency, qualifier)
+        for listener in cls.REGISTRATION_LISTENERS:
+            listener(injectable, filepath, namespace, dependency, qualifier)
+
+    @classmethod
+    def _record_decoration(
+        cls, filepath: str, qualname: str, registration: Callable[[], None]
+    ):
+        # Registrations are recorded for every decorated class or function so that
+        # modules already executed by regular imports can have their injectables
+        # registered without being executed again. Copies of modules executed by
+        # runpy aren't recorded as their classes aren't the ones imported, and a
+        # module executed again replaces the registrations recorded for it.
+        if cls.LOADING_COPY and filepath == cls.LOADING_FILEPATH:
+            return
+        cls.DECORATIONS.setdefault(filepath, {})[qualname] = registration
+
+    @classmethod
+    @contextmanager
+    def _reporting(cls) -> Iterator[LoadReport]:
+        """
+        Context in which loads are recorded to the yielded :class:`LoadReport`.
+        """
+        report = LoadReport()
+        previous_report = cls.LOAD_REPORT
+        registrations_before = cls._count_registrations()
+        cls.LOAD_REPORT = report
+        try:
+            yield report
+        finally:
+            cls.LOAD_REPORT = previous_report
+            for namespace, count in cls._count_registrations().items():
+                registered = count - registrations_before.get(namespace, 0)
+                if registered:
+                    report.registrations[namespace] = registered
+
+    @classmethod
+    def _count_registrations(cls) -> Dict[str, int]:
+        return {
+            name: namespace.registration_count
+            for name, namespace in cls.NAMESPACES.items()
+        }
+
+    @classmethod
+    def _ensure_not_frozen(cls):
+        # loading into a frozen container would fail midway through executing modules
+        if cls.FROZEN:
+            raise FrozenContainerError()
 
     @classmethod
     def _get_namespace_entry(cls, namespace: str) -> Namespace:
         if namespace not in cls.NAMESPACES:
+            if cls.FROZEN:
+                raise FrozenContainerError(namespace)
             cls.NAMESPACES[namespace] = Namespace()
         return cls.NAMESPACES[namespace]
 
+    @classmethod
+    def freeze(cls, strict: bool = False):
+        """
+        Freezes the injection container once all injectables are loaded so that
+        injections are resolved through immutable lookup tables, computed up front
+        along with the primary injectable of each class, qualifier and group, instead
+        of filtering the registries on each injection.
+
+        Registering or clearing injectables once frozen raises a
+        :class:`FrozenContainerError <injectable.errors.FrozenContainerError>`.
+
+        Classes, qualifiers and groups matched by multiple injectables none or several
+        of which are primary can only be injected with
+        :meth:`inject_multiple <injectable.inject_multiple>`. They're logged as a
+        warning, or raised as an
+        :class:`InjectableLoadError <injectable.errors.InjectableLoadError>` in strict
+        mode, at freeze time instead of on the first injection.
+
+        :param strict: (optional) when True, ambiguous classes, qualifiers or groups
+                raise an error and the container is left unfrozen. Defaults to False.
+
+        .. versionadded:: 4.1.0
+        """
+        frozen_registries = {
+            name: namespace.build_frozen_registries()
+            for name, namespace in cls.NAMESPACES.items()
+        }
+        ambiguities = [
+            f"{registry_type} '{key}'"
+            + (f" in group '{group}'" if group is not None else "")
+            + f" in namespace '{name}'"
+            for name, registries in frozen_registries.items()
+            for registry_type, key, group in Namespace.ambiguous_keys(*registries)
+        ]
+        if ambiguities:
+            message = "Ambiguous injectables without a single primary for " + ", ".join(
+                ambiguities
+            )
+            if strict:
+                raise InjectableLoadError(message)
+            logging.warning(message)
+        for name, registries in frozen_registries.items():
+            cls.NAMESPACES[name].freeze(*registries)
+        cls.FROZEN = True
+
     @classmethod
     def _link_dependencies(cls, search_path: str):
         files = cls._collect_python_files(search_path)
-        for file in files:
-            if not cls._contains_injectables(file, encoding="utf-8"):
-                continue
-            if file.path in cls.LOADED_FILEPATHS:
-                continue
-            cls.LOADING_FILEPATH = file.path
-            try:
-                run_module(module_finder.find_module_name(file.path))
-            except AttributeError:
-                # This is needed for some corner cases involving pytest
-                # See more at https://github.com/pytest-dev/pytest/issues/9007
-                run_path(file.path)
-            cls.LOADED_FILEPATHS.add(file.path)
-            cls.LOADING_FILEPATH = None
+        cls._load_files(files, encoding="utf-8")
 
     @classmethod
     def load_dependencies_from(
-        cls, absolute_search_path: str, default_namespace: str, encoding: str = "utf-8"
+        cls,
+        absolute_search_path: str,
+        default_namespace: str,
+        encoding: str = "utf-8",
+        scan_cache: Optional[ScanCache] = None,
+        scan_workers: int = 1,
+        mode: LoadingMode = LoadingMode.RUN,
+        file_filter: Optional[FileFilter] = None,
     ):
-        files = cls._collect_python_files(absolute_search_path)
+        cls._ensure_not_frozen()
+        files = cls._collect_python_files(absolute_search_path, file_filter)
         cls.LOADING_DEFAULT_NAMESPACE = default_namespace
-        if default_namespace not in cls.NAMESPACES:
-            cls.NAMESPACES[default_namespace] = Namespace()
+        try:
+            cls._get_namespace_entry(default_namespace)
+            cls._load_files(files, encoding, scan_cache, scan_workers, mode)
+        finally:
+            cls.LOADING_DEFAULT_NAMESPACE = None
+        if scan_cache is not None:
+            scan_cache.save()
+
+    @classmethod
+    def _load_files(
+        cls,
+        files: Iterable[os.DirEntry],
+        encoding: str,
+        scan_cache: Optional[ScanCache] = None,
+        scan_workers: int = 1,
+        mode: LoadingMode = LoadingMode.RUN,
+    ):
+        # scanning may run concurrently but modules are executed sequentially
+        files = list(files)
+        report = cls.LOAD_REPORT
+        if report is not None:
+            report.files_walked += len(files)
+        files = [file for file in files if file.path not in cls.LOADED_FILEPATHS]
+        files = scan_files(
+            files,
+            lambda file: cls._scan_file(file, encoding, scan_cache),
+            scan_workers,
+        )
+        if report is not None:
+            report.files_matched += len(files)
         for file in files:
-            if not cls._contains_injectables(file, encoding):
-                continue
-            if file.path in cls.LOADED_FILEPATHS:
-                continue
-            cls.LOADING_FILEPATH = file.path
+            cls._execute_file(file.path, mode=mode, encoding=encoding)
+
+    @classmethod
+    def load_manifest(
+        cls,
+        manifest_path: str,
+        default_namespace: str,
+        encoding: str = "utf-8",
+        on_stale: str = "error",
+        mode: LoadingMode = LoadingMode.RUN,
+    ):
+        if on_stale not in ("error", "scan"):
+            raise ValueError(f"Invalid value for 'on_stale': '{on_stale}'")
+        cls._ensure_not_frozen()
+        manifest = Manifest.read(manifest_path)
+        stale_paths = [module.path for module in manifest.stale_modules()]
+        stale_paths += [
+            path
+            for path in manifest.new_files()
+            if cls._contains_injectables(manifest.resolve(path), encoding)
+        ]
+        if stale_paths and on_stale == "scan":
+            cls.load_dependencies_from(
+                manifest.resolve(manifest.root), default_namespace, encoding, mode=mode
+            )
+            return
+        if stale_paths:
+            raise InjectableLoadError(
+                f"Manifest '{manifest_path}' is stale, {len(stale_paths)} module(s)"
+                " changed or were added since it was built: " + ", ".join(stale_paths)
+            )
+        cls.LOADING_DEFAULT_NAMESPACE = default_namespace
+        try:
+            cls._get_namespace_entry(default_namespace)
+            for module in manifest.modules:
+                filepath = manifest.resolve(module.path)
+                if filepath in cls.LOADED_FILEPATHS:
+                    continue
+                cls._execute_file(filepath, module.module, mode, encoding)
+        finally:
+            cls.LOADING_DEFAULT_NAMESPACE = None
+
+    @classmethod
+    def load_entry_points(
+        cls,
+        group: str,
+        default_namespace: str,
+        mode: LoadingMode = LoadingMode.IMPORT,
+    ):
+        cls._ensure_not_frozen()
+        module_names = [
+            # i.e. the ``module`` part of ``module:attribute [extras]``
+            entry_point.value.split(":")[0].split("[")[0].strip()
+            for entry_point in _select_entry_points(group)
+        ]
+        cls.load_modules(module_names, default_namespace, mode)
+
+    @classmethod
+    def load_modules(
+        cls,
+        module_names: Iterable[str],
+        default_namespace: str,
+        mode: LoadingMode = LoadingMode.IMPORT,
+    ):
+        cls._ensure_not_frozen()
+        module_files = (
+            (module_name, _find_module_filepath(module_name))
+            for module_name in module_names
+        )
+        cls._load_module_files(module_files, default_namespace, mode)
+
+    @classmethod
+    def load_packages(
+        cls,
+        package_names: Iterable[str],
+        default_namespace: str,
+        mode: LoadingMode = LoadingMode.IMPORT,
+    ):
+        cls._ensure_not_frozen()
+        module_files = (
+            module_file
+            for package_name in package_names
+            for module_file in _walk_package(package_name)
+        )
+        cls._load_module_files(module_files, default_namespace, mode)
+
+    @classmethod
+    def _load_module_files(
+        cls,
+        module_files: Iterable[Tuple[str, Optional[str]]],
+        default_namespace: str,
+        mode: LoadingMode,
+    ):
+        # modules are always loaded through the import system, possibly deferred
+        if LoadingMode(mode) is not LoadingMode.LAZY:
+            mode = LoadingMode.IMPORT
+        cls.LOADING_DEFAULT_NAMESPACE = default_namespace
+        cls._get_namespace_entry(default_namespace)
+        try:
+            for module_name, filepath in module_files:
+                if filepath is None or filepath in cls.LOADED_FILEPATHS:
+                    continue
+                cls._execute_file(filepath, module_name, mode)
+        finally:
+            cls.LOADING_DEFAULT_NAMESPACE = None
+
+    @classmethod
+    def _execute_file(
+        cls,
+        filepath: str,
+        module_name: Optional[str] = None,
+        mode: LoadingMode = LoadingMode.RUN,
+        encoding: str = "utf-8",
+    ):
+        start = time.perf_counter()
+        executed = cls._run_file(filepath, module_name, mode, encoding)
+        if executed and cls.LOAD_REPORT is not None:
+            cls.LOAD_REPORT.record_execution(filepath, time.perf_counter() - start)
+
+    @classmethod
+    def _run_file(
+        cls,
+        filepath: str,
+        module_name: Optional[str],
+        mode: LoadingMode,
+        encoding: str,
+    ) -> bool:
+        module_name = module_name or module_finder.find_module_name(filepath)
+        mode = LoadingMode(mode)
+        if mode is LoadingMode.LAZY and module_name is not None:
+            if cls._defer_file(filepath, module_name, encoding):
+                return False
+            cls._import_file(filepath, module_name)
+            return True
+        if mode is LoadingMode.IMPORT and module_name is not None:
+            cls._import_file(filepath, module_name)
+            return True
+        cls.LOADING_FILEPATH = filepath
+        cls.LOADING_COPY = True
+        try:
             try:
-                run_module(module_finder.find_module_name(file.path))
+                run_module(module_name)
             except AttributeError:
                 # This is needed for some corner cases involving pytest
                 # See more at https://github.com/pytest-dev/pytest/issues/9007
-                run_path(file.path)
-            cls.LOADED_FILEPATHS.add(file.path)
+                run_path(filepath, run_name=module_name or "<run_path>")
+        finally:
             cls.LOADING_FILEPATH = None
-        cls.LOADING_DEFAULT_NAMESPACE = None
+            cls.LOADING_COPY = False
+        cls.LOADED_FILEPATHS.add(filepath)
+        return True
 
     @classmethod
-    def _collect_python_files(cls, search_path) -> Set[os.DirEntry]:
+    def _import_file(cls, filepath: str, module_name: str):
+        if filepath in cls.DECORATIONS:
+            # already executed, e.g. imported by the application or run as a script
+            for registration in list(cls.DECORATIONS[filepath].values()):
+                registration()
+        else:
+            cls.LOADING_FILEPATH = filepath
+            try:
+                module = sys.modules.get(module_name)
+                if module is None:
+                    import_module(module_name)
+                else:
+                    # imported before its decorations were recorded, e.g. before the
+                    # container was reset, so it's executed again in place
+                    reload(module)
+            finally:
+                cls.LOADING_FILEPATH = None
+        cls.LOADED_FILEPATHS.add(filepath)
+
+    @classmethod
+    def _defer_file(cls, filepath: str, module_name: str, encoding: str) -> bool:
+        if filepath in cls.DECORATIONS or module_name in sys.modules:
+            return False
+        registrations = extract_registrations(filepath, encoding)
+        if registrations is None:
+            return False
+        for registration in registrations:
+            constructor = DeferredConstructor(
+                module_name, registration.name, registration.is_async
+            )
+            injectable = Injectable(
+                constructor,
+                f"{registration.name}@{filepath}",
+                registration.primary,
+                registration.group,
+                registration.singleton,
+                registration.scope,
+                registration.init,
+                registration.groups or (),
+            )
+            namespace = registration.namespace or cls.LOADING_DEFAULT_NAMESPACE
+            namespace_entry = cls._get_namespace_entry(namespace)
+            namespace_entry.register_injectable_names(
+                injectable, registration.class_names, registration.qualifier
+            )
+        cls.LOADED_FILEPATHS.add(filepath)
+        return True
+
+    @classmethod
+    def _collect_python_files(
+        cls, search_path, file_filter: Optional[FileFilter] = None
+    ) -> Iterable[os.DirEntry]:
+        if file_filter is not None:
+            return file_filter.collect(search_path)
         collector = PythonFileCollector()
         return collector.collect(search_path)
 
     @classmethod
-    def _contains_injectables(cls, file_entry: os.DirEntry, encoding: str) -> bool:
-        with open(file_entry, encoding=encoding) as file:
-            source = file.read()
-        # TODO: Consider the use of ast.parse for this
-        return any(
-            usage in source
-            for usage in [
-                "@injectable",
-                "injectable(",
-                "@injectable_factory",
-                "injectable_factory(",
-            ]
-        )
+    def _scan_file(
+        cls,
+        file_entry: os.DirEntry,
+        encoding: str,
+        scan_cache: Optional[ScanCache] = None,
+    ) -> bool:
+        if scan_cache is None:
+            return cls._timed_contains_injectables(file_entry, encoding)
+        contains_injectables = scan_cache.get(file_entry)
+        if contains_injectables is None:
+            contains_injectables = cls._timed_contains_injectables(file_entry, encoding)
+            scan_cache.set(file_entry, contains_injectables)
+        return contains_injectables
+
+    @classmethod
+    def _timed_contains_injectables(
+        cls, file_entry: os.DirEntry, encoding: str
+    ) -> bool:
+        report = cls.LOAD_REPORT
+        if report is None:
+            return cls._contains_injectables(file_entry, encoding)
+        start = time.perf_counter()
+        contains_injectables = cls._contains_injectables(file_entry, encoding)
+        report.record_scan(file_entry.path, time.perf_counter() - start)
+        return contains_injectables
+
+    @classmethod
+    def _contains_injectables(
+        cls, file_entry: Union[os.DirEntry, str], encoding: str
+    ) -> bool:
+        marker = _encoded_marker(encoding)
+        if marker is None:
+            with open(file_entry, encoding=encoding) as file:
+                source = file.read()
+        else:
+            content = read_if_contains(file_entry, marker)
+            if content is None:
+                cls.DETECTION_STATS.count(False, False)
+                return False
+            source = content.decode(encoding)
+        matched = contains_injectables(source)
+        cls.DETECTION_STATS.count(matched, contains_injectable_markers(source))
+        return matched
+
+
+def _select_entry_points(group: str) -> List[EntryPoint]:
+    selected = entry_points()
+    if hasattr(selected, "select"):
+        return list(selected.select(group=group))
+    return list(selected.get(group, []))  # Python 3.9
+
+
+def _find_module_filepath(module_name: str) -> Optional[str]:
+    return _spec_filepath(_find_spec(module_name))
+
+
+def _walk_package(package_name: str) -> Iterator[Tuple[str, Optional[str]]]:
+    spec = _find_spec(package_name)
+    yield package_name, _spec_filepath(spec)
+    yield from _walk_submodules(package_name, spec.submodule_search_locations or [])
+
+
+def _walk_submodules(
+    package_name: str, locations: List[str]
+) -> Iterator[Tuple[str, Optional[str]]]:
+    for module_info in pkgutil.iter_modules(locations, prefix=f"{package_name}."):
+        # finding the spec through the package's finder avoids importing subpackages
+        find_module_spec = getattr(module_info.module_finder, "find_spec", None)
+        if find_module_spec is not None:
+            spec = find_module_spec(module_info.name)
+        else:
+            spec = _find_spec(module_info.name)
+        if spec is None:
+            continue
+        yield module_info.name, _spec_filepath(spec)
+        if module_info.ispkg:
+            yield from _walk_submodules(
+                module_info.name, spec.submodule_search_locations or []
+            )
+
+
+def _find_spec(module_name: str) -> ModuleSpec:
+    try:
+        spec = find_spec(module_name)
+    except (ImportError, ValueError) as e:
+        raise InjectableLoadError(f"Module '{module_name}' could not be found") from e
+    if spec is None:
+        raise InjectableLoadError(f"Module '{module_name}' could not be found")
+    return spec
+
+
+def _spec_filepath(spec: ModuleSpec) -> Optional[str]:
+    """
+    Returns the path of the file from which the module is loaded, or None for modules
+    not loaded from a Python source file, e.g. namespace packages.
+    """
+    if not spec.has_location or spec.origin is None or not spec.origin.endswith(".py"):
+        return None
+    return os.path.abspath(spec.origin)
+
+
+@lru_cache()
+def _encoded_marker(encoding: str) -> Optional[bytes]:
+    """
+    Returns the bytes to search for in raw file contents in the given encoding, or
+    None when the encoding isn't ASCII compatible and files have to be decoded first.
+    """
+    marker = DETECTION_MARKER.encode(encoding)
+    return marker if marker == DETECTION_MARKER.encode("ascii") else None
@@ -0,0 +1,131 @@
+import asyncio
+import inspect
+import threading
+from contextlib import AsyncExitStack, ExitStack
+from contextvars import ContextVar, Token
+from typing import Any, Callable, Dict, Hashable, Optional
+
+_ACTIVE_SCOPE: ContextVar[Optional["InjectionScope"]] = ContextVar(
+    "injectable_injection_scope", default=None
+)
+
+
+class InjectionScope:
+    """
+    Unit of work in which instances of injectables declared with the
+    :attr:`INJECTION_SCOPE <injectable.constants.Scope.INJECTION_SCOPE>` scope are
+    reused. Instances are released when the scope exits, calling their ``close``
+    method, or their ``aclose`` method when exiting an ``async with`` block, in the
+    reverse order of their construction.
+
+    Scopes are bound to the :mod:`contextvars` context in which they're entered, so
+    asyncio tasks created within the scope share it while other threads don't. Nested
+    scopes don't share instances with the enclosing ones.
+
+    This class is not meant for direct instantiation, use
+    :meth:`injection_scope <injectable.injection_scope>` instead.
+
+    .. versionadded:: 4.1.0
+    """
+
+    def __init__(self):
+        self._instances: Dict[Hashable, Any] = {}
+        # constructions are single-flight: threads construct under a lock per key
+        # and tasks await a construction shared per key
+        self._locks: Dict[Hashable, threading.RLock] = {}
+        self.constructions: Dict[Hashable, asyncio.Future] = {}
+        self._token: Optional[Token] = None
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        return self._instances.get(key, default)
+
+    def set(self, key: Hashable, instance: Any) -> Any:
+        """
+        Stores the instance unless one was already stored for the key, returning the
+        instance stored.
+        """
+        return self._instances.setdefault(key, instance)
+
+    def lock(self, key: Hashable) -> threading.RLock:
+        """
+        Returns the lock under which the instance for the key is constructed.
+        """
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = self._locks.setdefault(key, threading.RLock())
+        return lock
+
+    def __enter__(self) -> "InjectionScope":
+        self._activate()
+        return self
+
+    def __exit__(self, *exc_info):
+        with ExitStack() as stack:
+            for instance in self._deactivate():
+                close = getattr(instance, "close", None)
+                if callable(close):
+                    stack.callback(close)
+
+    async def __aenter__(self) -> "InjectionScope":
+        self._activate()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        async with AsyncExitStack() as stack:
+            for instance in self._deactivate():
+                close = getattr(instance, "aclose", None)
+                if not callable(close):
+                    close = getattr(instance, "close", None)
+                if callable(close):
+                    stack.push_async_callback(_close, close)
+
+    def _activate(self):
+        if self._token is not None:
+            raise RuntimeError("Injection scope already entered")
+        self._token = _ACTIVE_SCOPE.set(self)
+
+    def _deactivate(self):
+        _ACTIVE_SCOPE.reset(self._token)
+        self._token = None
+        instances = list(self._instances.values())
+        self._instances.clear()
+        self._locks.clear()
+        return instances
+
+
+async def _close(close: Callable[[], Any]):
+    result = close()
+    if inspect.isawaitable(result):
+        await result
+
+
+def injection_scope() -> InjectionScope:
+    """
+    Context manager delimiting a unit of work, e.g. a request, in which injectables
+    declared with the
+    :attr:`INJECTION_SCOPE <injectable.constants.Scope.INJECTION_SCOPE>` scope are
+    constructed at most once and closed when it exits. Can be used both as a
+    synchronous and as an asynchronous context manager.
+
+    Outside of any injection scope such injectables behave as regular injectables,
+    constructing a new instance on each injection.
+
+    Usage::
+
+      >>> from injectable import inject, injectable, injection_scope
+      >>>
+      >>> @injectable(scope="injection_scope")
+      ... class Session:
+      ...     def close(self):
+      ...         ...
+      >>>
+      >>> with injection_scope():
+      ...     assert inject(Session) is inject(Session)
+
+    .. versionadded:: 4.1.0
+    """
+    return InjectionScope()
+
+
+def active_injection_scope() -> Optional[InjectionScope]:
+    return _ACTIVE_SCOPE.get()
@@ -1,8 +1,13 @@
 import os
+from typing import Iterable
 
+from injectable.container.file_filter import file_filter_for
 from injectable.container.injection_container import InjectionContainer
+from injectable.container.load_report import LoadReport
+from injectable.container.scan_cache import ScanCache
+from injectable.container.warm_up import start_background_constructions, warm_up
 from injectable.common_utils import get_caller_filepath
-from injectable.constants import DEFAULT_NAMESPACE
+from injectable.constants import DEFAULT_NAMESPACE, LoadingMode
 
 
 def load_injection_container(
@@ -10,7 +15,19 @@ def load_injection_container(
     *,
     default_namespace: str = DEFAULT_NAMESPACE,
     encoding: str = "utf-8",
-):
+    scan_cache: ScanCache = None,
+    scan_workers: int = 1,
+    manifest: str = None,
+    on_stale_manifest: str = "error",
+    mode: LoadingMode = LoadingMode.RUN,
+    entry_points: str = None,
+    modules: Iterable[str] = None,
+    packages: Iterable[str] = None,
+    include: Iterable[str] = None,
+    exclude: Iterable[str] = None,
+    gitignore: bool = False,
+    eager_singletons: bool = False,
+) -> LoadReport:
     """
     Loads injectables under the search path to a shared injection container under the
     designated namespaces.
@@ -24,12 +41,79 @@ def load_injection_container(
             :const:`injectable.constants.DEFAULT_NAMESPACE`.
     :param encoding: (optional) defines which encoding to use when reading project files
             to discover and register injectables. Defaults to ``utf-8``.
+    :param scan_cache: (optional) a :class:`ScanCache <injectable.ScanCache>` in which
+            to remember which files contain injectables so unchanged files aren't read
+            again in later loads, even across processes. Defaults to None.
+    :param scan_workers: (optional) number of threads used to scan files for
+            injectables. Files found to contain injectables are still executed one
+            at a time. Defaults to 1.
+    :param manifest: (optional) path of a manifest built with
+            :meth:`build_manifest <injectable.build_manifest>`. When given, exactly the
+            modules listed in the manifest are loaded and the search path is neither
+            walked nor scanned. Can be either a relative or absolute path. Defaults to
+            None.
+    :param on_stale_manifest: (optional) what to do when any module listed in the
+            manifest changed, or any module registering injectables was added next to
+            the files it walked, since it was built: ``"error"`` raises an
+            :class:`InjectableLoadError <injectable.errors.InjectableLoadError>` and
+            ``"scan"`` falls back to walking and scanning the path the manifest was
+            built from. Defaults to ``"error"``.
+    :param mode: (optional) how modules registering injectables are loaded, see
+            :class:`LoadingMode <injectable.constants.LoadingMode>`. With ``"import"``
+            modules are imported through the regular import system instead of being
+            executed again with :mod:`runpy`, so each module is executed only once and
+            injected instances are of the same classes the application imports.
+            With ``"lazy"`` injectables are registered from their decorators' literal
+            arguments read statically and each module is imported only when one of its
+            injectables is first injected. Defaults to ``"run"``.
+    :param entry_points: (optional) entry point group, usually
+            :const:`injectable.constants.DEFAULT_ENTRY_POINT_GROUP`, in which installed
+            packages advertise modules registering injectables. The advertised modules
+            are loaded through the import system, or deferred in ``"lazy"`` mode,
+            without walking nor scanning any directory. The search path is still loaded
+            when explicitly given. Defaults to None.
+    :param modules: (optional) names of modules registering injectables, which are
+            loaded through the import system as with ``entry_points``. Defaults to
+            None.
+    :param packages: (optional) names of packages whose modules, including those of
+            subpackages, are loaded through the import system as with
+            ``entry_points``. Submodules are found by listing the package directories
+            and no file is read nor scanned. Defaults to None.
+    :param include: (optional) glob patterns of the files under the search path to
+            load, relative to the search path. Patterns without any ``/`` are matched
+            against file names only and ``**`` matches any number of directories,
+            e.g. ``["src/**/*.py"]``. Defaults to None, i.e. all Python files.
+    :param exclude: (optional) glob patterns, as in ``include``, of the files not to
+            load and of the directories not to descend into, e.g.
+            ``["node_modules", "tests/**"]``. Excluded directories are never listed and
+            nothing under them is stat'ed nor opened. Defaults to None.
+    :param gitignore: (optional) when True, files and directories ignored by the
+            ``.gitignore`` files found under the search path are also excluded.
+            Defaults to False.
+    :param eager_singletons: (optional) when True, singletons are constructed right
+            after loading, as by :meth:`warm_up <injectable.warm_up>`, instead of on
+            their first injection. Defaults to False.
+    :return: a :class:`LoadReport <injectable.LoadReport>` with counts of the files
+            walked, scanned, matched and executed, the time spent scanning each file
+            and executing each module, the injectables registered per namespace and,
+            with ``eager_singletons``, the time spent constructing each singleton.
 
     Usage::
 
       >>> from injectable import load_injection_container
       >>> load_injection_container()
 
+    .. note::
+
+        Once injectables are loaded, the background construction of singletons
+        declared with ``init="background"`` is started.
+
+    .. note::
+
+        Loading injectables once the injection container is frozen raises a
+        :class:`FrozenContainerError <injectable.errors.FrozenContainerError>` before
+        any module is executed.
+
     .. note::
 
         This method will not scan any file already scanned by previous calls to it.
@@ -38,10 +122,51 @@ def load_injection_container(
         loading a same injectable more than once.
 
     .. versionadded:: 3.4.0
+
+    .. versionchanged:: 4.1.0
+       Added the ``scan_cache``, ``scan_workers``, ``manifest``,
+       ``on_stale_manifest``, ``mode``, ``entry_points``, ``modules``, ``packages``,
+       ``include``, ``exclude``, ``gitignore`` and ``eager_singletons`` parameters
+       and return a
+       :class:`LoadReport <injectable.LoadReport>`.
     """
-    if search_path is None:
+    InjectionContainer._ensure_not_frozen()
+    if manifest is not None and not os.path.isabs(manifest):
+        caller_path = os.path.dirname(get_caller_filepath())
+        manifest = os.path.abspath(os.path.join(caller_path, manifest))
+    from_imports = (
+        entry_points is not None or modules is not None or packages is not None
+    )
+    if search_path is None and manifest is None and not from_imports:
         search_path = os.path.dirname(get_caller_filepath())
-    elif not os.path.isabs(search_path):
+    elif search_path is not None and not os.path.isabs(search_path):
         caller_path = os.path.dirname(get_caller_filepath())
         search_path = os.path.abspath(os.path.join(caller_path, search_path))
-    InjectionContainer.load_dependencies_from(search_path, default_namespace, encoding)
+    with InjectionContainer._reporting() as report:
+        if manifest is not None:
+            InjectionContainer.load_manifest(
+                manifest, default_namespace, encoding, on_stale_manifest, mode
+            )
+        else:
+            if entry_points is not None:
+                InjectionContainer.load_entry_points(
+                    entry_points, default_namespace, mode
+                )
+            if modules is not None:
+                InjectionContainer.load_modules(modules, default_namespace, mode)
+            if packages is not None:
+                InjectionContainer.load_packages(packages, default_namespace, mode)
+            if search_path is not None:
+                InjectionContainer.load_dependencies_from(
+                    search_path,
+                    default_namespace,
+                    encoding,
+                    scan_cache,
+                    scan_workers,
+                    mode,
+                    file_filter=file_filter_for(include, exclude, gitignore),
+                )
+    if eager_singletons:
+        report.singleton_times = warm_up()
+    start_background_constructions()
+    return report
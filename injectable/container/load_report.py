@@ -0,0 +1,77 @@
+import threading
+from typing import Dict, List, Tuple
+
+
+class LoadReport:
+    """
+    Report of a load of the injection container, returned by
+    :meth:`load_injection_container <injectable.load_injection_container>`.
+
+    * ``files_walked``: Python files found walking the search path;
+    * ``files_scanned``: files read and scanned for injectables, i.e. not answered by
+      a scan cache;
+    * ``files_matched``: files found to register injectables;
+    * ``files_executed``: modules executed or imported;
+    * ``scan_times``: seconds spent scanning each file, by file path;
+    * ``execution_times``: seconds spent executing each module, by file path;
+    * ``registrations``: injectables registered by the load, by namespace;
+    * ``singleton_times``: seconds spent constructing each singleton, by unique id,
+      when loading with ``eager_singletons``.
+
+    .. versionadded:: 4.1.0
+    """
+
+    def __init__(self):
+        self.files_walked = 0
+        self.files_scanned = 0
+        self.files_matched = 0
+        self.files_executed = 0
+        self.scan_times: Dict[str, float] = {}
+        self.execution_times: Dict[str, float] = {}
+        self.registrations: Dict[str, int] = {}
+        self.singleton_times: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def record_scan(self, filepath: str, seconds: float):
+        with self._lock:
+            self.files_scanned += 1
+            self.scan_times[filepath] = seconds
+
+    def record_execution(self, filepath: str, seconds: float):
+        with self._lock:
+            self.files_executed += 1
+            self.execution_times[filepath] = seconds
+
+    def slowest_modules(self, count: int = 10) -> List[Tuple[str, float]]:
+        """
+        Returns the file paths and execution times of the slowest modules executed.
+        """
+        return sorted(
+            self.execution_times.items(), key=lambda item: item[1], reverse=True
+        )[:count]
+
+    def slowest_singletons(self, count: int = 10) -> List[Tuple[str, float]]:
+        """
+        Returns the unique ids and construction times of the slowest singletons
+        constructed.
+        """
+        return sorted(
+            self.singleton_times.items(), key=lambda item: item[1], reverse=True
+        )[:count]
+
+    @property
+    def total_scan_time(self) -> float:
+        return sum(self.scan_times.values())
+
+    @property
+    def total_execution_time(self) -> float:
+        return sum(self.execution_times.values())
+
+    def __repr__(self):
+        return (
+            f"LoadReport(files_walked={self.files_walked},"
+            f" files_scanned={self.files_scanned},"
+            f" files_matched={self.files_matched},"
+            f" files_executed={self.files_executed},"
+            f" registrations={self.registrations})"
+        )
@@ -0,0 +1,232 @@
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from pycollect import PythonFileCollector
+
+#: Default name of the manifest file written by ``build-manifest``
+DEFAULT_MANIFEST_FILENAME = "injectable-manifest.json"
+
+
+@dataclass
+class ManifestInjectable:
+    """
+    Record of an injectable registered by a module listed in a :class:`Manifest`.
+    """
+
+    name: str
+    kind: str
+    namespace: str
+    klass: Optional[str] = None
+    qualifier: Optional[str] = None
+    group: Optional[str] = None
+    primary: bool = False
+    singleton: bool = False
+    scope: Optional[str] = None
+    init: Optional[str] = None
+    groups: Optional[List[str]] = None
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "kind": self.kind,
+            "namespace": self.namespace,
+            "class": self.klass,
+            "qualifier": self.qualifier,
+            "group": self.group,
+            "primary": self.primary,
+            "singleton": self.singleton,
+            "scope": self.scope,
+            "init": self.init,
+            "groups": self.groups,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ManifestInjectable":
+        data = dict(data)
+        data["klass"] = data.pop("class", None)
+        return cls(**data)
+
+
+@dataclass
+class ManifestModule:
+    """
+    Record of a module which registers injectables and the fingerprint of its source
+    file at the time the :class:`Manifest` was built.
+    """
+
+    path: str
+    module: Optional[str]
+    size: int
+    mtime: int
+    sha256: str
+    injectables: List[ManifestInjectable] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return {
+            "path": self.path,
+            "module": self.module,
+            "size": self.size,
+            "mtime": self.mtime,
+            "sha256": self.sha256,
+            "injectables": [injectable.to_dict() for injectable in self.injectables],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ManifestModule":
+        data = dict(data)
+        data["injectables"] = [
+            ManifestInjectable.from_dict(injectable)
+            for injectable in data.get("injectables", [])
+        ]
+        return cls(**data)
+
+
+@dataclass
+class Manifest:
+    """
+    Manifest of the modules to be loaded into the injection container and what each
+    of them registers, so that loading the container doesn't need to walk nor scan
+    the search path.
+
+    Paths are stored relative to the manifest file directory so that the manifest
+    remains valid when the whole tree is moved, e.g. copied into a container image.
+
+    The Python files found under the root and the modification times of the
+    directories holding them are recorded as well, so that modules added later are
+    detected with a single ``stat`` per directory while no directory changes.
+
+    .. versionadded:: 4.1.0
+    """
+
+    #: Version of the manifest format
+    VERSION = 1
+
+    root: str
+    default_namespace: str
+    modules: List[ManifestModule] = field(default_factory=list)
+    filepath: Optional[str] = None
+    directories: Dict[str, int] = field(default_factory=dict)
+    files: List[str] = field(default_factory=list)
+
+    @property
+    def base_dir(self) -> str:
+        return os.path.dirname(os.path.abspath(self.filepath))
+
+    def resolve(self, path: str) -> str:
+        """
+        Returns the absolute path of a path stored in the manifest.
+        """
+        return os.path.normpath(os.path.join(self.base_dir, path))
+
+    def relativize(self, path: str) -> str:
+        return os.path.relpath(path, self.base_dir).replace(os.sep, "/")
+
+    def stale_modules(self) -> List[ManifestModule]:
+        """
+        Returns the modules whose source files changed or no longer exist since the
+        manifest was built.
+        """
+        return [module for module in self.modules if self._is_stale(module)]
+
+    def record_tree(self):
+        """
+        Records the Python files under the root and the modification times of the
+        directories holding them, so that :meth:`new_files` can detect files added
+        later.
+        """
+        root = self.resolve(self.root)
+        filepaths = sorted(entry.path for entry in PythonFileCollector().collect(root))
+        directories = {root}
+        for filepath in filepaths:
+            directory = os.path.dirname(filepath)
+            while directory not in directories and len(directory) > len(root):
+                directories.add(directory)
+                directory = os.path.dirname(directory)
+        self.directories = {
+            self.relativize(directory): os.stat(directory).st_mtime_ns
+            for directory in sorted(directories)
+        }
+        self.files = [self.relativize(filepath) for filepath in filepaths]
+
+    def new_files(self) -> List[str]:
+        """
+        Returns the paths of the Python files added under the root since the manifest
+        was built. The root is walked again only when any recorded directory was
+        modified.
+
+        Files added to directories which held no Python files when the manifest was
+        built, nor any directory holding them, aren't detected.
+        """
+        root = self.resolve(self.root)
+        if not os.path.isdir(root) or not any(
+            self._is_modified(directory, mtime)
+            for directory, mtime in self.directories.items()
+        ):
+            return []
+        files = set(self.files)
+        return sorted(
+            path
+            for path in (
+                self.relativize(entry.path)
+                for entry in PythonFileCollector().collect(root)
+            )
+            if path not in files
+        )
+
+    def _is_modified(self, directory: str, mtime: int) -> bool:
+        try:
+            return os.stat(self.resolve(directory)).st_mtime_ns != mtime
+        except OSError:
+            return True
+
+    def _is_stale(self, module: ManifestModule) -> bool:
+        filepath = self.resolve(module.path)
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            return True
+        if stat.st_size == module.size and stat.st_mtime_ns == module.mtime:
+            return False
+        return file_sha256(filepath) != module.sha256
+
+    def write(self, filepath: str = None):
+        self.filepath = os.path.abspath(filepath or self.filepath)
+        data = {
+            "version": self.VERSION,
+            "root": self.root,
+            "default_namespace": self.default_namespace,
+            "modules": [module.to_dict() for module in self.modules],
+            "directories": self.directories,
+            "files": self.files,
+        }
+        with open(self.filepath, "w", encoding="utf-8") as file:
+            json.dump(data, file, indent=2)
+            file.write("\n")
+
+    @classmethod
+    def read(cls, filepath: str) -> "Manifest":
+        with open(filepath, encoding="utf-8") as file:
+            data = json.load(file)
+        if data.get("version") != cls.VERSION:
+            raise ValueError(
+                f"Unsupported injectable manifest version: {data.get('version')}"
+            )
+        return cls(
+            root=data["root"],
+            default_namespace=data["default_namespace"],
+            modules=[ManifestModule.from_dict(module) for module in data["modules"]],
+            filepath=os.path.abspath(filepath),
+            directories=data.get("directories", {}),
+            files=data.get("files", []),
+        )
+
+
+def file_sha256(filepath: str) -> str:
+    digest = hashlib.sha256()
+    with open(filepath, "rb") as file:
+        for chunk in iter(lambda: file.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
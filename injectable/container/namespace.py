@@ -1,13 +1,246 @@
-from typing import Dict, Optional, Set
+import itertools
+import sys
+from abc import ABC
+from types import MappingProxyType
+from typing import (
+    Any,
+    FrozenSet,
+    Generic,
+    Protocol,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 from injectable.container.injectable import Injectable
-from injectable.common_utils import get_dependency_name
+from injectable.common_utils import get_dependency_name, get_type_name
+from injectable.errors.frozen_container_error import FrozenContainerError
+
+
+class FrozenEntry(NamedTuple):
+    """
+    Immutable lookup table entry of the injectables registered for a class or
+    qualifier in a frozen namespace.
+    """
+
+    injectables: Tuple[Injectable, ...]
+    #: the only injectable or the primary one, None when there's none or it's ambiguous
+    resolved: Optional[Injectable]
+    #: entries restricted to each group of the injectables
+    groups: Mapping[str, "FrozenEntry"]
+
+
+EMPTY_ENTRY = FrozenEntry((), None, MappingProxyType({}))
+
+_FrozenRegistry = Mapping[Union[type, str], FrozenEntry]
 
 
 class Namespace:
+    #: Bases shared by most classes, to which registrations aren't propagated as
+    #: injecting them would be ambiguous anyway. Injectables can still be registered
+    #: for them explicitly.
+    UNIVERSAL_BASES: FrozenSet[type] = frozenset({object, ABC, Generic, Protocol})
+
     def __init__(self):
+        # Classes are indexed by identity so that same named classes from different
+        # modules don't collide. Classes known only by name, e.g. from statically
+        # extracted registrations, are indexed by their qualified names. Lookups of
+        # classes not indexed, e.g. imported copies of classes registered from modules
+        # executed with runpy, fall back to the classes indexed under the same module
+        # and qualified name, the module being possibly named with another package
+        # prefix when it's found through another entry of the module search path.
+        self.type_registry: Dict[type, Set[Injectable]] = {}
+        self.type_names: Dict[str, List[type]] = {}
+        self.qualified_type_names: Dict[str, List[str]] = {}
         self.class_registry: Dict[str, Set[Injectable]] = {}
         self.qualifier_registry: Dict[str, Set[Injectable]] = {}
+        # Groups are interned as bits and the groups of each injectable, by unique id,
+        # as a mask of those bits, so filtering candidates by group costs a couple of
+        # integer operations per candidate. Injectables without groups have no mask.
+        self.group_bits: Dict[str, int] = {}
+        self.group_masks: Dict[str, int] = {}
+        # Resolutions are cached along with the generation of the registries they were
+        # computed from and every change to the registries starts a new generation
+        self.resolution_cache: Dict[Hashable, Tuple[int, Any]] = {}
+        self._generations = itertools.count()
+        self.generation = next(self._generations)
+        #: number of injectables registered so far, diffed to report loads
+        self.registration_count = 0
+        self.frozen = False
+        self.frozen_type_registry: _FrozenRegistry = MappingProxyType({})
+        self.frozen_class_registry: _FrozenRegistry = MappingProxyType({})
+        self.frozen_qualifier_registry: _FrozenRegistry = MappingProxyType({})
+
+    def invalidate_resolutions(self):
+        """
+        Starts a new generation of the registries, invalidating cached resolutions.
+
+        Must be called after changing the registries other than by registering
+        injectables through this class.
+        """
+        if self.frozen:
+            raise FrozenContainerError()
+        self.generation = next(self._generations)
+
+    def get_class_injectables(
+        self, klass: type, class_name: str = None
+    ) -> Optional[Set[Injectable]]:
+        """
+        Returns the injectables registered for the class, either as a class or by its
+        qualified name, or those of the classes of same module and qualified name when
+        the class itself isn't indexed.
+        """
+        class_name = class_name or get_dependency_name(klass)
+        by_type = self.type_registry.get(klass)
+        if by_type is None:
+            return self.get_named_injectables(class_name, self.find_type_name(klass))
+        by_name = self.class_registry.get(class_name)
+        return by_type | by_name if by_name else by_type
+
+    def get_named_injectables(
+        self, class_name: str, type_name: Optional[str] = None
+    ) -> Optional[Set[Injectable]]:
+        """
+        Returns the injectables registered for the qualified name and, when given the
+        module and qualified name of a class, for any class of that name.
+        """
+        by_name = self.class_registry.get(class_name)
+        types = self.type_names.get(type_name) if type_name else None
+        if not types:
+            return by_name
+        if len(types) == 1 and not by_name:
+            return self.type_registry[types[0]]
+        return set(by_name or ()).union(*(self.type_registry[t] for t in types))
+
+    def find_type_name(self, klass: type) -> Optional[str]:
+        """
+        Returns the module and qualified name under which the class or copies of it
+        are indexed, if any.
+        """
+        type_name = get_type_name(klass)
+        if type_name in self.type_names:
+            return type_name
+        module = klass.__module__
+        for candidate in self.qualified_type_names.get(klass.__qualname__, ()):
+            candidate_module = candidate[: -len(klass.__qualname__) - 1]
+            if candidate_module.endswith(f".{module}") or module.endswith(
+                f".{candidate_module}"
+            ):
+                return candidate
+        return None
+
+    def filter_by_groups(
+        self,
+        injectables: Iterable[Injectable],
+        group: Optional[str] = None,
+        exclude_groups: Optional[Iterable[str]] = None,
+    ) -> Tuple[Injectable, ...]:
+        """
+        Returns the injectables belonging to the group, when given, and to none of the
+        excluded groups.
+        """
+        masks = self.group_masks
+        exclude = 0
+        for excluded_group in exclude_groups or ():
+            exclude |= self.group_bits.get(excluded_group, 0)
+        if group is None:
+            return tuple(
+                injectable
+                for injectable in injectables
+                if not masks.get(injectable.unique_id, 0) & exclude
+            )
+        include = self.group_bits.get(group)
+        if include is None:
+            return ()
+        # the group bit must be set and every excluded bit unset
+        required = include | exclude
+        return tuple(
+            injectable
+            for injectable in injectables
+            if masks.get(injectable.unique_id, 0) & required == include
+        )
+
+    def build_frozen_registries(
+        self,
+    ) -> Tuple[_FrozenRegistry, _FrozenRegistry, _FrozenRegistry]:
+        """
+        Builds the lookup tables of the type, class and qualifier registries used once
+        the namespace is frozen. Entries of types include the injectables registered by
+        their qualified names and the class registry includes entries by the module and
+        qualified name of the indexed types, looked up for classes not indexed.
+        """
+        type_registry = {
+            klass: self.get_class_injectables(klass) for klass in self.type_registry
+        }
+        class_registry = {
+            class_name: self.get_named_injectables(class_name)
+            for class_name in self.class_registry
+        }
+        for type_name, types in self.type_names.items():
+            class_registry[type_name] = self.get_named_injectables(
+                types[0].__qualname__, type_name
+            )
+        return (
+            MappingProxyType(_freeze_registry(type_registry)),
+            MappingProxyType(_freeze_registry(class_registry)),
+            MappingProxyType(_freeze_registry(self.qualifier_registry)),
+        )
+
+    @staticmethod
+    def ambiguous_keys(
+        type_registry: _FrozenRegistry,
+        class_registry: _FrozenRegistry,
+        qualifier_registry: _FrozenRegistry,
+    ) -> Iterator[Tuple[str, str, Optional[str]]]:
+        """
+        Yields the registry type, key and group, or None for the whole key, of the
+        entries matching multiple injectables without a single primary one.
+        """
+        for registry_type, registry in (
+            ("class", type_registry),
+            ("class", class_registry),
+            ("qualifier", qualifier_registry),
+        ):
+            for key, entry in registry.items():
+                if isinstance(key, type):
+                    key = f"{key.__module__}.{key.__qualname__}"
+                if _is_ambiguous(entry):
+                    yield registry_type, key, None
+                for group, group_entry in entry.groups.items():
+                    if _is_ambiguous(group_entry):
+                        yield registry_type, key, group
+
+    def freeze(
+        self,
+        type_registry: _FrozenRegistry,
+        class_registry: _FrozenRegistry,
+        qualifier_registry: _FrozenRegistry,
+    ):
+        """
+        Freezes the namespace with lookup tables built by
+        :meth:`build_frozen_registries`. Registering injectables afterwards raises a
+        :class:`FrozenContainerError <injectable.errors.FrozenContainerError>`.
+        """
+        self.frozen_type_registry = type_registry
+        self.frozen_class_registry = class_registry
+        self.frozen_qualifier_registry = qualifier_registry
+        for registry in (
+            self.type_registry,
+            self.class_registry,
+            self.qualifier_registry,
+        ):
+            for key, injectables in registry.items():
+                registry[key] = frozenset(injectables)
+        self.resolution_cache.clear()
+        self.frozen = True
 
     def register_injectable(
         self,
@@ -16,30 +249,184 @@ class Namespace:
         qualifier: Optional[str] = None,
         propagate: bool = True,
     ):
+        self._register_groups(injectable)
         if qualifier:
             self._register_to_qualifier(qualifier, injectable)
-        if klass:
+        if isinstance(klass, str):
             self._register_to_class(klass, injectable)
-            if not propagate:
-                return
-            for base_class in klass.__bases__:
-                self.register_injectable(injectable, base_class, propagate=propagate)
+        elif klass:
+            for target in self._lineage(klass, propagate):
+                self._register_to_type(target, injectable)
+        self.registration_count += 1
+
+    def register_bulk(
+        self,
+        registrations: Iterable[
+            Tuple[Injectable, Optional[Union[type, str]], Optional[str], bool]
+        ],
+    ) -> int:
+        """
+        Registers many injectables in a single pass, each one for its class, propagated
+        to base classes when asked, and its qualifier. Qualifiers are interned and the
+        registries start a single new generation. Returns the number of injectables
+        registered.
+
+        :param registrations: the injectable, class, qualifier and whether to propagate
+                to base classes of each registration.
+        """
+        if self.frozen:
+            raise FrozenContainerError()
+        lineages: Dict[Tuple[type, bool], Tuple[type, ...]] = {}
+        count = 0
+        try:
+            for injectable, klass, qualifier, propagate in registrations:
+                self._register_groups(injectable)
+                if qualifier:
+                    self._add_to_qualifier(sys.intern(qualifier), injectable)
+                if isinstance(klass, str):
+                    self._add_to_class(klass, injectable)
+                elif klass:
+                    lineage = lineages.get((klass, propagate))
+                    if lineage is None:
+                        lineage = lineages[klass, propagate] = self._lineage(
+                            klass, propagate
+                        )
+                    for target in lineage:
+                        self._add_to_type(target, injectable)
+                count += 1
+        finally:
+            if count:
+                self.registration_count += count
+                self.invalidate_resolutions()
+        return count
+
+    def register_injectable_names(
+        self,
+        injectable: Injectable,
+        class_names: Iterable[str] = (),
+        qualifier: Optional[str] = None,
+    ):
+        """
+        Registers the injectable for classes given by their qualified names, including
+        base classes as registration won't be propagated. Universal bases following
+        the first class name are skipped.
+        """
+        self._register_groups(injectable)
+        if qualifier:
+            self._register_to_qualifier(qualifier, injectable)
+        universal_names = {base.__qualname__ for base in self.UNIVERSAL_BASES}
+        for index, class_name in enumerate(class_names):
+            if index == 0 or class_name not in universal_names:
+                self._register_to_class(class_name, injectable)
+        self.registration_count += 1
+
+    def _register_groups(self, injectable: Injectable):
+        if self.frozen:
+            raise FrozenContainerError()
+        mask = 0
+        for group in injectable.groups:
+            bit = self.group_bits.get(group)
+            if bit is None:
+                bit = self.group_bits[group] = 1 << len(self.group_bits)
+            mask |= bit
+        if mask:
+            self.group_masks[injectable.unique_id] = mask
+
+    def _lineage(self, klass: type, propagate: bool) -> Tuple[type, ...]:
+        if not propagate:
+            return (klass,)
+        return (
+            klass,
+            *(base for base in klass.__mro__[1:] if base not in self.UNIVERSAL_BASES),
+        )
+
+    def _register_to_type(self, klass: type, injectable: Injectable):
+        if self.frozen:
+            raise FrozenContainerError()
+        self._add_to_type(klass, injectable)
+        self.invalidate_resolutions()
 
     def _register_to_class(
         self,
-        klass: type,
+        klass: Union[type, str],
         injectable: Injectable,
     ):
-        qualified_name = get_dependency_name(klass)
-        if qualified_name not in self.class_registry:
-            self.class_registry[qualified_name] = set()
-        self.class_registry[qualified_name].add(injectable)
+        if self.frozen:
+            raise FrozenContainerError()
+        self._add_to_class(klass, injectable)
+        self.invalidate_resolutions()
 
     def _register_to_qualifier(
         self,
         qualifier: str,
         injectable: Injectable,
     ):
+        if self.frozen:
+            raise FrozenContainerError()
+        self._add_to_qualifier(qualifier, injectable)
+        self.invalidate_resolutions()
+
+    def _add_to_type(self, klass: type, injectable: Injectable):
+        if klass not in self.type_registry:
+            self.type_registry[klass] = set()
+            type_name = get_type_name(klass)
+            if type_name not in self.type_names:
+                self.type_names[type_name] = []
+                self.qualified_type_names.setdefault(klass.__qualname__, []).append(
+                    type_name
+                )
+            self.type_names[type_name].append(klass)
+        self.type_registry[klass].add(injectable)
+
+    def _add_to_class(self, klass: Union[type, str], injectable: Injectable):
+        qualified_name = get_dependency_name(klass)
+        if qualified_name not in self.class_registry:
+            self.class_registry[qualified_name] = set()
+        self.class_registry[qualified_name].add(injectable)
+
+    def _add_to_qualifier(self, qualifier: str, injectable: Injectable):
         if qualifier not in self.qualifier_registry:
             self.qualifier_registry[qualifier] = set()
         self.qualifier_registry[qualifier].add(injectable)
+
+
+def _freeze_registry(
+    registry: Mapping[Union[type, str], Set[Injectable]],
+) -> Dict[Union[type, str], FrozenEntry]:
+    return {
+        key: _frozen_entry(injectables)
+        for key, injectables in registry.items()
+        if injectables
+    }
+
+
+def _frozen_entry(
+    injectables: Iterable[Injectable], with_groups: bool = True
+) -> FrozenEntry:
+    injectables = tuple(
+        sorted(injectables, key=lambda injectable: injectable.unique_id)
+    )
+    if len(injectables) == 1:
+        resolved = injectables[0]
+    else:
+        primaries = [injectable for injectable in injectables if injectable.primary]
+        resolved = primaries[0] if len(primaries) == 1 else None
+    groups: Dict[str, List[Injectable]] = {}
+    if with_groups:
+        for injectable in injectables:
+            for group in injectable.groups:
+                groups.setdefault(group, []).append(injectable)
+    return FrozenEntry(
+        injectables,
+        resolved,
+        MappingProxyType(
+            {
+                group: _frozen_entry(members, with_groups=False)
+                for group, members in groups.items()
+            }
+        ),
+    )
+
+
+def _is_ambiguous(entry: FrozenEntry) -> bool:
+    return entry.resolved is None and len(entry.injectables) > 1
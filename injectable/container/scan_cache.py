@@ -0,0 +1,162 @@
+import hashlib
+import json
+import os
+import threading
+from typing import Dict, Optional, Union
+
+
+class ScanCache:
+    """
+    ScanCache persists to disk which files were found to contain injectables so that
+    subsequent loads of the injection container only need to stat files which didn't
+    change since they were last scanned instead of reading them again.
+
+    A file's cached scan result is reused when its size and modification time are the
+    same as when it was scanned. When ``hash_contents`` is True a file whose size or
+    modification time changed will still be considered unchanged if its contents hash
+    didn't change, which is useful when the files modification times aren't preserved
+    between builds, e.g. fresh checkouts or container image layers.
+
+    :param cache_dir: (optional) directory in which the cache file will be stored.
+            Defaults to the ``INJECTABLE_CACHE_DIR`` environment variable when set, or
+            else to an ``injectable`` directory inside the user's cache directory.
+    :param hash_contents: (optional) when True a content hash of each scanned file is
+            also recorded and used to validate entries whose stat changed. Defaults to
+            False.
+
+    Usage::
+
+      >>> from injectable import ScanCache, load_injection_container
+      >>> scan_cache = ScanCache()
+      >>> load_injection_container(scan_cache=scan_cache)
+      >>> scan_cache.hits, scan_cache.misses
+      (30000, 0)
+
+    .. versionadded:: 4.1.0
+    """
+
+    #: Name of the file in which the cache is stored inside the cache directory.
+    FILENAME = "scan-cache.json"
+    #: Version of the cache format. Caches stored with other versions are discarded.
+    VERSION = 2
+
+    def __init__(self, cache_dir: str = None, *, hash_contents: bool = False):
+        self.cache_dir = os.path.abspath(cache_dir or self.default_cache_dir())
+        self.hash_contents = hash_contents
+        self.hits = 0
+        self.misses = 0
+        self._entries: Optional[Dict[str, dict]] = None
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def default_cache_dir() -> str:
+        if os.environ.get("INJECTABLE_CACHE_DIR"):
+            return os.environ["INJECTABLE_CACHE_DIR"]
+        cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+            os.path.expanduser("~"), ".cache"
+        )
+        return os.path.join(cache_home, "injectable")
+
+    @property
+    def path(self) -> str:
+        return os.path.join(self.cache_dir, self.FILENAME)
+
+    def get(self, file_entry: Union[os.DirEntry, str]) -> Optional[bool]:
+        """
+        Returns the cached scan result for the file or None if the file has no valid
+        entry in the cache.
+        """
+        filepath = os.fspath(file_entry)
+        stat = os.stat(file_entry)
+        with self._lock:
+            entry = self._get_entries().get(filepath)
+        if entry is not None:
+            if entry["size"] == stat.st_size and entry["mtime"] == stat.st_mtime_ns:
+                self._count_hit()
+                return entry["contains"]
+            if self.hash_contents and entry.get("hash") == self._hash(filepath):
+                self._store(filepath, stat, entry["contains"], entry["hash"])
+                self._count_hit()
+                return entry["contains"]
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def set(self, file_entry: Union[os.DirEntry, str], contains_injectables: bool):
+        """
+        Records the scan result for the file.
+        """
+        filepath = os.fspath(file_entry)
+        stat = os.stat(file_entry)
+        content_hash = self._hash(filepath) if self.hash_contents else None
+        self._store(filepath, stat, contains_injectables, content_hash)
+
+    def save(self):
+        """
+        Writes the cache to disk if it has changed since it was loaded.
+        """
+        with self._lock:
+            if not self._dirty:
+                return
+            os.makedirs(self.cache_dir, exist_ok=True)
+            temp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as file:
+                json.dump({"version": self.VERSION, "entries": self._entries}, file)
+            os.replace(temp_path, self.path)
+            self._dirty = False
+
+    def invalidate(self):
+        """
+        Discards all cached entries, both in memory and on disk.
+        """
+        with self._lock:
+            self._entries = {}
+            self._dirty = False
+            if os.path.exists(self.path):
+                os.remove(self.path)
+
+    def _get_entries(self) -> Dict[str, dict]:
+        if self._entries is None:
+            self._entries = self._read()
+        return self._entries
+
+    def _read(self) -> Dict[str, dict]:
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                cache = json.load(file)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(cache, dict) or cache.get("version") != self.VERSION:
+            return {}
+        return cache.get("entries", {})
+
+    def _store(
+        self,
+        filepath: str,
+        stat: os.stat_result,
+        contains_injectables: bool,
+        content_hash: Optional[str],
+    ):
+        entry = {
+            "size": stat.st_size,
+            "mtime": stat.st_mtime_ns,
+            "contains": contains_injectables,
+        }
+        if content_hash is not None:
+            entry["hash"] = content_hash
+        with self._lock:
+            self._get_entries()[filepath] = entry
+            self._dirty = True
+
+    def _count_hit(self):
+        with self._lock:
+            self.hits += 1
+
+    @staticmethod
+    def _hash(filepath: str) -> str:
+        digest = hashlib.blake2b(digest_size=16)
+        with open(filepath, "rb") as file:
+            for chunk in iter(lambda: file.read(1 << 16), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
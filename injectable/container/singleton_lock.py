@@ -0,0 +1,111 @@
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from injectable.errors.cyclic_dependency_error import CyclicDependencyError
+
+# Wait-for graph of the threads constructing singletons: which thread holds the
+# construction lock of each singleton and which singleton each thread waits for.
+# Singletons are keyed by identity as distinct injectables may compare equal.
+_graph_lock = threading.Lock()
+_owners: Dict[int, Tuple[int, object]] = {}
+_waiting: Dict[int, object] = {}
+_local = threading.local()
+# Async singletons being constructed by the current task and by the constructions it's
+# part of, as constructions run in tasks inheriting the context they're started from.
+_async_stack: ContextVar[Tuple[object, ...]] = ContextVar(
+    "injectable_async_constructions", default=()
+)
+
+
+@contextmanager
+def singleton_lock(injectable, lock: threading.Lock) -> Iterator[None]:
+    """
+    Holds the construction lock of a singleton injectable.
+
+    Raises :class:`CyclicDependencyError
+    <injectable.errors.CyclicDependencyError>` instead of blocking forever when the
+    singleton is already being constructed by the current thread or when waiting for it
+    would deadlock with other threads constructing singletons.
+    """
+    thread = threading.get_ident()
+    stack: List[object] = _construction_stack()
+    for index, constructing in enumerate(stack):
+        if constructing is injectable:
+            raise CyclicDependencyError(_names(stack[index:] + [injectable]))
+    with _graph_lock:
+        cycle = _find_cycle(injectable, thread)
+        if cycle is not None:
+            raise CyclicDependencyError(_names(stack + cycle))
+        _waiting[thread] = injectable
+    try:
+        lock.acquire()
+    finally:
+        with _graph_lock:
+            del _waiting[thread]
+    with _graph_lock:
+        _owners[id(injectable)] = (thread, injectable)
+    stack.append(injectable)
+    try:
+        yield
+    finally:
+        stack.pop()
+        with _graph_lock:
+            del _owners[id(injectable)]
+        lock.release()
+
+
+def check_async_construction(injectable):
+    """
+    Raises :class:`CyclicDependencyError <injectable.errors.CyclicDependencyError>`
+    when the async singleton is being constructed by the current task or by a
+    construction it's part of, in which case awaiting it would never finish.
+    """
+    stack = _async_stack.get()
+    for index, constructing in enumerate(stack):
+        if constructing is injectable:
+            raise CyclicDependencyError(_names([*stack[index:], injectable]))
+
+
+@contextmanager
+def async_construction(injectable) -> Iterator[None]:
+    """
+    Marks the async singleton as being constructed in the current context.
+    """
+    token = _async_stack.set((*_async_stack.get(), injectable))
+    try:
+        yield
+    finally:
+        _async_stack.reset(token)
+
+
+def _find_cycle(injectable, thread: int) -> Optional[List[object]]:
+    # follows the owners of the awaited locks until reaching the current thread
+    chain = []
+    owner = _owners.get(id(injectable))
+    while owner is not None:
+        owner_thread, held = owner
+        if owner_thread == thread:
+            return chain
+        chain.append(held)
+        awaited = _waiting.get(owner_thread)
+        if awaited is None:
+            return None
+        chain.append(awaited)
+        owner = _owners.get(id(awaited))
+    return None
+
+
+def _construction_stack() -> List[object]:
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    return stack
+
+
+def _names(injectables: List[object]) -> List[str]:
+    return [
+        getattr(injectable.constructor, "__qualname__", injectable.unique_id)
+        for injectable in injectables
+    ]
@@ -0,0 +1,343 @@
+import ast
+import builtins
+import inspect
+import os
+import sys
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, List, Optional, Set, Tuple
+
+from injectable.container.injectable_detection import (
+    DECORATOR_NAMES,
+    _is_injectable_module,
+)
+
+
+@dataclass(frozen=True)
+class StaticRegistration:
+    """
+    Registration of an injectable statically extracted from a module's source.
+
+    ``class_names`` holds the qualified names of the classes the injectable is to be
+    registered for, i.e. the decorated class, or the factory's dependency, followed by
+    the base classes which could be resolved statically.
+    """
+
+    name: str
+    kind: str
+    class_names: Tuple[str, ...] = ()
+    qualifier: Optional[str] = None
+    primary: bool = False
+    namespace: Optional[str] = None
+    group: Optional[str] = None
+    singleton: bool = False
+    scope: Optional[str] = None
+    init: Optional[str] = None
+    groups: Optional[Tuple[str, ...]] = None
+    is_async: bool = False
+
+
+@dataclass
+class _ModuleSummary:
+    classes: Dict[str, List[ast.expr]] = field(default_factory=dict)
+    imports: Dict[str, Tuple[str, int, Optional[str]]] = field(default_factory=dict)
+    decorated: List[Tuple[str, str, ast.expr, bool]] = field(default_factory=list)
+    async_functions: Set[str] = field(default_factory=set)
+    decorator_calls: int = 0
+    supported: bool = True
+
+
+def extract_registrations(
+    filepath: str, encoding: str = "utf-8"
+) -> Optional[List[StaticRegistration]]:
+    """
+    Statically extracts the registrations made by the ``injectable`` and
+    ``injectable_factory`` decorators in the file, without executing it.
+
+    Returns None when the registrations can't be fully determined statically, e.g.
+    when decorator arguments aren't literals, decorators are called directly or are
+    applied inside functions.
+    """
+    summary = _summarize(filepath, encoding)
+    if summary is None or not summary.supported:
+        return None
+    consumed_calls = sum(
+        1 for _, _, decorator, _ in summary.decorated if isinstance(decorator, ast.Call)
+    )
+    if consumed_calls != summary.decorator_calls:
+        return None
+    registrations = []
+    for qualname, decorator_name, decorator, is_class in summary.decorated:
+        registration = _extract_registration(
+            filepath, encoding, summary, qualname, decorator_name, decorator, is_class
+        )
+        if registration is None:
+            return None
+        registrations.append(registration)
+    return registrations
+
+
+def _extract_registration(
+    filepath: str,
+    encoding: str,
+    summary: _ModuleSummary,
+    qualname: str,
+    decorator_name: str,
+    decorator: ast.expr,
+    is_class: bool,
+) -> Optional[StaticRegistration]:
+    args: List[ast.expr] = []
+    kwargs = {}
+    if isinstance(decorator, ast.Call):
+        args = list(decorator.args)
+        for keyword in decorator.keywords:
+            if keyword.arg is None:
+                return None
+            if keyword.arg == "dependency":
+                args.insert(0, keyword.value)
+                continue
+            try:
+                kwargs[keyword.arg] = ast.literal_eval(keyword.value)
+            except ValueError:
+                return None
+    options = dict(
+        qualifier=kwargs.pop("qualifier", None),
+        primary=kwargs.pop("primary", False),
+        namespace=kwargs.pop("namespace", None),
+        group=kwargs.pop("group", None),
+        singleton=kwargs.pop("singleton", False),
+        scope=kwargs.pop("scope", None),
+        init=kwargs.pop("init", None),
+        groups=kwargs.pop("groups", None),
+    )
+    if kwargs or isinstance(options["groups"], str):
+        return None
+    if options["groups"] is not None:
+        options["groups"] = tuple(options["groups"])
+    if decorator_name == "injectable":
+        if not is_class or args:
+            return None
+        class_names = _resolve_lineage(filepath, encoding, summary, qualname)
+        return StaticRegistration(qualname, "class", class_names, **options)
+    if is_class or len(args) > 1:
+        return None
+    dependency = args[0] if args else None
+    if isinstance(dependency, ast.Constant) and dependency.value is None:
+        dependency = None
+    if dependency is None and not options["qualifier"]:
+        return None
+    class_names = ()
+    if dependency is not None:
+        class_names = _resolve_expr_lineage(filepath, encoding, summary, dependency)
+        if not class_names:
+            return None
+    is_async = qualname in summary.async_functions
+    return StaticRegistration(
+        qualname, "factory", class_names, is_async=is_async, **options
+    )
+
+
+def _resolve_lineage(
+    filepath: str, encoding: str, summary: _ModuleSummary, qualname: str
+) -> Tuple[str, ...]:
+    lineage = [qualname]
+    seen = {(filepath, qualname)}
+    for base in summary.classes.get(qualname, []):
+        _extend_lineage(
+            lineage, _resolve_expr_lineage(filepath, encoding, summary, base, seen)
+        )
+    _extend_lineage(lineage, ("object",))
+    return tuple(lineage)
+
+
+def _resolve_expr_lineage(
+    filepath: str,
+    encoding: str,
+    summary: _ModuleSummary,
+    expr: ast.expr,
+    seen: Set[Tuple[str, str]] = None,
+) -> Tuple[str, ...]:
+    seen = seen if seen is not None else set()
+    if isinstance(expr, ast.Subscript):
+        expr = expr.value
+    if isinstance(expr, ast.Name):
+        return _resolve_name_lineage(filepath, encoding, summary, expr.id, seen)
+    if isinstance(expr, ast.Attribute) and isinstance(expr.value, ast.Name):
+        imported = summary.imports.get(expr.value.id)
+        if imported is not None:
+            module, level, name = imported
+            module = f"{module}.{name}" if name and module else (name or module)
+            lineage = _resolve_imported_lineage(
+                filepath, encoding, module, level, expr.attr, seen
+            )
+            if lineage:
+                return lineage
+    if isinstance(expr, ast.Attribute):
+        return (expr.attr,)
+    return ()
+
+
+def _resolve_name_lineage(
+    filepath: str,
+    encoding: str,
+    summary: _ModuleSummary,
+    name: str,
+    seen: Set[Tuple[str, str]],
+) -> Tuple[str, ...]:
+    if name in summary.classes:
+        if (filepath, name) in seen:
+            return (name,)
+        seen.add((filepath, name))
+        lineage = [name]
+        for base in summary.classes[name]:
+            _extend_lineage(
+                lineage,
+                _resolve_expr_lineage(filepath, encoding, summary, base, seen),
+            )
+        return tuple(lineage)
+    if name in summary.imports:
+        module, level, imported_name = summary.imports[name]
+        if imported_name is not None:
+            lineage = _resolve_imported_lineage(
+                filepath, encoding, module, level, imported_name, seen
+            )
+            if lineage:
+                return lineage
+    builtin = getattr(builtins, name, None)
+    if inspect.isclass(builtin):
+        return tuple(klass.__qualname__ for klass in builtin.__mro__)
+    return (name,)
+
+
+def _resolve_imported_lineage(
+    filepath: str,
+    encoding: str,
+    module: str,
+    level: int,
+    name: str,
+    seen: Set[Tuple[str, str]],
+) -> Tuple[str, ...]:
+    if level == 0 and module in sys.modules:
+        klass = getattr(sys.modules[module], name, None)
+        if inspect.isclass(klass):
+            return tuple(base.__qualname__ for base in klass.__mro__)
+    module_filepath = _locate_module(module, level, filepath)
+    if module_filepath is None:
+        return ()
+    module_summary = _summarize(module_filepath, encoding)
+    if module_summary is None:
+        return ()
+    if name not in module_summary.classes and name not in module_summary.imports:
+        return ()
+    return _resolve_name_lineage(module_filepath, encoding, module_summary, name, seen)
+
+
+def _extend_lineage(lineage: List[str], names: Tuple[str, ...]):
+    for name in names:
+        if name not in lineage:
+            lineage.append(name)
+
+
+@lru_cache(maxsize=4096)
+def _locate_module(module: str, level: int, from_filepath: str) -> Optional[str]:
+    parts = module.split(".") if module else []
+    if level > 0:
+        base_dir = os.path.dirname(from_filepath)
+        for _ in range(level - 1):
+            base_dir = os.path.dirname(base_dir)
+        search_dirs = [base_dir]
+    else:
+        search_dirs = [entry or os.getcwd() for entry in sys.path]
+    for search_dir in search_dirs:
+        path = os.path.join(search_dir, *parts)
+        for candidate in (f"{path}.py", os.path.join(path, "__init__.py")):
+            if parts and os.path.isfile(candidate):
+                return os.path.abspath(candidate)
+        if not parts and os.path.isfile(os.path.join(path, "__init__.py")):
+            return os.path.abspath(os.path.join(path, "__init__.py"))
+    return None
+
+
+def _summarize(filepath: str, encoding: str) -> Optional[_ModuleSummary]:
+    try:
+        mtime = os.stat(filepath).st_mtime_ns
+    except OSError:
+        return None
+    return _summarize_cached(filepath, encoding, mtime)
+
+
+@lru_cache(maxsize=1024)
+def _summarize_cached(
+    filepath: str, encoding: str, mtime: int
+) -> Optional[_ModuleSummary]:
+    try:
+        with open(filepath, encoding=encoding) as file:
+            tree = ast.parse(file.read())
+    except (OSError, SyntaxError, ValueError):
+        return None
+    summary = _ModuleSummary()
+    aliases = {name: name for name in DECORATOR_NAMES}
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom):
+            for alias in node.names:
+                local_name = alias.asname or alias.name
+                summary.imports[local_name] = (
+                    node.module or "",
+                    node.level,
+                    alias.name,
+                )
+                if alias.name in DECORATOR_NAMES and _is_injectable_module(node.module):
+                    aliases[local_name] = alias.name
+        elif isinstance(node, ast.Import):
+            for alias in node.names:
+                local_name = alias.asname or alias.name.split(".")[0]
+                module = alias.name if alias.asname else local_name
+                summary.imports[local_name] = (module, 0, None)
+        elif isinstance(node, ast.Call) and _decorator_name(node.func, aliases):
+            summary.decorator_calls += 1
+    _visit(tree.body, "", False, summary, aliases)
+    return summary
+
+
+def _visit(
+    body: List[ast.stmt],
+    prefix: str,
+    in_function: bool,
+    summary: _ModuleSummary,
+    aliases: Dict[str, str],
+):
+    for node in body:
+        if isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+            qualname = f"{prefix}{node.name}"
+            is_class = isinstance(node, ast.ClassDef)
+            if isinstance(node, ast.AsyncFunctionDef):
+                summary.async_functions.add(qualname)
+            if is_class and not in_function:
+                summary.classes[qualname] = list(node.bases)
+            for decorator in node.decorator_list:
+                func = decorator.func if isinstance(decorator, ast.Call) else decorator
+                decorator_name = _decorator_name(func, aliases)
+                if decorator_name is None:
+                    continue
+                if in_function:
+                    summary.supported = False
+                summary.decorated.append(
+                    (qualname, decorator_name, decorator, is_class)
+                )
+            if is_class:
+                _visit(node.body, f"{qualname}.", in_function, summary, aliases)
+            else:
+                _visit(node.body, f"{qualname}.<locals>.", True, summary, aliases)
+            continue
+        for field_name in ("body", "orelse", "finalbody"):
+            _visit(getattr(node, field_name, []), prefix, in_function, summary, aliases)
+        for handler in getattr(node, "handlers", []):
+            _visit(handler.body, prefix, in_function, summary, aliases)
+
+
+def _decorator_name(node: ast.expr, aliases: Dict[str, str]) -> Optional[str]:
+    if isinstance(node, ast.Name):
+        return aliases.get(node.id)
+    if isinstance(node, ast.Attribute) and node.attr in DECORATOR_NAMES:
+        return node.attr
+    return None
@@ -0,0 +1,175 @@
+import inspect
+import time
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Dict, Iterable, List, Optional, Set
+
+from injectable.constants import DEFAULT_NAMESPACE, Init
+from injectable.container.deferred_constructor import DeferredConstructor
+from injectable.container.injectable import Injectable
+from injectable.container.injection_container import InjectionContainer
+from injectable.injection.inject import _resolve_injectables
+
+
+def warm_up(
+    namespace: str = None,
+    *,
+    group: str = None,
+    max_workers: int = None,
+) -> Dict[str, float]:
+    """
+    Constructs the registered singletons not constructed yet so that the first
+    injections don't pay for it.
+
+    Singletons are constructed in parallel in a thread pool, each one only after the
+    singletons it depends on through :meth:`@autowired <injectable.autowired>`
+    parameters of its constructor are constructed, including those it depends on
+    through transient injectables. Singletons with async factories aren't constructed
+    as they must be constructed in the event loop they'll be used with.
+
+    If any construction fails the error is raised once the constructions already
+    started finish and no other construction is started.
+
+    :param namespace: (optional) namespace whose singletons are constructed. Defaults to
+            None, i.e. all namespaces.
+    :param group: (optional) group of the singletons to construct. Defaults to None,
+            i.e. all groups.
+    :param max_workers: (optional) maximum number of threads constructing singletons.
+            Defaults to the :class:`ThreadPoolExecutor
+            <concurrent.futures.ThreadPoolExecutor>` default.
+    :return: the seconds spent constructing each singleton, by unique id, in the order
+            in which they finished.
+
+    Usage::
+
+      >>> from injectable import load_injection_container, warm_up
+      >>> load_injection_container()
+      >>> warm_up()
+
+    .. versionadded:: 4.1.0
+    """
+    singletons = _select_singletons(namespace, group)
+    dependents: Dict[Injectable, List[Injectable]] = defaultdict(list)
+    pending_dependencies: Dict[Injectable, int] = {}
+    for singleton in singletons:
+        dependencies = _singleton_dependencies(singleton, singletons)
+        pending_dependencies[singleton] = len(dependencies)
+        for dependency in dependencies:
+            dependents[dependency].append(singleton)
+
+    construction_times: Dict[str, float] = {}
+    with ThreadPoolExecutor(max_workers, "injectable-warm-up") as executor:
+        futures: Dict[Future, Injectable] = {
+            executor.submit(_construct, singleton): singleton
+            for singleton in singletons
+            if pending_dependencies[singleton] == 0
+        }
+        try:
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    singleton = futures.pop(future)
+                    construction_times[singleton.unique_id] = future.result()
+                    for dependent in dependents[singleton]:
+                        pending_dependencies[dependent] -= 1
+                        if pending_dependencies[dependent] == 0:
+                            futures[executor.submit(_construct, dependent)] = dependent
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+    # singletons left depend on each other, constructing them raises the cycle
+    for singleton in singletons:
+        if singleton.unique_id not in construction_times:
+            construction_times[singleton.unique_id] = _construct(singleton)
+    return construction_times
+
+
+def start_background_constructions() -> List[Injectable]:
+    """
+    Starts the background constructions of the registered singletons declared with
+    the :attr:`BACKGROUND <injectable.constants.Init.BACKGROUND>` init, returning the
+    singletons whose constructions were started.
+    """
+    return [
+        singleton
+        for singleton in _registered_injectables(None)
+        if singleton.init is Init.BACKGROUND
+        and singleton.start_background_construction()
+    ]
+
+
+def _select_singletons(namespace: Optional[str], group: Optional[str]) -> List:
+    return [
+        injectable
+        for injectable in _registered_injectables(namespace)
+        if injectable.singleton
+        and not injectable.singleton_constructed
+        and not injectable.is_async
+        and (group is None or group in injectable.groups)
+    ]
+
+
+def _registered_injectables(namespace: Optional[str]) -> List[Injectable]:
+    namespaces = (
+        [InjectionContainer.NAMESPACES.get(namespace)]
+        if namespace is not None
+        else list(InjectionContainer.NAMESPACES.values())
+    )
+    injectables: Dict[Injectable, None] = {}
+    for namespace_entry in namespaces:
+        if namespace_entry is None:
+            continue
+        for registry in (
+            namespace_entry.type_registry,
+            namespace_entry.class_registry,
+            namespace_entry.qualifier_registry,
+        ):
+            for registered in registry.values():
+                injectables.update(dict.fromkeys(registered))
+    return list(injectables)
+
+
+def _singleton_dependencies(
+    singleton: Injectable, singletons: Iterable[Injectable]
+) -> Set[Injectable]:
+    candidates = set(singletons)
+    dependencies = set()
+    visited = {singleton}
+    stack = [singleton]
+    while stack:
+        for dependency in _direct_dependencies(stack.pop()):
+            if dependency in visited:
+                continue
+            visited.add(dependency)
+            if dependency.singleton:
+                if dependency in candidates:
+                    dependencies.add(dependency)
+                # its own dependencies are ordered when it's constructed
+                continue
+            stack.append(dependency)
+    return dependencies
+
+
+def _direct_dependencies(injectable: Injectable) -> Iterable[Injectable]:
+    constructor = injectable.constructor
+    if isinstance(constructor, DeferredConstructor):
+        constructor = constructor.target
+    if inspect.isclass(constructor):
+        constructor = constructor.__init__
+    for parameter in getattr(constructor, "__injection_plan__", ()):
+        annotation = parameter.annotation
+        if annotation.lazy or annotation.dependency is None:
+            continue
+        yield from _resolve_injectables(
+            annotation.dependency,
+            annotation.namespace or DEFAULT_NAMESPACE,
+            annotation.group,
+            annotation.exclude_groups,
+        )
+
+
+def _construct(singleton: Injectable) -> float:
+    start = time.perf_counter()
+    singleton.get_instance()
+    return time.perf_counter() - start
@@ -3,9 +3,15 @@ Custom exceptions raised by injectable.
 """
 
 from injectable.errors.autowiring_error import AutowiringError
+from injectable.errors.cyclic_dependency_error import CyclicDependencyError
+from injectable.errors.frozen_container_error import FrozenContainerError
+from injectable.errors.injectable_load_error import InjectableLoadError
 from injectable.errors.injection_error import InjectionError
 
 __all__ = [
     "AutowiringError",
+    "CyclicDependencyError",
+    "FrozenContainerError",
+    "InjectableLoadError",
     "InjectionError",
 ]
@@ -0,0 +1,16 @@
+from typing import Sequence
+
+
+class CyclicDependencyError(RuntimeError):
+    """
+    Error indicating singletons depend on each other cyclically, either within a same
+    thread or across threads which would otherwise deadlock constructing them.
+
+    .. versionadded:: 4.1.0
+    """
+
+    def __init__(self, chain: Sequence[str]):
+        self.chain = list(chain)
+        super().__init__(
+            "Cyclic dependency between singletons: " + " -> ".join(self.chain)
+        )
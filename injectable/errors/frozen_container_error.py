@@ -0,0 +1,12 @@
+class FrozenContainerError(RuntimeError):
+    """
+    Error indicating an attempt to change the injectables registered in the injection
+    container after it was frozen.
+
+    .. versionadded:: 4.1.0
+    """
+
+    def __init__(self, namespace: str = None):
+        self.namespace = namespace
+        target = f"namespace '{namespace}'" if namespace else "injection container"
+        super().__init__(f"Cannot register nor clear injectables in frozen {target}")
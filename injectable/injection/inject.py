@@ -1,6 +1,9 @@
-from typing import TypeVar, Union, Type, List, Sequence
+import asyncio
+from typing import Optional, TypeVar, Union, Type, List, Sequence, Tuple
 
 from injectable.common_utils import get_dependency_name
+from injectable.container.injectable import Injectable
+from injectable.container.injection_container import InjectionContainer
 from injectable.errors import InjectionError
 from injectable.constants import DEFAULT_NAMESPACE
 from injectable.injection.injection_utils import (
@@ -8,6 +11,8 @@ from injectable.injection.injection_utils import (
     filter_by_group,
     resolve_single_injectable,
     get_dependency_registry_type,
+    resolve_cached,
+    get_frozen_entry,
 )
 
 T = TypeVar("T")
@@ -71,23 +76,21 @@ def inject(
       >>> class Bar:
       ...     def __init__(self, foo: Foo = None):
       ...         self.foo = foo or inject(Foo)
+
+    .. versionchanged:: 4.1.0
+       Resolutions are cached until injectables are registered or cleared in the
+       namespace, and are looked up in precomputed tables once the injection container
+       is frozen.
     """
-    dependency_name = get_dependency_name(dependency)
-    registry_type = get_dependency_registry_type(dependency)
-    matches = get_namespace_injectables(
-        dependency_name, registry_type, namespace or DEFAULT_NAMESPACE
-    )
-    if not matches:
+    namespace = namespace or DEFAULT_NAMESPACE
+    injectable = _lookup_injectable(dependency, namespace, group, exclude_groups)
+    if injectable is None:
         if not optional:
-            raise InjectionError(registry_type.value, dependency_name)
+            raise InjectionError(
+                get_dependency_registry_type(dependency).value,
+                get_dependency_name(dependency),
+            )
         return None
-    if group is not None or exclude_groups is not None:
-        matches = filter_by_group(matches, group, exclude_groups)
-        if not matches:
-            if not optional:
-                raise InjectionError(registry_type.value, dependency_name)
-            return None
-    injectable = resolve_single_injectable(dependency_name, registry_type, matches)
     return injectable.get_instance(lazy=lazy)
 
 
@@ -144,24 +147,224 @@ def inject_multiple(
       >>> class Foo:
       ...     def __init__(self, services: Sequence[AbstractService] = None):
       ...         self.services = services or inject_multiple(AbstractService)
+
+    .. versionchanged:: 4.1.0
+       Resolutions are cached until injectables are registered or cleared in the
+       namespace, and are looked up in precomputed tables once the injection container
+       is frozen.
+    """
+    namespace = namespace or DEFAULT_NAMESPACE
+    matches = _lookup_injectables(dependency, namespace, group, exclude_groups)
+    if not matches:
+        if not optional:
+            raise InjectionError(
+                get_dependency_registry_type(dependency).value,
+                get_dependency_name(dependency),
+            )
+        return []
+    return [inj.get_instance(lazy=lazy) for inj in matches]
+
+
+async def ainject(
+    dependency: Union[Type[T], str],
+    *,
+    namespace: str = None,
+    group: str = None,
+    exclude_groups: Sequence[str] = None,
+    optional: bool = False,
+    in_executor: bool = False,
+) -> T:
+    """
+    Awaitable counterpart of :meth:`inject <injectable.inject>` which also injects
+    dependencies provided by async factories, awaiting their construction.
+
+    Concurrent injections of a singleton which wasn't constructed yet await a single
+    construction of it. Injectables with regular constructors are instantiated as
+    they would be by :meth:`inject <injectable.inject>`.
+
+    :param dependency: class, base class or qualifier of the dependency to be used for
+            lookup among the registered injectables.
+    :param namespace: (optional) namespace in which to look for the dependency. Defaults
+            to :const:`injectable.constants.DEFAULT_NAMESPACE`.
+    :param group: (optional) group to filter out other injectables outside of this
+            group. Defaults to None.
+    :param exclude_groups: (optional) list of groups to be excluded. Defaults to None.
+    :param optional: (optional) when True this function returns None if no injectable
+            matches the qualifier/class and group inside the specified namespace instead
+            of raising an :class:`InjectionError <injectable.errors.InjectionError>`.
+            Defaults to False.
+    :param in_executor: (optional) when True a regular constructor is run in the event
+            loop's default executor instead of blocking the loop. Defaults to False.
+
+    Usage::
+
+      >>> from foo import Foo
+      >>> from injectable import ainject
+      >>>
+      >>> async def main():
+      ...     foo = await ainject(Foo)
+
+    .. versionadded:: 4.1.0
     """
+    namespace = namespace or DEFAULT_NAMESPACE
+    injectable = _lookup_injectable(dependency, namespace, group, exclude_groups)
+    if injectable is None:
+        if not optional:
+            raise InjectionError(
+                get_dependency_registry_type(dependency).value,
+                get_dependency_name(dependency),
+            )
+        return None
+    return await injectable.aget_instance(in_executor=in_executor)
+
+
+async def ainject_multiple(
+    dependency: Union[Type[T], str],
+    *,
+    namespace: str = None,
+    group: str = None,
+    exclude_groups: Sequence[str] = None,
+    optional: bool = False,
+    in_executor: bool = False,
+) -> List[T]:
+    """
+    Awaitable counterpart of :meth:`inject_multiple <injectable.inject_multiple>` which
+    also injects dependencies provided by async factories. Instances are constructed
+    concurrently.
+
+    :param dependency: class, base class or qualifier of the dependency to be used for
+            lookup among the registered injectables.
+    :param namespace: (optional) namespace in which to look for the dependency. Defaults
+            to :const:`injectable.constants.DEFAULT_NAMESPACE`.
+    :param group: (optional) group to filter out other injectables outside of this
+            group. Defaults to None.
+    :param exclude_groups: (optional) list of groups to be excluded. Defaults to None.
+    :param optional: (optional) when True this function returns an empty list if no
+            injectable matches the qualifier/class and group inside the specified
+            namespace. Defaults to False.
+    :param in_executor: (optional) when True regular constructors are run in the event
+            loop's default executor instead of blocking the loop. Defaults to False.
+
+    .. versionadded:: 4.1.0
+    """
+    namespace = namespace or DEFAULT_NAMESPACE
+    matches = _lookup_injectables(dependency, namespace, group, exclude_groups)
+    if not matches:
+        if not optional:
+            raise InjectionError(
+                get_dependency_registry_type(dependency).value,
+                get_dependency_name(dependency),
+            )
+        return []
+    return list(
+        await asyncio.gather(
+            *(inj.aget_instance(in_executor=in_executor) for inj in matches)
+        )
+    )
+
+
+def _lookup_injectable(
+    dependency: Union[Type[T], str],
+    namespace: str,
+    group: Optional[str],
+    exclude_groups: Optional[Sequence[str]],
+) -> Optional[Injectable]:
+    # checked before anything else so unfrozen lookups go straight to the cache
+    namespace_entry = InjectionContainer.NAMESPACES.get(namespace)
+    if (
+        namespace_entry is not None
+        and namespace_entry.frozen
+        and exclude_groups is None
+    ):
+        dependency_name = get_dependency_name(dependency)
+        registry_type = get_dependency_registry_type(dependency)
+        entry = get_frozen_entry(
+            dependency_name, registry_type, namespace, group, dependency
+        )
+        if entry is not None:
+            if entry.resolved is None and entry.injectables:
+                raise InjectionError(
+                    registry_type.value, dependency_name, set(entry.injectables)
+                )
+            return entry.resolved
+    key = (dependency, group, _groups_key(exclude_groups), False)
+    return resolve_cached(
+        namespace,
+        key,
+        _resolve_injectable,
+        dependency,
+        namespace,
+        group,
+        exclude_groups,
+    )
+
+
+def _lookup_injectables(
+    dependency: Union[Type[T], str],
+    namespace: str,
+    group: Optional[str],
+    exclude_groups: Optional[Sequence[str]],
+) -> Tuple[Injectable, ...]:
+    namespace_entry = InjectionContainer.NAMESPACES.get(namespace)
+    if (
+        namespace_entry is not None
+        and namespace_entry.frozen
+        and exclude_groups is None
+    ):
+        entry = get_frozen_entry(
+            get_dependency_name(dependency),
+            get_dependency_registry_type(dependency),
+            namespace,
+            group,
+            dependency,
+        )
+        if entry is not None:
+            return entry.injectables
+    key = (dependency, group, _groups_key(exclude_groups), True)
+    return resolve_cached(
+        namespace,
+        key,
+        _resolve_injectables,
+        dependency,
+        namespace,
+        group,
+        exclude_groups,
+    )
+
+
+def _resolve_injectable(
+    dependency: Union[Type[T], str],
+    namespace: str,
+    group: Optional[str],
+    exclude_groups: Optional[Sequence[str]],
+) -> Optional[Injectable]:
+    matches = _resolve_injectables(dependency, namespace, group, exclude_groups)
+    if not matches:
+        return None
+    return resolve_single_injectable(
+        get_dependency_name(dependency),
+        get_dependency_registry_type(dependency),
+        set(matches),
+    )
+
+
+def _resolve_injectables(
+    dependency: Union[Type[T], str],
+    namespace: str,
+    group: Optional[str],
+    exclude_groups: Optional[Sequence[str]],
+) -> Tuple[Injectable, ...]:
     dependency_name = get_dependency_name(dependency)
     registry_type = get_dependency_registry_type(dependency)
     matches = get_namespace_injectables(
-        dependency_name, registry_type, namespace or DEFAULT_NAMESPACE
+        dependency_name, registry_type, namespace, dependency
     )
     if not matches:
-        if not optional:
-            raise InjectionError(registry_type.value, dependency_name)
-        return []
+        return ()
     if group is not None or exclude_groups is not None:
-        matches = filter_by_group(
-            matches,
-            group,
-            exclude_groups,
-        )
-        if not matches:
-            if not optional:
-                raise InjectionError(registry_type.value, dependency_name)
-            return []
-    return [inj.get_instance(lazy=lazy) for inj in matches]
+        matches = filter_by_group(matches, group, exclude_groups, namespace=namespace)
+    return tuple(matches)
+
+
+def _groups_key(groups: Optional[Sequence[str]]) -> Optional[Tuple[str, ...]]:
+    return tuple(groups) if groups is not None else None
@@ -1,7 +1,14 @@
-from typing import TypeVar
+from functools import partial
+from typing import Iterable, TypeVar, Optional
 
+from injectable.constants import Init, Scope
 from injectable.container.injection_container import InjectionContainer
 from injectable.common_utils import get_caller_filepath
+from injectable.injection.injection_utils import (
+    validate_groups,
+    validate_init,
+    validate_scope,
+)
 
 T = TypeVar("T")
 
@@ -14,6 +21,9 @@ def injectable(
     namespace: str = None,
     group: str = None,
     singleton: bool = False,
+    scope: Optional[Scope] = None,
+    init: Optional[Init] = None,
+    groups: Iterable[str] = None,
 ) -> T:
     """
     Class decorator to mark it as an injectable dependency.
@@ -37,6 +47,22 @@ def injectable(
     :param group: (optional) group to be assigned to the injectable. Defaults to None.
     :param singleton: (optional) when True the injectable will be a singleton, i.e. only
             one instance of it will be created and shared globally. Defaults to False.
+    :param scope: (optional) :class:`Scope <injectable.constants.Scope>` in which a
+            single instance is reused, i.e. ``"thread"`` for one instance per thread,
+            ``"task"`` for one instance per asyncio task or ``"injection_scope"`` for
+            one instance per :meth:`injection_scope <injectable.injection_scope>`
+            block. Instances are released when their thread, task or block ends.
+            Cannot be used along with ``singleton``. Defaults to None.
+    :param init: (optional) :class:`Init <injectable.constants.Init>` moment in which
+            a singleton is constructed other than on its first injection, i.e.
+            ``"background"`` to start constructing it in a background thread once
+            :meth:`load_injection_container <injectable.load_injection_container>`
+            finishes loading. Injections block only while the construction is
+            unfinished, or return immediately when ``lazy``, and errors raised by the
+            construction are raised by the first injection. Defaults to None.
+    :param groups: (optional) additional groups to be assigned to the injectable, which
+            belongs to each of them as well as to ``group``, e.g. to tag it with both
+            a region and a tenant. Defaults to None.
 
     Usage::
 
@@ -45,15 +71,35 @@ def injectable(
       >>> @injectable
       ... class Foo:
       ...     ...
+
+    .. versionchanged:: 4.1.0
+       Added the ``scope``, ``init`` and ``groups`` parameters.
     """
+    validate_scope(scope, singleton)
+    validate_init(init, singleton)
+    groups = validate_groups(groups)
 
     def decorator(klass: T, direct_call: bool = False) -> T:
         steps_back = 3 if direct_call else 2
         caller_filepath = get_caller_filepath(steps_back)
+        registration = partial(
+            InjectionContainer._register_injectable,
+            klass,
+            caller_filepath,
+            qualifier,
+            primary,
+            namespace,
+            group,
+            singleton,
+            scope,
+            init,
+            groups,
+        )
+        InjectionContainer._record_decoration(
+            caller_filepath, klass.__qualname__, registration
+        )
         if caller_filepath == InjectionContainer.LOADING_FILEPATH:
-            InjectionContainer._register_injectable(
-                klass, caller_filepath, qualifier, primary, namespace, group, singleton
-            )
+            registration()
         return klass
 
     return decorator(cls, True) if cls is not None else decorator
@@ -1,8 +1,15 @@
-from typing import TypeVar, Callable
+from functools import partial
+from typing import Iterable, TypeVar, Callable, Optional
 
+from injectable.constants import Init, Scope
 from injectable.container.injection_container import InjectionContainer
 from injectable.errors.injectable_load_error import InjectableLoadError
 from injectable.common_utils import get_caller_filepath
+from injectable.injection.injection_utils import (
+    validate_groups,
+    validate_init,
+    validate_scope,
+)
 
 T = TypeVar("T")
 
@@ -15,6 +22,9 @@ def injectable_factory(
     namespace: str = None,
     group: str = None,
     singleton: bool = False,
+    scope: Optional[Scope] = None,
+    init: Optional[Init] = None,
+    groups: Iterable[str] = None,
 ) -> Callable[..., Callable[..., T]]:
     """
     Function decorator to mark it as a injectable factory for the dependency.
@@ -44,6 +54,22 @@ def injectable_factory(
     :param singleton: (optional) when True the factory will be used to instantiate a
             singleton, i.e. only one call to the factory will be made and the created
             instance will be shared globally. Defaults to False.
+    :param scope: (optional) :class:`Scope <injectable.constants.Scope>` in which a
+            single instance is reused, i.e. ``"thread"`` for one instance per thread,
+            ``"task"`` for one instance per asyncio task or ``"injection_scope"`` for
+            one instance per :meth:`injection_scope <injectable.injection_scope>`
+            block. Instances are released when their thread, task or block ends.
+            Cannot be used along with ``singleton``. Defaults to None.
+    :param init: (optional) :class:`Init <injectable.constants.Init>` moment in which
+            a singleton is constructed other than on its first injection, i.e.
+            ``"background"`` to start constructing it in a background thread once
+            :meth:`load_injection_container <injectable.load_injection_container>`
+            finishes loading. Injections block only while the construction is
+            unfinished, or return immediately when ``lazy``, and errors raised by the
+            construction are raised by the first injection. Defaults to None.
+    :param groups: (optional) additional groups to be assigned to the injectable, which
+            belongs to each of them as well as to ``group``, e.g. to tag it with both
+            a region and a tenant. Defaults to None.
 
     Usage::
 
@@ -53,24 +79,43 @@ def injectable_factory(
       >>> @injectable_factory(Foo)
       ... def foo_factory() -> Foo:
       ...     return Foo(...)
+
+    .. versionchanged:: 4.1.0
+       Async factories are supported, their dependencies being injected with
+       :meth:`ainject <injectable.ainject>` or
+       :meth:`ainject_multiple <injectable.ainject_multiple>`.
+
+    .. versionchanged:: 4.1.0
+       Added the ``scope``, ``init`` and ``groups`` parameters.
     """
 
     if not dependency and not qualifier:
         raise InjectableLoadError("No dependency class nor a qualifier were specified")
+    validate_scope(scope, singleton)
+    validate_init(init, singleton)
+    groups = validate_groups(groups)
 
     def decorator(fn: Callable[..., T]) -> Callable[..., T]:
         caller_filepath = get_caller_filepath()
+        registration = partial(
+            InjectionContainer._register_factory,
+            fn,
+            caller_filepath,
+            dependency,
+            qualifier,
+            primary,
+            namespace,
+            group,
+            singleton,
+            scope,
+            init,
+            groups,
+        )
+        InjectionContainer._record_decoration(
+            caller_filepath, fn.__qualname__, registration
+        )
         if caller_filepath == InjectionContainer.LOADING_FILEPATH:
-            InjectionContainer._register_factory(
-                fn,
-                caller_filepath,
-                dependency,
-                qualifier,
-                primary,
-                namespace,
-                group,
-                singleton,
-            )
+            registration()
         return fn
 
     return decorator
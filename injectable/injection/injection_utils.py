@@ -1,12 +1,30 @@
 import logging
 from enum import Enum
-from typing import Sequence, Set, Union, Type, TypeVar
+from typing import (
+    Callable,
+    Collection,
+    Hashable,
+    Iterable,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+    Type,
+    TypeVar,
+)
 
 from injectable.container.injection_container import InjectionContainer
 from injectable.container.injectable import Injectable
-from injectable.errors import InjectionError
+from injectable.container.namespace import EMPTY_ENTRY, FrozenEntry
+from injectable.constants import Init, Scope
+from injectable.errors import InjectableLoadError, InjectionError
 
 T = TypeVar("T")
+R = TypeVar("R")
+
+#: Number of resolutions cached per namespace above which the cache is cleared
+RESOLUTION_CACHE_MAX_SIZE = 4096
 
 
 class RegistryType(Enum):
@@ -19,7 +37,10 @@ def get_dependency_registry_type(dependency: Union[Type[T], str]) -> RegistryTyp
 
 
 def get_namespace_injectables(
-    dependency_name: str, registry_type: RegistryType, namespace: str
+    dependency_name: str,
+    registry_type: RegistryType,
+    namespace: str,
+    dependency: Optional[type] = None,
 ) -> Set[Injectable]:
     if len(InjectionContainer.NAMESPACES) == 0:
         logging.warning(
@@ -29,25 +50,64 @@ def get_namespace_injectables(
     injection_namespace = InjectionContainer.NAMESPACES.get(namespace)
     if not injection_namespace:
         return set()
-    registry = (
-        injection_namespace.class_registry
-        if registry_type is RegistryType.CLASS
-        else injection_namespace.qualifier_registry
-    )
-    injectables = registry.get(dependency_name)
-    return injectables
+    if registry_type is RegistryType.QUALIFIER:
+        return injection_namespace.qualifier_registry.get(dependency_name)
+    if isinstance(dependency, type):
+        return injection_namespace.get_class_injectables(dependency, dependency_name)
+    return injection_namespace.get_named_injectables(dependency_name)
+
+
+def get_frozen_entry(
+    dependency_name: str,
+    registry_type: RegistryType,
+    namespace: str,
+    group: Optional[str] = None,
+    dependency: Optional[type] = None,
+) -> Optional[FrozenEntry]:
+    """
+    Returns the entry of the dependency, restricted to the group when given, when the
+    namespace is frozen, or None when it isn't.
+    """
+    namespace_entry = InjectionContainer.NAMESPACES.get(namespace)
+    if namespace_entry is None or not namespace_entry.frozen:
+        return None
+    if registry_type is RegistryType.QUALIFIER:
+        entry = namespace_entry.frozen_qualifier_registry.get(
+            dependency_name, EMPTY_ENTRY
+        )
+    else:
+        entry = namespace_entry.frozen_type_registry.get(dependency)
+        if entry is None and isinstance(dependency, type):
+            type_name = namespace_entry.find_type_name(dependency)
+            if type_name is not None:
+                entry = namespace_entry.frozen_class_registry.get(type_name)
+        if entry is None:
+            entry = namespace_entry.frozen_class_registry.get(
+                dependency_name, EMPTY_ENTRY
+            )
+    if group is not None:
+        return entry.groups.get(group, EMPTY_ENTRY)
+    return entry
 
 
 def filter_by_group(
-    matches: Set[Injectable],
+    matches: Collection[Injectable],
     group: str = None,
     exclude_groups: Sequence[str] = None,
-) -> Set[Injectable]:
+    namespace: str = None,
+) -> Collection[Injectable]:
+    """
+    Returns the injectables belonging to the group, when given, and to none of the
+    excluded groups, using the group bits of the namespace when given.
+    """
+    namespace_entry = InjectionContainer.NAMESPACES.get(namespace)
+    if namespace_entry is not None:
+        return namespace_entry.filter_by_groups(matches, group, exclude_groups)
     exclude = exclude_groups or []
     matches = {
         inj
         for inj in matches
-        if (group is None or inj.group == group) and inj.group not in exclude
+        if (group is None or group in inj.groups) and inj.groups.isdisjoint(exclude)
     }
     return matches
 
@@ -63,3 +123,69 @@ def resolve_single_injectable(
     if len(primary_matches) != 1:
         raise InjectionError(registry_type.value, dependency_name, matches)
     return primary_matches[0]
+
+
+def resolve_cached(
+    namespace: str, key: Hashable, resolver: Callable[..., R], *args
+) -> R:
+    """
+    Returns the resolution cached for the key in the namespace, calling the resolver
+    with the given arguments to resolve it when not cached or when cached for an older
+    generation of the namespace registries. Resolutions are cached only when the
+    resolver returns, errors are raised again on every call.
+    """
+    namespace_entry = InjectionContainer.NAMESPACES.get(namespace)
+    if namespace_entry is None:
+        return resolver(*args)
+    generation = namespace_entry.generation
+    cache = namespace_entry.resolution_cache
+    try:
+        cached = cache.get(key)
+    except TypeError:  # unhashable dependency
+        return resolver(*args)
+    if cached is not None and cached[0] == generation:
+        return cached[1]
+    resolution = resolver(*args)
+    if len(cache) >= RESOLUTION_CACHE_MAX_SIZE:
+        cache.clear()
+    cache[key] = (generation, resolution)
+    return resolution
+
+
+def validate_scope(scope: Optional[Scope], singleton: bool):
+    if scope is None:
+        return
+    if singleton:
+        raise InjectableLoadError("A singleton injectable cannot have a scope")
+    try:
+        Scope(scope)
+    except ValueError:
+        raise InjectableLoadError(f"Unknown injectable scope '{scope}'") from None
+
+
+def validate_init(init: Optional[Init], singleton: bool):
+    if init is None:
+        return
+    if not singleton:
+        raise InjectableLoadError("Only singleton injectables can have an init")
+    try:
+        Init(init)
+    except ValueError:
+        raise InjectableLoadError(f"Unknown singleton init '{init}'") from None
+
+
+def validate_groups(groups: Optional[Iterable[str]]) -> Optional[Tuple[str, ...]]:
+    """
+    Returns the groups as a tuple, iterating them only once so that they can be given
+    as any iterable, raising an
+    :class:`InjectableLoadError <injectable.errors.InjectableLoadError>` when they
+    aren't a collection of group names.
+    """
+    if groups is None:
+        return None
+    if isinstance(groups, str):
+        raise InjectableLoadError("Groups must be given as a collection of group names")
+    groups = tuple(groups)
+    if not all(isinstance(group, str) for group in groups):
+        raise InjectableLoadError("Groups must be given as a collection of group names")
+    return groups
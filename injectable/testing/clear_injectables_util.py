@@ -3,7 +3,9 @@ from typing import Union, Set
 from injectable import InjectionContainer
 from injectable.common_utils import get_dependency_name
 from injectable.container.injectable import Injectable
+from injectable.container.namespace import Namespace
 from injectable.constants import DEFAULT_NAMESPACE
+from injectable.errors import FrozenContainerError
 
 
 def clear_injectables(
@@ -13,6 +15,11 @@ def clear_injectables(
     Utility function to clear all injectables registered for the dependency in a given
     namespace. Returns a set containing all cleared injectables.
 
+    Injectables registered for copies of the class, e.g. registered from its module
+    executed again when loading the injection container, are cleared as well, but not
+    those registered for classes of same qualified name declared in other modules.
+    Raises a :class:`KeyError` when nothing is registered for the dependency.
+
     :param dependency: class or qualifier of the dependency.
     :param namespace: (optional) namespace in which the injectable will be registered.
             Defaults to :const:`injectable.constants.DEFAULT_NAMESPACE`.
@@ -24,12 +31,47 @@ def clear_injectables(
 
     .. versionadded:: 3.3.0
     """
+    if InjectionContainer.FROZEN:
+        raise FrozenContainerError()
     namespace = InjectionContainer.NAMESPACES[namespace or DEFAULT_NAMESPACE]
     if isinstance(dependency, str):
         injectables = namespace.qualifier_registry[dependency]
         namespace.qualifier_registry[dependency] = set()
     else:
-        dependency_name = get_dependency_name(dependency)
-        injectables = namespace.class_registry[dependency_name]
-        namespace.class_registry[dependency_name] = set()
+        # copies of the class, e.g. registered from its module executed with runpy,
+        # share its module and qualified name
+        type_name = namespace.find_type_name(dependency)
+        if type_name is not None:
+            types = namespace.type_names.pop(type_name)
+            type_names = namespace.qualified_type_names[dependency.__qualname__]
+            type_names.remove(type_name)
+            if not type_names:
+                del namespace.qualified_type_names[dependency.__qualname__]
+            injectables = set().union(
+                *(namespace.type_registry.pop(klass) for klass in types)
+            )
+        else:
+            # registered only by name, e.g. from statically extracted registrations
+            injectables = namespace.class_registry.pop(get_dependency_name(dependency))
+    _drop_group_masks(namespace, injectables)
+    namespace.invalidate_resolutions()
     return injectables
+
+
+def _drop_group_masks(namespace: Namespace, injectables: Set[Injectable]):
+    masked = {
+        injectable.unique_id
+        for injectable in injectables
+        if injectable.unique_id in namespace.group_masks
+    }
+    if not masked:
+        return
+    for registry in (
+        namespace.type_registry,
+        namespace.class_registry,
+        namespace.qualifier_registry,
+    ):
+        for registered in registry.values():
+            masked.difference_update(injectable.unique_id for injectable in registered)
+    for unique_id in masked:
+        del namespace.group_masks[unique_id]
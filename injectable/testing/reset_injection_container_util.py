@@ -1,10 +1,12 @@
 from injectable import InjectionContainer
+from injectable.container.injectable_detection import DetectionStats
 
 
 def reset_injection_container():
     """
     Utility function to reset the injection container, clearing all injectables
-    registered from all namespaces and reseting the record for already scanned files.
+    registered from all namespaces and reseting the record for already scanned files
+    and decorated injectables.
 
     Usage::
 
@@ -14,6 +16,10 @@ def reset_injection_container():
     .. versionadded:: 3.4.0
     """
     InjectionContainer.NAMESPACES = {}
+    InjectionContainer.FROZEN = False
     InjectionContainer.LOADED_FILEPATHS = set()
     InjectionContainer.LOADING_DEFAULT_NAMESPACE = None
     InjectionContainer.LOADING_FILEPATH = None
+    InjectionContainer.LOADING_COPY = False
+    InjectionContainer.DECORATIONS = {}
+    InjectionContainer.DETECTION_STATS = DetectionStats()
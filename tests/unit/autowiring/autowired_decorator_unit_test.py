@@ -1,10 +1,14 @@
+import asyncio
+import inspect
+import threading
 from typing import Annotated, Optional
 from unittest.mock import MagicMock
 
 import pytest
-from injectable import autowired, Autowired
+from injectable import autowired, Autowired, Injectable, injection_scope
 from injectable.autowiring.autowired_type import _Autowired
 from injectable.errors import AutowiringError, InjectionError
+from injectable.testing import register_injectables, reset_injection_container
 from pytest_mock import MockFixture
 
 
@@ -289,6 +293,166 @@ class TestAutowiredDecorator:
         assert parameters["b"] is None
         assert parameters["c"] is AutowiredMockC.inject()
 
+    def test__autowired__with_positional_only_args_supplied_by_the_caller(self):
+        # given
+        AutowiredMockA = MagicMock(spec=_Autowired)
+        AutowiredMockB = MagicMock(spec=_Autowired)
+
+        @autowired
+        def f(
+            a: AutowiredMockA,
+            /,  # noqa: E999, E225
+            b: AutowiredMockB,
+        ):
+            return {"a": a, "b": b}
+
+        # when
+        parameters = f(None)
+
+        # then
+        assert AutowiredMockA.inject.called is False
+        assert AutowiredMockB.inject.called is True
+        assert parameters["a"] is None
+        assert parameters["b"] is AutowiredMockB.inject()
+
+    def test__autowired__precomputes_injection_plan(self):
+        # given
+        @autowired
+        def f(a, b: Annotated["dep", Autowired], *, c: Autowired("other")):
+            return {"a": a, "b": b, "c": c}
+
+        # when
+        plan = f.__injection_plan__
+
+        # then
+        assert [(p.name, p.position, p.positional_only) for p in plan] == [
+            ("b", 1, False),
+            ("c", None, False),
+        ]
+        assert plan[0].annotation.dependency == "dep"
+        assert plan[1].annotation.dependency == "other"
+
+    def test__autowired__with_coroutine_function(self):
+        # given
+        reset_injection_container()
+        threads = []
+
+        async def async_factory():
+            return "async"
+
+        def sync_factory():
+            threads.append(threading.current_thread())
+            return "sync"
+
+        register_injectables({Injectable(async_factory)}, qualifier="A")
+        register_injectables({Injectable(sync_factory)}, qualifier="B")
+
+        @autowired
+        async def f(a: Autowired("A"), b: Autowired("B"), *, c=None):
+            return {"a": a, "b": b, "c": c}
+
+        # when
+        parameters = asyncio.run(f(c="c"))
+
+        # then
+        assert inspect.iscoroutinefunction(f)
+        assert parameters == {"a": "async", "b": "sync", "c": "c"}
+        assert threads[0] is not threading.main_thread()
+
+    def test__autowired__with_coroutine_function_and_scoped_dependencies(self):
+        # given
+        reset_injection_container()
+        closed = []
+
+        class Session:
+            def close(self):
+                closed.append(self)
+
+        class Repository:
+            @autowired
+            def __init__(self, session: Autowired("session")):
+                self.session = session
+
+        register_injectables(
+            {Injectable(Session, scope="injection_scope")}, qualifier="session"
+        )
+        register_injectables({Injectable(Repository)}, qualifier="repository")
+        register_injectables({Injectable(lambda: "other")}, qualifier="other")
+
+        @autowired
+        async def handler(
+            repository: Autowired("repository"),
+            other: Autowired("other"),
+            session: Autowired("session"),
+        ):
+            return repository, session
+
+        async def run():
+            async with injection_scope():
+                return await handler()
+
+        # when
+        repository, session = asyncio.run(run())
+
+        # then
+        assert repository.session is session
+        assert session in closed
+
+    def test__autowired__with_coroutine_function_and_task_scoped_dependencies(self):
+        # given
+        reset_injection_container()
+
+        class Context: ...
+
+        async def async_context():
+            return Context()
+
+        class Repository:
+            @autowired
+            def __init__(self, context: Autowired("context")):
+                self.context = context
+
+        register_injectables({Injectable(Context, scope="task")}, qualifier="context")
+        register_injectables(
+            {Injectable(async_context, scope="task")}, qualifier="async_context"
+        )
+        register_injectables({Injectable(Repository)}, qualifier="repository")
+
+        @autowired
+        async def handler(
+            repository: Autowired("repository"),
+            context: Autowired("context"),
+            async_context: Autowired("async_context"),
+            other_async_context: Autowired("async_context"),
+        ):
+            return repository, context, async_context, other_async_context
+
+        async def run():
+            return await handler(), await handler()
+
+        # when
+        first, second = asyncio.run(run())
+
+        # then
+        assert first[0].context is first[1] is second[1]
+        assert first[2] is first[3] is second[2] is second[3]
+        assert first[0] is not second[0]
+
+    def test__autowired__with_coroutine_function_and_supplied_args(self):
+        # given
+        reset_injection_container()
+        register_injectables({Injectable(lambda: "b")}, qualifier="B")
+
+        @autowired
+        async def f(a: Autowired("A"), /, b: Autowired("B")):  # noqa: E999, E225
+            return {"a": a, "b": b}
+
+        # when
+        parameters = asyncio.run(f("a"))
+
+        # then
+        assert parameters == {"a": "a", "b": "b"}
+
     def test__inject__with_list_class_dependency(self, mocker: MockFixture):
         # given
         mocked_inject = mocker.patch("injectable.autowiring.autowired_type.inject")
@@ -12,6 +12,19 @@ class TestGetCallerFilepath:
         # then
         assert filepath == expected
 
+    def test__get_caller_filepath__with_default_steps_back(self):
+        # given
+        expected = __file__
+
+        def caller():
+            return get_caller_filepath()
+
+        # when
+        filepath = caller()
+
+        # then
+        assert filepath == expected
+
 
 class TestGetDependencyName:
     def test__get_dependency_name__using_class(self):
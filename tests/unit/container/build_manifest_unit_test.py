@@ -0,0 +1,131 @@
+import importlib
+import sys
+
+import pytest
+
+from injectable import build_manifest, inject, load_injection_container
+from injectable.container.injection_container import InjectionContainer
+from injectable.errors import InjectableLoadError
+from injectable.testing import reset_injection_container
+
+
+@pytest.fixture(autouse=True)
+def reset_injection_container_before_test():
+    reset_injection_container()
+
+
+@pytest.fixture
+def package(tmp_path, monkeypatch):
+    monkeypatch.syspath_prepend(str(tmp_path))
+    package_dir = tmp_path / "manifest_test_package"
+    package_dir.mkdir()
+    (package_dir / "__init__.py").write_text("")
+    (package_dir / "service.py").write_text(
+        "from injectable import injectable\n"
+        "\n"
+        "@injectable(qualifier='service', singleton=True)\n"
+        "class Service: ...\n"
+    )
+    (package_dir / "util.py").write_text("def util(): ...\n")
+    yield package_dir
+    for module_name in list(sys.modules):
+        if module_name.startswith(package_dir.name):
+            del sys.modules[module_name]
+
+
+class TestBuildManifest:
+    def test__build_manifest(self, package):
+        # when
+        manifest = build_manifest(str(package))
+
+        # then
+        assert manifest.filepath == str(package / "injectable-manifest.json")
+        assert manifest.root == "."
+        assert len(manifest.modules) == 1
+        module = manifest.modules[0]
+        assert module.path == "service.py"
+        assert module.module == "manifest_test_package.service"
+        assert [
+            (
+                injectable.name,
+                injectable.kind,
+                injectable.klass,
+                injectable.qualifier,
+                injectable.singleton,
+            )
+            for injectable in module.injectables
+        ] == [("Service", "class", "Service", "service", True)]
+
+    def test__load_injection_container__with_manifest(self, package, mocker):
+        # given
+        manifest = build_manifest(str(package))
+        reset_injection_container()
+        collect_python_files = mocker.spy(InjectionContainer, "_collect_python_files")
+
+        # when
+        load_injection_container(manifest=manifest.filepath)
+
+        # then
+        assert collect_python_files.called is False
+        assert inject("service").__class__.__qualname__ == "Service"
+
+    def test__load_injection_container__with_stale_manifest(self, package):
+        # given
+        manifest = build_manifest(str(package))
+        reset_injection_container()
+        (package / "service.py").write_text("changed = True\n")
+
+        # then
+        with pytest.raises(InjectableLoadError):
+            load_injection_container(manifest=manifest.filepath)
+
+    def test__load_injection_container__with_added_module(self, package):
+        # given
+        manifest = build_manifest(str(package))
+        reset_injection_container()
+        (package / "other_service.py").write_text(
+            "from injectable import injectable\n"
+            "\n"
+            "@injectable(qualifier='other')\n"
+            "class OtherService: ...\n"
+        )
+
+        # then
+        with pytest.raises(InjectableLoadError, match="other_service.py"):
+            load_injection_container(manifest=manifest.filepath)
+
+    def test__load_injection_container__with_added_module_without_injectables(
+        self, package
+    ):
+        # given
+        manifest = build_manifest(str(package))
+        reset_injection_container()
+        (package / "other_util.py").write_text("def other_util(): ...\n")
+
+        # when
+        load_injection_container(manifest=manifest.filepath)
+
+        # then
+        assert inject("service").__class__.__qualname__ == "Service"
+
+    def test__load_injection_container__with_stale_manifest_falling_back_to_scan(
+        self, package
+    ):
+        # given
+        manifest = build_manifest(str(package))
+        reset_injection_container()
+        (package / "other_service.py").write_text(
+            "from injectable import injectable\n"
+            "\n"
+            "@injectable(qualifier='other')\n"
+            "class OtherService: ...\n"
+        )
+        (package / "service.py").write_text("changed = True\n")
+        importlib.invalidate_caches()
+
+        # when
+        load_injection_container(manifest=manifest.filepath, on_stale_manifest="scan")
+
+        # then
+        assert inject("other").__class__.__qualname__ == "OtherService"
+        assert inject("service", optional=True) is None
@@ -0,0 +1,109 @@
+import sys
+
+import pytest
+
+from injectable import InjectionContainer, bulk_register, inject, inject_multiple
+from injectable.constants import DEFAULT_NAMESPACE
+from injectable.errors import FrozenContainerError, InjectableLoadError
+from injectable.testing import reset_injection_container
+
+
+@pytest.fixture(autouse=True)
+def reset_injection_container_before_test():
+    reset_injection_container()
+
+
+class Base: ...
+
+
+class Client(Base): ...
+
+
+class TestBulkRegister:
+    def test__bulk_register__for_classes_and_qualifiers(self):
+        # when
+        injectables = bulk_register(
+            [
+                (Client, Client, {"qualifier": "client", "singleton": True}),
+                (Client, "tenant-a", {"groups": ["eu"]}),
+                (lambda: "b", "tenant-b"),
+            ]
+        )
+
+        # then
+        assert len(injectables) == 3
+        assert isinstance(inject(Base), Client)
+        assert inject(Client) is inject("client")
+        assert inject("tenant-b") == "b"
+        assert len(inject_multiple("tenant-a", group="eu")) == 1
+
+    def test__bulk_register__with_groups_generator(self):
+        # when
+        (injectable,) = bulk_register(
+            [(Client, Client, {"groups": (group for group in ["x", "y"])})]
+        )
+
+        # then
+        assert injectable.groups == {"x", "y"}
+        assert len(inject_multiple(Client, group="y")) == 1
+
+    def test__bulk_register__starts_a_single_generation(self):
+        # given
+        bulk_register([(Client, "tenant-0")])
+        namespace = InjectionContainer.NAMESPACES[DEFAULT_NAMESPACE]
+        generation = namespace.generation
+
+        # when
+        bulk_register((Client, f"tenant-{index}") for index in range(1, 100))
+
+        # then
+        assert namespace.generation == generation + 1
+        assert len(namespace.qualifier_registry) == 100
+
+    def test__bulk_register__interns_qualifiers(self):
+        # given
+        qualifier = "".join(["tenant", "-", "a"])
+
+        # when
+        bulk_register([(Client, qualifier)], namespace="TEST")
+
+        # then
+        namespace = InjectionContainer.NAMESPACES["TEST"]
+        registered = next(iter(namespace.qualifier_registry))
+        assert registered is sys.intern("tenant-a")
+
+    def test__bulk_register__without_propagation(self):
+        # when
+        bulk_register([(Client, Client, {"propagate": False})])
+
+        # then
+        assert inject(Client) is not None
+        assert inject(Base, optional=True) is None
+
+    @pytest.mark.parametrize(
+        "registration",
+        [
+            (Client,),
+            (Client, 42),
+            (Client, "client", {"qualifier": "other"}),
+            (Client, Client, {"lazy": True}),
+            (Client, Client, {"scope": "thread", "singleton": True}),
+            (Client, Client, {"groups": "eu"}),
+        ],
+    )
+    def test__bulk_register__with_invalid_registration_registers_nothing(
+        self, registration
+    ):
+        # then
+        with pytest.raises(InjectableLoadError):
+            bulk_register([(Client, "valid"), registration])
+        assert inject("valid", optional=True) is None
+
+    def test__bulk_register__when_frozen(self):
+        # given
+        bulk_register([(Client, "client")])
+        InjectionContainer.freeze()
+
+        # then
+        with pytest.raises(FrozenContainerError):
+            bulk_register([(Client, "other")])
@@ -0,0 +1,23 @@
+from unittest.mock import MagicMock
+
+from injectable.container.deferred_constructor import DeferredConstructor
+
+
+class TestDeferredConstructor:
+    def test__call__imports_module_and_calls_target(self, mocker):
+        # given
+        module = MagicMock()
+        import_module = mocker.patch(
+            "injectable.container.deferred_constructor.import_module",
+            return_value=module,
+        )
+        constructor = DeferredConstructor("foo.bar", "Outer.Inner")
+
+        # when
+        constructor(1, a=2)
+        constructor()
+
+        # then
+        import_module.assert_called_once_with("foo.bar")
+        module.Outer.Inner.assert_called_with()
+        assert module.Outer.Inner.call_count == 2
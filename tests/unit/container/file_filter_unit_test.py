@@ -0,0 +1,110 @@
+import os
+
+from injectable.container.file_filter import FileFilter, file_filter_for
+
+
+def make_tree(root, paths):
+    for path in paths:
+        filepath = root / path
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        filepath.write_text("")
+
+
+def collected_paths(file_filter, root):
+    return sorted(
+        os.path.relpath(entry.path, root).replace(os.sep, "/")
+        for entry in file_filter.collect(str(root))
+    )
+
+
+class TestFileFilter:
+    def test__collect__with_defaults(self, tmp_path):
+        # given
+        make_tree(
+            tmp_path,
+            ["app/a.py", "app/notes.txt", "venv/lib/b.py", "__pycache__/c.py", ".d.py"],
+        )
+
+        # when
+        paths = collected_paths(FileFilter(), tmp_path)
+
+        # then
+        assert paths == ["app/a.py"]
+
+    def test__collect__with_include_and_exclude(self, tmp_path):
+        # given
+        make_tree(
+            tmp_path,
+            [
+                "src/app/a.py",
+                "src/app/test_a.py",
+                "src/vendor/b.py",
+                "scripts/c.py",
+                "node_modules/pkg/d.py",
+            ],
+        )
+        file_filter = FileFilter(
+            include=["src/**/*.py"], exclude=["test_*.py", "src/vendor", "node_modules"]
+        )
+
+        # when
+        paths = collected_paths(file_filter, tmp_path)
+
+        # then
+        assert paths == ["src/app/a.py"]
+
+    def test__collect__with_bracket_expressions(self, tmp_path):
+        # given
+        make_tree(tmp_path, ["a1.py", "b1.py", "c1.py", "!1.py", "a2.py"])
+        file_filter = FileFilter(include=["[!ab]1.py", "[a]2.py"])
+
+        # when
+        paths = collected_paths(file_filter, tmp_path)
+
+        # then
+        assert paths == ["!1.py", "a2.py", "c1.py"]
+
+    def test__collect__does_not_descend_into_excluded_directories(
+        self, tmp_path, mocker
+    ):
+        # given
+        make_tree(tmp_path, ["app/a.py", "tests/fixtures/b.py"])
+        scandir = mocker.spy(os, "scandir")
+
+        # when
+        paths = collected_paths(FileFilter(exclude=["tests/**"]), tmp_path)
+
+        # then
+        assert paths == ["app/a.py"]
+        scanned = [
+            os.path.relpath(call.args[0], tmp_path) for call in scandir.mock_calls
+        ]
+        assert all(not path.startswith("tests") for path in scanned)
+
+    def test__collect__with_gitignore(self, tmp_path):
+        # given
+        make_tree(
+            tmp_path,
+            ["app/a.py", "app/generated/b.py", "app/c_pb2.py", "app/keep_pb2.py"],
+        )
+        (tmp_path / ".gitignore").write_text("# generated\n*_pb2.py\n!keep_pb2.py\n")
+        (tmp_path / "app" / ".gitignore").write_text("/generated/\n")
+
+        # when
+        paths = collected_paths(FileFilter(gitignore=True), tmp_path)
+
+        # then
+        assert paths == ["app/a.py", "app/keep_pb2.py"]
+
+
+class TestFileFilterFor:
+    def test__file_filter_for__without_options(self):
+        # then
+        assert file_filter_for(None, None, False) is None
+
+    def test__file_filter_for__with_options(self):
+        # when
+        file_filter = file_filter_for(None, ["tests"], False)
+
+        # then
+        assert isinstance(file_filter, FileFilter)
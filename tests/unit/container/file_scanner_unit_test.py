@@ -0,0 +1,85 @@
+import threading
+
+from injectable.container.file_scanner import read_if_contains, scan_files
+
+
+class TestReadIfContains:
+    def test__read_if_contains__without_marker(self, tmp_path):
+        # given
+        file = tmp_path / "file.py"
+        file.write_bytes(b"class A: ...\n" * 100)
+
+        # when
+        content = read_if_contains(str(file), b"injectable", chunk_size=16)
+
+        # then
+        assert content is None
+
+    def test__read_if_contains__with_marker(self, tmp_path):
+        # given
+        file = tmp_path / "file.py"
+        source = b"from injectable import injectable\n" + b"class A: ...\n" * 100
+        file.write_bytes(source)
+
+        # when
+        content = read_if_contains(str(file), b"injectable", chunk_size=16)
+
+        # then
+        assert content == source
+
+    def test__read_if_contains__with_marker_across_chunks(self, tmp_path):
+        # given
+        file = tmp_path / "file.py"
+        source = b"0123456789inject" + b"able"
+        file.write_bytes(source)
+
+        # when
+        content = read_if_contains(str(file), b"injectable", chunk_size=16)
+
+        # then
+        assert content == source
+
+    def test__read_if_contains__with_empty_file(self, tmp_path):
+        # given
+        file = tmp_path / "file.py"
+        file.write_bytes(b"")
+
+        # when
+        content = read_if_contains(str(file), b"injectable")
+
+        # then
+        assert content is None
+
+
+class TestScanFiles:
+    def test__scan_files__sequentially(self):
+        # given
+        files = list(range(10))
+        threads = set()
+
+        def predicate(file):
+            threads.add(threading.get_ident())
+            return file % 2 == 0
+
+        # when
+        matched = scan_files(files, predicate)
+
+        # then
+        assert matched == [0, 2, 4, 6, 8]
+        assert threads == {threading.get_ident()}
+
+    def test__scan_files__with_multiple_workers(self):
+        # given
+        files = list(range(10))
+        threads = set()
+
+        def predicate(file):
+            threads.add(threading.get_ident())
+            return file % 2 == 0
+
+        # when
+        matched = scan_files(files, predicate, workers=4)
+
+        # then
+        assert matched == [0, 2, 4, 6, 8]
+        assert threading.get_ident() not in threads
@@ -0,0 +1,95 @@
+from injectable.container.injectable_detection import (
+    DetectionStats,
+    contains_injectable_markers,
+    contains_injectables,
+)
+
+
+class TestContainsInjectables:
+    def test__contains_injectables__with_decorated_class(self):
+        # given
+        source = "from injectable import injectable\n@injectable\nclass A: ..."
+
+        # then
+        assert contains_injectables(source) is True
+
+    def test__contains_injectables__with_decorator_call(self):
+        # given
+        source = (
+            "from injectable import injectable\n"
+            "@injectable(qualifier='a', singleton=True)\n"
+            "class A: ..."
+        )
+
+        # then
+        assert contains_injectables(source) is True
+
+    def test__contains_injectables__with_factory(self):
+        # given
+        source = (
+            "from injectable import injectable_factory\n"
+            "@injectable_factory(qualifier='a')\n"
+            "def a(): ..."
+        )
+
+        # then
+        assert contains_injectables(source) is True
+
+    def test__contains_injectables__with_direct_call(self):
+        # given
+        source = "import injectable\nclass A: ...\ninjectable.injectable(A)"
+
+        # then
+        assert contains_injectables(source) is True
+
+    def test__contains_injectables__with_aliased_decorator(self):
+        # given
+        source = (
+            "from injectable import injectable as component\n@component\nclass A: ..."
+        )
+
+        # then
+        assert contains_injectables(source) is True
+        assert contains_injectable_markers(source) is False
+
+    def test__contains_injectables__with_mentions_only(self):
+        # given
+        source = (
+            '"""Uses @injectable and injectable_factory(...)"""\n'
+            "# @injectable\n"
+            "from foo import is_injectable\n"
+            "is_injectable(object)\n"
+        )
+
+        # then
+        assert contains_injectables(source) is False
+        assert contains_injectable_markers(source) is True
+
+    def test__contains_injectables__with_unparseable_source(self):
+        # given
+        source = r"from injectable import injectable\n@injectable\nclass A: ..."
+
+        # then
+        assert contains_injectables(source) is True
+
+    def test__contains_injectables__with_unrelated_source(self):
+        # then
+        assert contains_injectables("class A: ...") is False
+
+
+class TestDetectionStats:
+    def test__count(self):
+        # given
+        stats = DetectionStats()
+
+        # when
+        stats.count(True, True)
+        stats.count(False, True)
+        stats.count(True, False)
+        stats.count(False, False)
+
+        # then
+        assert stats.files_scanned == 4
+        assert stats.files_matched == 2
+        assert stats.files_skipped == 1
+        assert stats.files_added == 1
@@ -1,6 +1,16 @@
+import asyncio
+import copy
+import gc
+import pickle
+import threading
+import weakref
+from dataclasses import FrozenInstanceError
 from unittest.mock import MagicMock
 
+import pytest
+
 from injectable import Injectable
+from injectable.constants import Scope
 
 
 class TestInjectable:
@@ -16,8 +26,22 @@ class TestInjectable:
         assert injectable.unique_id is not None
         assert injectable.primary is False
         assert injectable.group is None
+        assert injectable.groups == frozenset()
         assert injectable.singleton is False
 
+    def test__init__groups_include_group(self):
+        # when
+        injectable = Injectable(MagicMock(), group="eu", groups=["acme", "eu"])
+
+        # then
+        assert injectable.group == "eu"
+        assert injectable.groups == {"eu", "acme"}
+
+    def test__init__with_string_groups_raises(self):
+        # then
+        with pytest.raises(ValueError):
+            Injectable(MagicMock(), groups="abc")
+
     def test__eq__with_different_injectables(self):
         # given
         injectable_a = Injectable(None)
@@ -34,6 +58,65 @@ class TestInjectable:
         # then
         assert injectable_a.constructor != injectable_b.constructor
         assert injectable_a == injectable_b
+        assert hash(injectable_a) == hash(injectable_b)
+
+    def test__eq__with_same_unique_id_and_different_attributes(self):
+        # given
+        injectable_a = Injectable(MagicMock(), unique_id="0")
+        injectable_b = Injectable(MagicMock(), unique_id="0", primary=True)
+
+        # then
+        assert injectable_a != injectable_b
+
+    def test__init__generates_sequential_unique_ids(self):
+        # when
+        unique_ids = {Injectable(None).unique_id for _ in range(100)}
+
+        # then
+        assert len(unique_ids) == 100
+
+    def test__injectable__is_slotted_and_immutable(self):
+        # given
+        injectable = Injectable(MagicMock())
+
+        # then
+        assert not hasattr(injectable, "__dict__")
+        with pytest.raises(FrozenInstanceError):
+            injectable.primary = True
+
+    def test__init__allocates_instance_state_only_when_needed(self):
+        # when
+        transient = Injectable(object)
+        singleton = Injectable(object, singleton=True)
+        scoped = Injectable(object, scope="thread")
+
+        # then
+        assert transient._state is None
+        assert singleton._state is not None
+        assert scoped._state is not None
+        assert singleton._state is not scoped._state
+
+    def test__copy__keeps_attributes_and_not_instances(self):
+        # given
+        injectable = Injectable(
+            object, "id", primary=True, group="a", singleton=True, groups=["b"]
+        )
+        instance = injectable.get_instance()
+
+        # when
+        copies = [
+            copy.copy(injectable),
+            copy.deepcopy(injectable),
+            pickle.loads(pickle.dumps(injectable)),
+        ]
+
+        # then
+        for copied in copies:
+            assert copied is not injectable
+            assert copied == injectable
+            assert copied.groups == {"a", "b"}
+            assert copied.singleton_constructed is False
+            assert copied.get_instance() is not instance
 
     def test__get_instance__with_singleton_injectable(self):
         # given
@@ -77,3 +160,188 @@ class TestInjectable:
 
         # then
         assert constructor.called is True
+
+    def test__get_instance__with_async_constructor(self):
+        # given
+        async def constructor(): ...
+
+        injectable = Injectable(constructor)
+
+        # then
+        assert injectable.is_async is True
+        with pytest.raises(TypeError):
+            injectable.get_instance()
+
+    def test__aget_instance__with_async_singleton_constructs_it_once(self):
+        # given
+        calls = []
+
+        async def constructor():
+            calls.append(None)
+            await asyncio.sleep(0)
+            return object()
+
+        injectable = Injectable(constructor, singleton=True)
+
+        async def run():
+            return await asyncio.gather(*(injectable.aget_instance() for _ in range(5)))
+
+        # when
+        instances = asyncio.run(run())
+
+        # then
+        assert len(calls) == 1
+        assert all(instance is instances[0] for instance in instances)
+        assert injectable.get_instance() is instances[0]
+
+    def test__aget_instance__with_failed_async_singleton_retries_it(self):
+        # given
+        side_effects = [ValueError(), "instance"]
+
+        async def constructor():
+            effect = side_effects.pop(0)
+            if isinstance(effect, Exception):
+                raise effect
+            return effect
+
+        injectable = Injectable(constructor, singleton=True)
+
+        # when
+        with pytest.raises(ValueError):
+            asyncio.run(injectable.aget_instance())
+        instance = asyncio.run(injectable.aget_instance())
+
+        # then
+        assert instance == "instance"
+
+    def test__aget_instance__with_sync_constructor(self):
+        # given
+        constructor = MagicMock(side_effect=["call_0", "call_1"])
+        injectable = Injectable(constructor)
+
+        # when
+        instance = asyncio.run(injectable.aget_instance())
+
+        # then
+        assert injectable.is_async is False
+        assert instance == "call_0"
+
+    def test__get_instance__with_thread_scope(self):
+        # given
+        injectable = Injectable(object, scope="thread")
+        instances = []
+
+        def inject_twice():
+            instances.append(injectable.get_instance())
+            instances.append(injectable.get_instance())
+
+        # when
+        inject_twice()
+        thread = threading.Thread(target=inject_twice)
+        thread.start()
+        thread.join()
+
+        # then
+        assert injectable.scope is Scope.THREAD
+        assert instances[0] is instances[1]
+        assert instances[2] is instances[3]
+        assert instances[0] is not instances[2]
+
+    def test__get_instance__with_task_scope(self):
+        # given
+        injectable = Injectable(object, scope="task")
+
+        async def inject_twice():
+            await asyncio.sleep(0)
+            return injectable.get_instance(), injectable.get_instance()
+
+        async def run():
+            parent = injectable.get_instance()
+            children = await asyncio.gather(inject_twice(), inject_twice())
+            return parent, children
+
+        # when
+        parent, children = asyncio.run(run())
+
+        # then
+        assert all(first is second for first, second in children)
+        assert len({id(parent), *(id(first) for first, _ in children)}) == 3
+
+    def test__get_instance__with_task_scope_releases_instances(self):
+        # given
+        injectable = Injectable(MagicMock, scope="task")
+        references = []
+
+        async def inject():
+            references.append(weakref.ref(injectable.get_instance()))
+
+        async def run():
+            await asyncio.gather(*(inject() for _ in range(3)))
+
+        # when
+        asyncio.run(run())
+        gc.collect()
+
+        # then
+        assert all(reference() is None for reference in references)
+
+    def test__aget_instance__with_task_scope_and_async_constructor(self):
+        # given
+        async def constructor():
+            return object()
+
+        injectable = Injectable(constructor, scope="task")
+
+        async def run():
+            return await injectable.aget_instance(), await injectable.aget_instance()
+
+        # when
+        first, second = asyncio.run(run())
+
+        # then
+        assert first is second
+
+    def test__init__with_scope_and_singleton_raises(self):
+        # then
+        with pytest.raises(ValueError):
+            Injectable(object, singleton=True, scope="thread")
+
+    def test__start_background_construction__injection_waits_for_it(self):
+        # given
+        started = threading.Event()
+        release = threading.Event()
+
+        def constructor():
+            started.set()
+            release.wait(5)
+            return "instance"
+
+        injectable = Injectable(constructor, singleton=True, init="background")
+
+        # when
+        assert injectable.start_background_construction() is True
+        assert injectable.start_background_construction() is False
+        started.wait(5)
+        threading.Timer(0.05, release.set).start()
+
+        # then
+        assert injectable.get_instance() == "instance"
+
+    def test__start_background_construction__error_is_raised_on_first_use(self):
+        # given
+        constructor = MagicMock(side_effect=[ValueError(), "instance"])
+        injectable = Injectable(constructor, singleton=True, init="background")
+
+        # when
+        injectable.start_background_construction()
+        injectable._state.background_thread.join(5)
+
+        # then
+        with pytest.raises(ValueError):
+            injectable.get_instance()
+        assert injectable.get_instance() == "instance"
+
+    def test__init__with_init_and_not_singleton_raises(self):
+        # then
+        with pytest.raises(ValueError):
+            Injectable(object, init="background")
@@ -1,14 +1,22 @@
 import os
+import sys
+from importlib.metadata import EntryPoint
 from unittest.mock import MagicMock
 
 import pytest
 from pytest import fixture
 from pytest_mock import MockFixture
 
+from injectable import Injectable, inject, inject_multiple, load_injection_container
 from injectable.container.injection_container import InjectionContainer
 from injectable.container.namespace import Namespace
-from injectable.constants import DEFAULT_NAMESPACE
-from injectable.testing import reset_injection_container
+from injectable.constants import DEFAULT_NAMESPACE, LoadingMode
+from injectable.errors import FrozenContainerError, InjectableLoadError, InjectionError
+from injectable.testing import (
+    clear_injectables,
+    register_injectables,
+    reset_injection_container,
+)
 
 
 @fixture
@@ -112,7 +120,7 @@ class TestInjectionContainer:
             return_value=file_collector,
         )
         patch_open(
-            read_data="from injectable import injectable\n@injectable\nclass A: ..."
+            read_data=b"from injectable import injectable\n@injectable\nclass A: ..."
         )
         patch_injection_container("module_finder")
         run_module = patch_injection_container("run_module")
@@ -144,7 +152,7 @@ class TestInjectionContainer:
             return_value=file_collector,
         )
         patch_open(
-            read_data="from injectable import injectable\n@injectable\nclass A: ..."
+            read_data=b"from injectable import injectable\n@injectable\nclass A: ..."
         )
         patch_injection_container("module_finder")
         run_module = patch_injection_container("run_module")
@@ -180,7 +188,7 @@ class TestInjectionContainer:
             "PythonFileCollector",
             return_value=file_collector,
         )
-        patch_open(read_data='"""not injectable"""')
+        patch_open(read_data=b'"""not injectable"""')
         patch_injection_container("module_finder")
         run_module = patch_injection_container("run_module")
         run_path = patch_injection_container("run_path")
@@ -212,7 +220,7 @@ class TestInjectionContainer:
             return_value=file_collector,
         )
         patch_open(
-            read_data="from injectable import injectable\n@injectable\nclass A: ..."
+            read_data=b"from injectable import injectable\n@injectable\nclass A: ..."
         )
         patch_injection_container("module_finder")
         run_module = patch_injection_container("run_module")
@@ -275,7 +283,7 @@ class TestInjectionContainer:
             return_value=file_collector,
         )
         patch_open(
-            read_data="from injectable import injectable\n@injectable\nclass A: ..."
+            read_data=b"from injectable import injectable\n@injectable\nclass A: ..."
         )
         patch_injection_container("module_finder")
         run_module = patch_injection_container("run_module")
@@ -305,7 +313,7 @@ class TestInjectionContainer:
             "PythonFileCollector",
             return_value=file_collector,
         )
-        patch_open(read_data='"""not injectable"""')
+        patch_open(read_data=b'"""not injectable"""')
         patch_injection_container("module_finder")
         run_module = patch_injection_container("run_module")
         run_path = patch_injection_container("run_path")
@@ -336,7 +344,7 @@ class TestInjectionContainer:
             return_value=file_collector,
         )
         patch_open(
-            read_data="from injectable import injectable\n@injectable\nclass A: ..."
+            read_data=b"from injectable import injectable\n@injectable\nclass A: ..."
         )
         patch_injection_container("module_finder")
         run_module = patch_injection_container("run_module")
@@ -369,7 +377,7 @@ class TestInjectionContainer:
             return_value=file_collector,
         )
         patch_open(
-            read_data=r"from injectable import injectable\n@injectable\nclass A: ..."
+            read_data=rb"from injectable import injectable\n@injectable\nclass A: ..."
         )
         patch_injection_container("module_finder")
         run_module = patch_injection_container("run_module")
@@ -383,6 +391,161 @@ class TestInjectionContainer:
         assert run_module.call_count == 2
         assert run_path.call_count == 0
 
+    def test__load_dependencies_from__with_scan_cache(
+        self, patch_injection_container, patch_open
+    ):
+        # given
+        root = "/" if os.name != "nt" else "C:\\"
+        search_path = os.path.join(root, "fake", "path")
+        namespace = DEFAULT_NAMESPACE
+        cached_file = MagicMock(spec=os.DirEntry)
+        cached_file.path = os.path.join(search_path, "cached.py")
+        uncached_file = MagicMock(spec=os.DirEntry)
+        uncached_file.path = os.path.join(search_path, "uncached.py")
+        file_collector = MagicMock()
+        file_collector.collect.return_value = [cached_file, uncached_file]
+        patch_injection_container("PythonFileCollector", return_value=file_collector)
+        mocked_open = patch_open(
+            read_data=b"from injectable import injectable\n@injectable\nclass A: ..."
+        )
+        patch_injection_container("module_finder")
+        run_module = patch_injection_container("run_module")
+        scan_cache = MagicMock()
+        scan_cache.get.side_effect = [False, None]
+
+        # when
+        InjectionContainer.load_dependencies_from(
+            search_path, namespace, scan_cache=scan_cache
+        )
+
+        # then
+        assert mocked_open.call_count == 1
+        assert mocked_open.call_args[0][0] is uncached_file
+        scan_cache.set.assert_called_once_with(uncached_file, True)
+        assert scan_cache.save.called is True
+        assert run_module.call_count == 1
+
+    def test__load_dependencies_from__with_multiple_scan_workers(
+        self, patch_injection_container
+    ):
+        # given
+        root = "/" if os.name != "nt" else "C:\\"
+        search_path = os.path.join(root, "fake", "path")
+        namespace = DEFAULT_NAMESPACE
+        files = [MagicMock(spec=os.DirEntry) for _ in range(4)]
+        file_collector = MagicMock()
+        file_collector.collect.return_value = files
+        patch_injection_container("PythonFileCollector", return_value=file_collector)
+        scan_files = patch_injection_container("scan_files", return_value=files[:2])
+        patch_injection_container("module_finder")
+        run_module = patch_injection_container("run_module")
+
+        # when
+        InjectionContainer.load_dependencies_from(
+            search_path, namespace, scan_workers=4
+        )
+
+        # then
+        assert scan_files.call_args[0][0] == files
+        assert scan_files.call_args[0][2] == 4
+        assert run_module.call_count == 2
+        assert InjectionContainer.LOADED_FILEPATHS == {file.path for file in files[:2]}
+
+    def test__execute_file__in_import_mode(self, patch_injection_container):
+        # given
+        root = "/" if os.name != "nt" else "C:\\"
+        filepath = os.path.join(root, "fake", "path", "not_imported_module.py")
+        loading_filepaths = []
+        import_module = patch_injection_container(
+            "import_module",
+            side_effect=lambda _: loading_filepaths.append(
+                InjectionContainer.LOADING_FILEPATH
+            ),
+        )
+        run_module = patch_injection_container("run_module")
+
+        # when
+        InjectionContainer._execute_file(
+            filepath, "not_imported_module", LoadingMode.IMPORT
+        )
+
+        # then
+        import_module.assert_called_once_with("not_imported_module")
+        assert loading_filepaths == [filepath]
+        assert run_module.called is False
+        assert InjectionContainer.LOADING_FILEPATH is None
+        assert filepath in InjectionContainer.LOADED_FILEPATHS
+
+    def test__execute_file__in_import_mode_with_already_executed_module(
+        self, patch_injection_container, monkeypatch
+    ):
+        # given
+        root = "/" if os.name != "nt" else "C:\\"
+        filepath = os.path.join(root, "fake", "path", "imported_module.py")
+        monkeypatch.setattr(InjectionContainer, "DECORATIONS", {})
+        registration = MagicMock()
+        InjectionContainer._record_decoration(filepath, "Foo", registration)
+        import_module = patch_injection_container("import_module")
+        run_module = patch_injection_container("run_module")
+
+        # when
+        InjectionContainer._execute_file(filepath, "imported_module", "import")
+
+        # then
+        assert registration.call_count == 1
+        assert import_module.called is False
+        assert run_module.called is False
+        assert filepath in InjectionContainer.LOADED_FILEPATHS
+
+    def test__load_entry_points(self, patch_injection_container, mocker):
+        # given
+        root = "/" if os.name != "nt" else "C:\\"
+        filepath = os.path.join(root, "fake", "plugin", "services.py")
+        entry_point = EntryPoint(
+            name="services", value="plugin.services:setup", group="injectable.modules"
+        )
+        patch_injection_container("_select_entry_points", return_value=[entry_point])
+        patch_injection_container(
+            "find_spec", return_value=MagicMock(has_location=True, origin=filepath)
+        )
+        execute_file = mocker.patch.object(InjectionContainer, "_execute_file")
+
+        # when
+        InjectionContainer.load_entry_points("injectable.modules", DEFAULT_NAMESPACE)
+
+        # then
+        execute_file.assert_called_once_with(
+            filepath, "plugin.services", LoadingMode.IMPORT
+        )
+        assert InjectionContainer.LOADING_DEFAULT_NAMESPACE is None
+
+    def test__load_modules__with_already_loaded_module(
+        self, patch_injection_container, mocker
+    ):
+        # given
+        root = "/" if os.name != "nt" else "C:\\"
+        filepath = os.path.join(root, "fake", "plugin", "services.py")
+        InjectionContainer.LOADED_FILEPATHS.add(filepath)
+        patch_injection_container(
+            "find_spec", return_value=MagicMock(has_location=True, origin=filepath)
+        )
+        execute_file = mocker.patch.object(InjectionContainer, "_execute_file")
+
+        # when
+        InjectionContainer.load_modules(["plugin.services"], DEFAULT_NAMESPACE)
+
+        # then
+        assert execute_file.called is False
+
+    def test__load_modules__with_missing_module(self, patch_injection_container):
+        # given
+        patch_injection_container("find_spec", return_value=None)
+
+        # then
+        with pytest.raises(InjectableLoadError):
+            InjectionContainer.load_modules(["missing"], DEFAULT_NAMESPACE)
+        assert InjectionContainer.LOADING_DEFAULT_NAMESPACE is None
+
     def test__register_injectable__with_defaults(self, patch_injection_container):
         # given
         klass = TestInjectionContainer
@@ -561,3 +724,151 @@ class TestInjectionContainer:
         assert injectable_arg.singleton is True
         assert klass_arg is klass
         assert qualifier_arg is qualifier
+
+    def test__freeze__resolves_primaries_per_key_and_group(self):
+        # given
+        primary = Injectable(object, "primary", primary=True, group="g")
+        other = Injectable(object, "other", group="g")
+        ungrouped = Injectable(object, "ungrouped")
+        register_injectables({primary, other, ungrouped}, qualifier="TEST")
+
+        # when
+        InjectionContainer.freeze()
+
+        # then
+        entry = InjectionContainer.NAMESPACES[
+            DEFAULT_NAMESPACE
+        ].frozen_qualifier_registry["TEST"]
+        assert entry.resolved is primary
+        assert set(entry.injectables) == {primary, other, ungrouped}
+        assert entry.groups["g"].resolved is primary
+        assert inject("TEST", group="g") is not None
+        assert len(inject_multiple("TEST", exclude_groups=["g"])) == 1
+
+    def test__freeze__indexes_each_group_of_injectables(self):
+        # given
+        tagged = Injectable(object, "tagged", group="eu", groups=["acme"])
+        other = Injectable(object, "other", groups=["us", "acme"])
+        register_injectables({tagged, other}, qualifier="TEST")
+
+        # when
+        InjectionContainer.freeze()
+
+        # then
+        entry = InjectionContainer.NAMESPACES[
+            DEFAULT_NAMESPACE
+        ].frozen_qualifier_registry["TEST"]
+        assert entry.groups["eu"].injectables == (tagged,)
+        assert set(entry.groups["acme"].injectables) == {tagged, other}
+        assert inject("TEST", group="us") is not None
+        assert len(inject_multiple("TEST", group="acme", exclude_groups=["us"])) == 1
+
+    def test__freeze__with_ambiguous_key_when_strict(self):
+        # given
+        injectables = {Injectable(object, "a"), Injectable(object, "b")}
+        register_injectables(injectables, qualifier="TEST")
+
+        # then
+        with pytest.raises(InjectableLoadError):
+            InjectionContainer.freeze(strict=True)
+        assert InjectionContainer.FROZEN is False
+
+    def test__freeze__with_ambiguous_key_when_not_strict(self):
+        # given
+        injectables = {Injectable(object, "a"), Injectable(object, "b")}
+        register_injectables(injectables, qualifier="TEST")
+
+        # when
+        InjectionContainer.freeze()
+
+        # then
+        with pytest.raises(InjectionError):
+            inject("TEST")
+        assert len(inject_multiple("TEST")) == 2
+        assert inject("OTHER", optional=True) is None
+
+    def test__freeze__rejects_later_registrations(self):
+        # given
+        register_injectables({Injectable(object, "a")}, qualifier="TEST")
+        InjectionContainer.freeze()
+
+        # then
+        with pytest.raises(FrozenContainerError):
+            register_injectables({Injectable(object, "b")}, qualifier="TEST")
+        with pytest.raises(FrozenContainerError):
+            register_injectables(
+                {Injectable(object, "b")}, qualifier="TEST", namespace="X"
+            )
+        with pytest.raises(FrozenContainerError):
+            clear_injectables("TEST")
+
+    def test__freeze__rejects_later_loads(self, tmp_path):
+        # given
+        filepath = tmp_path / "module.py"
+        filepath.write_text(
+            "from injectable import injectable\n@injectable\nclass Foo: ...\n"
+        )
+        InjectionContainer.freeze()
+
+        # then
+        with pytest.raises(FrozenContainerError):
+            load_injection_container(str(tmp_path))
+        with pytest.raises(FrozenContainerError):
+            InjectionContainer.load_dependencies_from(str(tmp_path), DEFAULT_NAMESPACE)
+        with pytest.raises(FrozenContainerError):
+            InjectionContainer.load_modules(["module"], DEFAULT_NAMESPACE)
+        assert InjectionContainer.LOADED_FILEPATHS == set()
+        assert InjectionContainer.LOADING_FILEPATH is None
+        assert InjectionContainer.LOADING_DEFAULT_NAMESPACE is None
+
+    def test__load_dependencies_from__resets_loading_vars_when_execution_fails(
+        self, tmp_path
+    ):
+        # given
+        (tmp_path / "module.py").write_text(
+            "from injectable import injectable\n"
+            "@injectable\n"
+            "class Foo: ...\n"
+            "raise RuntimeError('boom')\n"
+        )
+
+        # when
+        with pytest.raises(RuntimeError):
+            InjectionContainer.load_dependencies_from(str(tmp_path), DEFAULT_NAMESPACE)
+
+        # then
+        assert InjectionContainer.LOADING_FILEPATH is None
+        assert InjectionContainer.LOADING_DEFAULT_NAMESPACE is None
+
+    def test__load_injection_container__in_import_mode_after_run_mode_loads(
+        self, tmp_path, monkeypatch
+    ):
+        # given
+        package = tmp_path / "decorations_pkg"
+        package.mkdir()
+        (package / "__init__.py").write_text("")
+        filepath = package / "svc.py"
+        filepath.write_text(
+            "from injectable import injectable\n@injectable\nclass Svc: ...\n"
+        )
+        monkeypatch.syspath_prepend(str(tmp_path))
+        for _ in range(5):
+            reset_injection_container()
+            load_injection_container(str(package))
+        assert InjectionContainer.DECORATIONS == {}
+        import decorations_pkg.svc
+
+        reset_injection_container()
+
+        try:
+            # when
+            load_injection_container(str(package), mode=LoadingMode.IMPORT)
+
+            # then
+            assert list(InjectionContainer.DECORATIONS[str(filepath)]) == ["Svc"]
+            namespace = InjectionContainer.NAMESPACES[DEFAULT_NAMESPACE]
+            assert list(namespace.type_registry) == [decorations_pkg.svc.Svc]
+            assert isinstance(inject(decorations_pkg.svc.Svc), decorations_pkg.svc.Svc)
+        finally:
+            sys.modules.pop("decorations_pkg.svc")
+            sys.modules.pop("decorations_pkg")
@@ -0,0 +1,200 @@
+import asyncio
+import contextvars
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+
+from injectable import Injectable, injection_scope
+from injectable.container.injection_scope import active_injection_scope
+
+
+class TestInjectionScope:
+    def test__injection_scope__reuses_instances_and_closes_them(self):
+        # given
+        injectable = Injectable(MagicMock, scope="injection_scope")
+
+        # when
+        with injection_scope() as scope:
+            first = injectable.get_instance()
+            second = injectable.get_instance()
+            assert active_injection_scope() is scope
+
+        # then
+        assert first is second
+        assert first.close.call_count == 1
+        assert active_injection_scope() is None
+        assert injectable.get_instance() is not first
+
+    def test__injection_scope__closes_instances_in_reverse_order(self):
+        # given
+        closed = []
+        injectables = [
+            Injectable(
+                lambda i=i: MagicMock(close=lambda: closed.append(i)),
+                str(i),
+                scope="injection_scope",
+            )
+            for i in range(3)
+        ]
+
+        # when
+        with injection_scope():
+            for injectable in injectables:
+                injectable.get_instance()
+
+        # then
+        assert closed == [2, 1, 0]
+
+    def test__injection_scope__closes_instances_when_closing_one_fails(self):
+        # given
+        failing = Injectable(
+            lambda: MagicMock(close=MagicMock(side_effect=ValueError)),
+            "failing",
+            scope="injection_scope",
+        )
+        other = Injectable(MagicMock, "other", scope="injection_scope")
+
+        # when
+        with pytest.raises(ValueError):
+            with injection_scope():
+                other_instance = other.get_instance()
+                failing.get_instance()
+
+        # then
+        assert other_instance.close.called is True
+
+    def test__injection_scope__nested_scopes_dont_share_instances(self):
+        # given
+        injectable = Injectable(MagicMock, scope="injection_scope")
+
+        # when
+        with injection_scope():
+            outer = injectable.get_instance()
+            with injection_scope():
+                inner = injectable.get_instance()
+            after = injectable.get_instance()
+
+        # then
+        assert inner is not outer
+        assert after is outer
+
+    def test__injection_scope__as_async_context_manager(self):
+        # given
+        class Resource:
+            closed = False
+
+            async def aclose(self):
+                self.closed = True
+
+        async def constructor():
+            return Resource()
+
+        injectable = Injectable(constructor, scope="injection_scope")
+
+        async def run():
+            async with injection_scope():
+                instances = await asyncio.gather(
+                    injectable.aget_instance(), injectable.aget_instance()
+                )
+                return instances, await injectable.aget_instance()
+
+        # when
+        instances, instance = asyncio.run(run())
+
+        # then
+        assert instance in instances
+        assert instance.closed is True
+
+    def test__injection_scope__constructs_concurrent_async_requests_once(self):
+        # given
+        constructed = []
+
+        async def constructor():
+            await asyncio.sleep(0.01)
+            instance = MagicMock()
+            constructed.append(instance)
+            return instance
+
+        injectable = Injectable(constructor, scope="injection_scope")
+
+        async def run():
+            async with injection_scope():
+                return await asyncio.gather(
+                    injectable.aget_instance(), injectable.aget_instance()
+                )
+
+        # when
+        first, second = asyncio.run(run())
+
+        # then
+        assert first is second
+        assert constructed == [first]
+        assert first.aclose.call_count == 1
+
+    def test__injection_scope__constructs_concurrent_thread_requests_once(self):
+        # given
+        constructed = []
+        barrier = threading.Barrier(2)
+
+        def constructor():
+            time.sleep(0.01)
+            instance = MagicMock()
+            constructed.append(instance)
+            return instance
+
+        injectable = Injectable(constructor, scope="injection_scope")
+
+        def request():
+            barrier.wait(5)
+            return injectable.get_instance()
+
+        # when
+        with injection_scope():
+            with ThreadPoolExecutor(2) as executor:
+                futures = [
+                    executor.submit(contextvars.copy_context().run, request)
+                    for _ in range(2)
+                ]
+                first, second = [future.result(5) for future in futures]
+
+        # then
+        assert first is second
+        assert constructed == [first]
+        assert first.close.call_count == 1
+
+    def test__aget_instance__with_thread_scope_constructs_concurrent_requests_once(
+        self,
+    ):
+        # given
+        constructor = MagicMock()
+
+        async def async_constructor():
+            await asyncio.sleep(0.01)
+            return constructor()
+
+        injectable = Injectable(async_constructor, scope="thread")
+
+        async def run():
+            return await asyncio.gather(
+                injectable.aget_instance(), injectable.aget_instance()
+            )
+
+        # when
+        first, second = asyncio.run(run())
+
+        # then
+        assert first is second
+        assert constructor.call_count == 1
+
+    def test__injection_scope__entered_twice_raises(self):
+        # given
+        scope = injection_scope()
+
+        # then
+        with scope:
+            with pytest.raises(RuntimeError):
+                with scope:
+                    ...
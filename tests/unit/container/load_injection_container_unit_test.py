@@ -1,10 +1,14 @@
 import os
+import sys
 
 from pytest import fixture
 from pytest_mock import MockFixture
 
-from injectable import load_injection_container
-from injectable.constants import DEFAULT_NAMESPACE
+from injectable import inject, load_injection_container
+from injectable.constants import DEFAULT_NAMESPACE, LoadingMode
+from injectable.container.file_filter import FileFilter
+from injectable.container.injection_container import InjectionContainer
+from injectable.testing import reset_injection_container
 
 
 @fixture
@@ -16,6 +20,9 @@ def get_caller_filepath_mock(mocker: MockFixture):
 
 @fixture
 def injection_container_mock(mocker: MockFixture):
+    mocker.patch(
+        "injectable.container.load_injection_container.start_background_constructions"
+    )
     return mocker.patch(
         "injectable.container.load_injection_container.InjectionContainer"
     )
@@ -93,3 +100,158 @@ class TestLoadInjectionContainer:
         assert load.called is True
         default_namespace_arg = load.call_args[0][1]
         assert default_namespace_arg == default_namespace
+
+    def test__load_injection_container__with_exclude_patterns(
+        self, get_caller_filepath_mock, injection_container_mock
+    ):
+        # given
+        get_caller_filepath_mock.return_value = os.path.join("fake", "path", "file.py")
+
+        # when
+        load_injection_container(exclude=["tests/**"])
+
+        # then
+        load = injection_container_mock.load_dependencies_from
+        assert isinstance(load.call_args[1]["file_filter"], FileFilter)
+
+    def test__load_injection_container__with_entry_points(
+        self, get_caller_filepath_mock, injection_container_mock
+    ):
+        # when
+        load_injection_container(entry_points="injectable.modules")
+
+        # then
+        injection_container_mock.load_entry_points.assert_called_once_with(
+            "injectable.modules", DEFAULT_NAMESPACE, LoadingMode.RUN
+        )
+        assert injection_container_mock.load_dependencies_from.called is False
+        assert get_caller_filepath_mock.called is False
+
+
+class TestLoadInjectionContainerInImportMode:
+    def test__load_injection_container__registers_imported_classes(
+        self, tmp_path, monkeypatch
+    ):
+        # given
+        reset_injection_container()
+        monkeypatch.syspath_prepend(str(tmp_path))
+        package_dir = tmp_path / "import_mode_test_package"
+        package_dir.mkdir()
+        (package_dir / "__init__.py").write_text("")
+        (package_dir / "service.py").write_text(
+            "from injectable import injectable\n"
+            "\n"
+            "EXECUTIONS = []\n"
+            "EXECUTIONS.append(1)\n"
+            "\n"
+            "@injectable\n"
+            "class Service: ...\n"
+        )
+        from import_mode_test_package import service
+
+        try:
+            # when
+            load_injection_container(str(package_dir), mode=LoadingMode.IMPORT)
+
+            # then
+            assert isinstance(inject(service.Service), service.Service)
+            assert service.EXECUTIONS == [1]
+        finally:
+            sys.modules.pop("import_mode_test_package.service")
+            sys.modules.pop("import_mode_test_package")
+
+
+class TestLoadInjectionContainerInLazyMode:
+    def test__load_injection_container__imports_modules_on_first_injection(
+        self, tmp_path, monkeypatch
+    ):
+        # given
+        reset_injection_container()
+        monkeypatch.syspath_prepend(str(tmp_path))
+        package_dir = tmp_path / "lazy_mode_test_package"
+        package_dir.mkdir()
+        (package_dir / "__init__.py").write_text("")
+        (package_dir / "base.py").write_text("class Base: ...\n")
+        (package_dir / "service.py").write_text(
+            "from injectable import injectable\n"
+            "from .base import Base\n"
+            "\n"
+            "@injectable(qualifier='service', singleton=True)\n"
+            "class Service(Base): ...\n"
+        )
+
+        try:
+            # when
+            load_injection_container(str(package_dir), mode=LoadingMode.LAZY)
+
+            # then
+            assert "lazy_mode_test_package.service" not in sys.modules
+            from lazy_mode_test_package.base import Base
+
+            instance = inject(Base)
+            assert instance.__class__.__qualname__ == "Service"
+            assert "lazy_mode_test_package.service" in sys.modules
+            assert inject("service") is instance
+        finally:
+            for module_name in list(sys.modules):
+                if module_name.startswith("lazy_mode_test_package"):
+                    sys.modules.pop(module_name)
+
+
+class TestLoadInjectionContainerFromModulesAndPackages:
+    @fixture
+    def package(self, tmp_path, monkeypatch):
+        monkeypatch.syspath_prepend(str(tmp_path))
+        package_dir = tmp_path / "package_walk_test_package"
+        (package_dir / "subpackage").mkdir(parents=True)
+        (package_dir / "__init__.py").write_text("")
+        (package_dir / "subpackage" / "__init__.py").write_text("")
+        (package_dir / "subpackage" / "service.py").write_text(
+            "from injectable import injectable\n"
+            "\n"
+            "@injectable(qualifier='service')\n"
+            "class Service: ...\n"
+        )
+        reset_injection_container()
+        yield package_dir
+        for module_name in list(sys.modules):
+            if module_name.startswith(package_dir.name):
+                sys.modules.pop(module_name)
+
+    def test__load_injection_container__with_modules(
+        self, package, get_caller_filepath_mock
+    ):
+        # when
+        load_injection_container(
+            modules=["package_walk_test_package.subpackage.service"]
+        )
+
+        # then
+        assert inject("service").__class__.__qualname__ == "Service"
+        assert get_caller_filepath_mock.called is False
+
+    def test__load_injection_container__returns_load_report(self, package):
+        # when
+        report = load_injection_container(str(package))
+
+        # then
+        assert report.files_walked == 3
+        assert report.files_scanned == 3
+        assert report.files_matched == 1
+        assert report.files_executed == 1
+        assert list(report.execution_times) == [
+            str(package / "subpackage" / "service.py")
+        ]
+        assert report.registrations == {DEFAULT_NAMESPACE: 1}
+
+    def test__load_injection_container__with_packages(self, package, mocker):
+        # given
+        collect_python_files = mocker.spy(InjectionContainer, "_collect_python_files")
+
+        # when
+        load_injection_container(packages=["package_walk_test_package"])
+
+        # then
+        assert inject("service").__class__.__qualname__ == "Service"
+        assert collect_python_files.called is False
+        assert "package_walk_test_package.subpackage.service" in sys.modules
@@ -0,0 +1,40 @@
+from injectable.container.load_report import LoadReport
+
+
+class TestLoadReport:
+    def test__record_scan(self):
+        # given
+        report = LoadReport()
+
+        # when
+        report.record_scan("a.py", 0.5)
+        report.record_scan("b.py", 0.25)
+
+        # then
+        assert report.files_scanned == 2
+        assert report.total_scan_time == 0.75
+
+    def test__slowest_modules(self):
+        # given
+        report = LoadReport()
+        report.record_execution("a.py", 0.1)
+        report.record_execution("b.py", 0.3)
+        report.record_execution("c.py", 0.2)
+
+        # when
+        slowest_modules = report.slowest_modules(2)
+
+        # then
+        assert report.files_executed == 3
+        assert slowest_modules == [("b.py", 0.3), ("c.py", 0.2)]
+
+    def test__slowest_singletons(self):
+        # given
+        report = LoadReport()
+        report.singleton_times = {"a": 0.1, "b": 0.3, "c": 0.2}
+
+        # when
+        slowest_singletons = report.slowest_singletons(2)
+
+        # then
+        assert slowest_singletons == [("b", 0.3), ("c", 0.2)]
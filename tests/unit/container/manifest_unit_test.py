@@ -0,0 +1,112 @@
+import os
+
+import pytest
+from pycollect import PythonFileCollector
+
+from injectable.container.manifest import (
+    Manifest,
+    ManifestInjectable,
+    ManifestModule,
+    file_sha256,
+)
+
+
+@pytest.fixture
+def manifest(tmp_path):
+    source = tmp_path / "foo.py"
+    source.write_text("from injectable import injectable\n@injectable\nclass Foo: ...")
+    stat = os.stat(source)
+    manifest = Manifest(
+        root=".",
+        default_namespace="DEFAULT_NAMESPACE",
+        modules=[
+            ManifestModule(
+                path="foo.py",
+                module="foo",
+                size=stat.st_size,
+                mtime=stat.st_mtime_ns,
+                sha256=file_sha256(str(source)),
+                injectables=[
+                    ManifestInjectable(
+                        name="Foo",
+                        kind="class",
+                        namespace="DEFAULT_NAMESPACE",
+                        klass="Foo",
+                        singleton=True,
+                    )
+                ],
+            )
+        ],
+        filepath=str(tmp_path / "injectable-manifest.json"),
+    )
+    manifest.record_tree()
+    return manifest
+
+
+class TestManifest:
+    def test__write_and_read(self, manifest):
+        # when
+        manifest.write()
+        read_manifest = Manifest.read(manifest.filepath)
+
+        # then
+        assert read_manifest == manifest
+
+    def test__read__with_unsupported_version(self, tmp_path):
+        # given
+        filepath = tmp_path / "injectable-manifest.json"
+        filepath.write_text('{"version": 0}')
+
+        # then
+        with pytest.raises(ValueError):
+            Manifest.read(str(filepath))
+
+    def test__stale_modules__with_unchanged_sources(self, manifest):
+        # then
+        assert manifest.stale_modules() == []
+
+    def test__stale_modules__with_touched_sources(self, manifest, tmp_path):
+        # given
+        source = tmp_path / "foo.py"
+        stat = os.stat(source)
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        # then
+        assert manifest.stale_modules() == []
+
+    def test__stale_modules__with_changed_sources(self, manifest, tmp_path):
+        # given
+        (tmp_path / "foo.py").write_text("changed")
+
+        # then
+        assert manifest.stale_modules() == manifest.modules
+
+    def test__stale_modules__with_deleted_sources(self, manifest, tmp_path):
+        # given
+        os.remove(tmp_path / "foo.py")
+
+        # then
+        assert manifest.stale_modules() == manifest.modules
+
+    def test__record_tree(self, manifest):
+        # then
+        assert manifest.files == ["foo.py"]
+        assert list(manifest.directories) == ["."]
+
+    def test__new_files__with_unchanged_tree(self, manifest, mocker):
+        # given
+        collect = mocker.spy(PythonFileCollector, "collect")
+
+        # then
+        assert manifest.new_files() == []
+        assert collect.called is False
+
+    def test__new_files__with_added_files(self, manifest, tmp_path):
+        # given
+        (tmp_path / "bar.py").write_text("")
+        (tmp_path / "baz").mkdir()
+        (tmp_path / "baz" / "qux.py").write_text("")
+        (tmp_path / "notes.txt").write_text("")
+
+        # then
+        assert manifest.new_files() == ["bar.py", "baz/qux.py"]
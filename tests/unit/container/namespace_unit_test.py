@@ -1,3 +1,4 @@
+from abc import ABC
 from unittest.mock import MagicMock
 
 from injectable import Injectable
@@ -10,6 +11,7 @@ class TestNamespace:
         namespace = Namespace()
 
         # then
+        assert namespace.type_registry == {}
         assert namespace.class_registry == {}
         assert namespace.qualifier_registry == {}
 
@@ -18,13 +20,12 @@ class TestNamespace:
         injectable = MagicMock(spec=Injectable)
         namespace = Namespace()
         klass = TestNamespace
-        class_lookup_key = klass.__qualname__
 
         # when
         namespace.register_injectable(injectable, klass)
 
         # then
-        assert namespace.class_registry[class_lookup_key] == {injectable}
+        assert namespace.type_registry[klass] == {injectable}
 
     def test__register_injectable__with_qualifier_only(self):
         # given
@@ -42,7 +43,6 @@ class TestNamespace:
         # given
         injectable = MagicMock(spec=Injectable)
         klass = TestNamespace
-        class_lookup_key = klass.__qualname__
         qualifier = "qualifier"
         namespace = Namespace()
 
@@ -50,53 +50,48 @@ class TestNamespace:
         namespace.register_injectable(injectable, klass, qualifier)
 
         # then
-        assert namespace.class_registry[class_lookup_key] == {injectable}
+        assert namespace.type_registry[klass] == {injectable}
         assert namespace.qualifier_registry[qualifier] == {injectable}
 
     def test__register_injectable__propagation_to_base_classes(self):
         # given
         injectable = MagicMock(spec=Injectable)
         base_class = TestNamespace
-        base_class_lookup_key = base_class.__qualname__
 
         class Child(base_class): ...
 
         child_class = Child
-        child_class_lookup_key = child_class.__qualname__
         namespace = Namespace()
 
         # when
         namespace.register_injectable(injectable, child_class)
 
         # then
-        assert namespace.class_registry[child_class_lookup_key] == {injectable}
-        assert namespace.class_registry[base_class_lookup_key] == {injectable}
+        assert namespace.type_registry[child_class] == {injectable}
+        assert namespace.type_registry[base_class] == {injectable}
 
     def test__register_injectable__with_propagation_disabled(self):
         # given
         injectable = MagicMock(spec=Injectable)
         base_class = TestNamespace
-        base_class_lookup_key = base_class.__qualname__
 
         class Child(base_class): ...
 
         child_class = Child
-        child_class_lookup_key = child_class.__qualname__
         namespace = Namespace()
 
         # when
         namespace.register_injectable(injectable, child_class, propagate=False)
 
         # then
-        assert namespace.class_registry[child_class_lookup_key] == {injectable}
-        assert base_class_lookup_key not in namespace.class_registry
+        assert namespace.type_registry[child_class] == {injectable}
+        assert base_class not in namespace.type_registry
 
     def test__register_injectable__class_and_qualifier_overloading(self):
         # given
         injectable = MagicMock(spec=Injectable)
         overloading_injectable = MagicMock(spec=Injectable)
         klass = TestNamespace
-        class_lookup_key = klass.__qualname__
         qualifier = "qualifier"
         namespace = Namespace()
         namespace.register_injectable(injectable, klass, qualifier)
@@ -105,7 +100,7 @@ class TestNamespace:
         namespace.register_injectable(overloading_injectable, klass, qualifier)
 
         # then
-        assert namespace.class_registry[class_lookup_key] == {
+        assert namespace.type_registry[klass] == {
             injectable,
             overloading_injectable,
         }
@@ -113,3 +108,192 @@ class TestNamespace:
             injectable,
             overloading_injectable,
         }
+
+    def test__register_injectable_names(self):
+        # given
+        injectable = MagicMock(spec=Injectable)
+        namespace = Namespace()
+
+        # when
+        namespace.register_injectable_names(
+            injectable, ["Foo", "Base", "object"], "foo"
+        )
+
+        # then
+        assert namespace.class_registry == {"Foo": {injectable}, "Base": {injectable}}
+        assert namespace.qualifier_registry == {"foo": {injectable}}
+
+    def test__register_injectable__starts_new_generation(self):
+        # given
+        namespace = Namespace()
+        generation = namespace.generation
+
+        # when
+        namespace.register_injectable(MagicMock(spec=Injectable), qualifier="foo")
+
+        # then
+        assert namespace.generation != generation
+
+    def test__register_injectable__counts_registrations(self):
+        # given
+        class Foo: ...
+
+        namespace = Namespace()
+
+        # when
+        namespace.register_injectable(MagicMock(spec=Injectable), Foo, "foo")
+        namespace.register_injectable_names(MagicMock(spec=Injectable), ["Bar"])
+        namespace.register_bulk(
+            [
+                (MagicMock(spec=Injectable), Foo, None, True),
+                (MagicMock(spec=Injectable), None, "baz", False),
+            ]
+        )
+
+        # then
+        assert namespace.registration_count == 4
+
+    def test__register_injectable__same_named_classes_do_not_collide(self):
+        # given
+        injectable = MagicMock(spec=Injectable)
+        other_injectable = MagicMock(spec=Injectable)
+        klass = type("Client", (), {})
+        other_class = type("Client", (), {})
+        namespace = Namespace()
+
+        # when
+        namespace.register_injectable(injectable, klass)
+        namespace.register_injectable(other_injectable, other_class)
+
+        # then
+        assert namespace.get_class_injectables(klass) == {injectable}
+        assert namespace.get_class_injectables(other_class) == {other_injectable}
+
+    def test__register_injectable__diamond_hierarchy(self):
+        # given
+        injectable = MagicMock(spec=Injectable)
+
+        class Base: ...
+
+        class Left(Base): ...
+
+        class Right(Base): ...
+
+        class Child(Left, Right): ...
+
+        namespace = Namespace()
+
+        # when
+        namespace.register_injectable(injectable, Child)
+
+        # then
+        assert list(namespace.type_registry) == [Child, Left, Right, Base]
+        assert namespace.type_registry[Base] == {injectable}
+
+    def test__register_injectable__universal_bases_are_skipped(self):
+        # given
+        injectable = MagicMock(spec=Injectable)
+
+        class Foo(ABC): ...
+
+        namespace = Namespace()
+
+        # when
+        namespace.register_injectable(injectable, Foo)
+
+        # then
+        assert list(namespace.type_registry) == [Foo]
+
+    def test__register_injectable__explicitly_for_universal_base(self):
+        # given
+        injectable = MagicMock(spec=Injectable)
+        namespace = Namespace()
+
+        # when
+        namespace.register_injectable(injectable, object)
+
+        # then
+        assert namespace.get_class_injectables(object) == {injectable}
+
+    def test__get_class_injectables__with_class_not_indexed(self):
+        # given
+        injectable = MagicMock(spec=Injectable)
+        named_injectable = MagicMock(spec=Injectable)
+        klass = type("Client", (), {})
+        namespace = Namespace()
+        namespace.register_injectable(injectable, klass)
+        namespace.register_injectable_names(named_injectable, ["Client"])
+
+        # when
+        injectables = namespace.get_class_injectables(type("Client", (), {}))
+
+        # then
+        assert injectables == {injectable, named_injectable}
+
+    def test__get_class_injectables__with_class_from_other_module(self):
+        # given
+        injectable = MagicMock(spec=Injectable)
+        named_injectable = MagicMock(spec=Injectable)
+        namespace = Namespace()
+        namespace.register_injectable(
+            injectable, type("Client", (), {"__module__": "m1"})
+        )
+        namespace.register_injectable_names(named_injectable, ["Client"])
+
+        # when
+        injectables = namespace.get_class_injectables(
+            type("Client", (), {"__module__": "m2"})
+        )
+
+        # then
+        assert injectables == {named_injectable}
+
+    def test__get_class_injectables__with_module_named_with_other_prefix(self):
+        # given
+        injectable = MagicMock(spec=Injectable)
+        namespace = Namespace()
+        namespace.register_injectable(
+            injectable, type("Client", (), {"__module__": "project.app.clients"})
+        )
+
+        # when
+        injectables = namespace.get_class_injectables(
+            type("Client", (), {"__module__": "app.clients"})
+        )
+
+        # then
+        assert injectables == {injectable}
+
+    def test__register_bulk(self):
+        # given
+        injectable = MagicMock(spec=Injectable)
+        other_injectable = MagicMock(spec=Injectable)
+
+        class Base: ...
+
+        class Child(Base): ...
+
+        namespace = Namespace()
+        generation = namespace.generation
+
+        # when
+        count = namespace.register_bulk(
+            [
+                (injectable, Child, "foo", True),
+                (other_injectable, Child, None, False),
+                (other_injectable, "Other", "bar", False),
+            ]
+        )
+
+        # then
+        assert count == 3
+        assert namespace.type_registry == {
+            Child: {injectable, other_injectable},
+            Base: {injectable},
+        }
+        assert namespace.class_registry == {"Other": {other_injectable}}
+        assert namespace.qualifier_registry == {
+            "foo": {injectable},
+            "bar": {other_injectable},
+        }
+        assert namespace.generation == generation + 1
@@ -0,0 +1,107 @@
+import os
+
+from injectable.container.scan_cache import ScanCache
+
+
+class TestScanCache:
+    def test__default_cache_dir__with_environment_variable(self, monkeypatch):
+        # given
+        monkeypatch.setenv("INJECTABLE_CACHE_DIR", os.path.join("fake", "cache"))
+
+        # when
+        cache_dir = ScanCache.default_cache_dir()
+
+        # then
+        assert cache_dir == os.path.join("fake", "cache")
+
+    def test__get__with_unknown_file(self, tmp_path):
+        # given
+        file = tmp_path / "file.py"
+        file.write_text("...")
+        scan_cache = ScanCache(str(tmp_path / "cache"))
+
+        # when
+        result = scan_cache.get(str(file))
+
+        # then
+        assert result is None
+        assert scan_cache.hits == 0
+        assert scan_cache.misses == 1
+
+    def test__get__with_unchanged_file(self, tmp_path):
+        # given
+        file = tmp_path / "file.py"
+        file.write_text("...")
+        scan_cache = ScanCache(str(tmp_path / "cache"))
+        scan_cache.set(str(file), True)
+
+        # when
+        result = scan_cache.get(str(file))
+
+        # then
+        assert result is True
+        assert scan_cache.hits == 1
+        assert scan_cache.misses == 0
+
+    def test__get__with_changed_file(self, tmp_path):
+        # given
+        file = tmp_path / "file.py"
+        file.write_text("...")
+        scan_cache = ScanCache(str(tmp_path / "cache"))
+        scan_cache.set(str(file), True)
+        file.write_text("changed")
+
+        # when
+        result = scan_cache.get(str(file))
+
+        # then
+        assert result is None
+        assert scan_cache.misses == 1
+
+    def test__get__with_touched_file_and_hash_contents(self, tmp_path):
+        # given
+        file = tmp_path / "file.py"
+        file.write_text("...")
+        scan_cache = ScanCache(str(tmp_path / "cache"), hash_contents=True)
+        scan_cache.set(str(file), True)
+        stat = os.stat(file)
+        os.utime(file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        # when
+        result = scan_cache.get(str(file))
+
+        # then
+        assert result is True
+        assert scan_cache.hits == 1
+
+    def test__save__persists_entries_across_instances(self, tmp_path):
+        # given
+        file = tmp_path / "file.py"
+        file.write_text("...")
+        cache_dir = str(tmp_path / "cache")
+        scan_cache = ScanCache(cache_dir)
+        scan_cache.set(str(file), False)
+
+        # when
+        scan_cache.save()
+
+        # then
+        assert os.path.exists(os.path.join(cache_dir, ScanCache.FILENAME))
+        assert ScanCache(cache_dir).get(str(file)) is False
+
+    def test__invalidate__discards_entries(self, tmp_path):
+        # given
+        file = tmp_path / "file.py"
+        file.write_text("...")
+        cache_dir = str(tmp_path / "cache")
+        scan_cache = ScanCache(cache_dir)
+        scan_cache.set(str(file), True)
+        scan_cache.save()
+
+        # when
+        scan_cache.invalidate()
+
+        # then
+        assert not os.path.exists(scan_cache.path)
+        assert scan_cache.get(str(file)) is None
+        assert ScanCache(cache_dir).get(str(file)) is None
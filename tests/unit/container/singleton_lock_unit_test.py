@@ -0,0 +1,143 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from injectable import Injectable
+from injectable.errors import CyclicDependencyError
+
+
+class TestSingletonLock:
+    def test__singleton_instance__constructed_once_across_threads(self):
+        # given
+        calls = []
+
+        def constructor():
+            calls.append(1)
+            time.sleep(0.05)
+            return object()
+
+        injectable = Injectable(constructor, singleton=True)
+
+        # when
+        with ThreadPoolExecutor(8) as executor:
+            instances = list(
+                executor.map(lambda _: injectable.singleton_instance, range(8))
+            )
+
+        # then
+        assert len(calls) == 1
+        assert all(instance is instances[0] for instance in instances)
+
+    def test__singleton_instance__with_failing_constructor_retries(self):
+        # given
+        def constructor():
+            constructor.calls += 1
+            if constructor.calls == 1:
+                raise ValueError()
+            return "instance"
+
+        constructor.calls = 0
+        injectable = Injectable(constructor, singleton=True)
+
+        # when
+        with pytest.raises(ValueError):
+            injectable.singleton_instance
+        instance = injectable.singleton_instance
+
+        # then
+        assert instance == "instance"
+
+    def test__singleton_instance__with_cycle_in_same_thread_raises(self):
+        # given
+        def constructor_a():
+            return injectable_b.singleton_instance
+
+        def constructor_b():
+            return injectable_a.singleton_instance
+
+        injectable_a = Injectable(constructor_a, singleton=True)
+        injectable_b = Injectable(constructor_b, singleton=True)
+
+        # when
+        with pytest.raises(CyclicDependencyError) as e:
+            injectable_a.singleton_instance
+
+        # then
+        assert [name.split(".")[-1] for name in e.value.chain] == [
+            "constructor_a",
+            "constructor_b",
+            "constructor_a",
+        ]
+
+    def test__aget_instance__with_async_cycle_raises(self):
+        # given
+        async def constructor_a():
+            return await injectable_b.aget_instance()
+
+        async def constructor_b():
+            return await injectable_a.aget_instance()
+
+        injectable_a = Injectable(constructor_a, singleton=True)
+        injectable_b = Injectable(constructor_b, singleton=True)
+
+        # when
+        with pytest.raises(CyclicDependencyError) as e:
+            asyncio.run(asyncio.wait_for(injectable_a.aget_instance(), 1))
+
+        # then
+        assert [name.split(".")[-1] for name in e.value.chain] == [
+            "constructor_a",
+            "constructor_b",
+            "constructor_a",
+        ]
+        assert not injectable_a.singleton_constructed
+
+    def test__aget_instance__with_async_self_dependency_raises(self):
+        # given
+        async def constructor():
+            return await asyncio.gather(injectable.aget_instance())
+
+        injectable = Injectable(constructor, singleton=True)
+
+        # then
+        with pytest.raises(CyclicDependencyError):
+            asyncio.run(asyncio.wait_for(injectable.aget_instance(), 1))
+
+    def test__singleton_instance__with_cycle_across_threads_raises(self):
+        # given
+        # both threads hold their singleton's lock before requesting the other one
+        barrier = threading.Barrier(2)
+        first_calls = {"a", "b"}
+
+        def wait_on_first_call(name):
+            if name in first_calls:
+                first_calls.remove(name)
+                barrier.wait(timeout=5)
+
+        def constructor_a():
+            wait_on_first_call("a")
+            return injectable_b.singleton_instance
+
+        def constructor_b():
+            wait_on_first_call("b")
+            return injectable_a.singleton_instance
+
+        injectable_a = Injectable(constructor_a, singleton=True)
+        injectable_b = Injectable(constructor_b, singleton=True)
+
+        def construct(injectable):
+            try:
+                return injectable.singleton_instance
+            except CyclicDependencyError as e:
+                return e
+
+        # when
+        with ThreadPoolExecutor(2) as executor:
+            results = list(executor.map(construct, [injectable_a, injectable_b]))
+
+        # then
+        errors = [r for r in results if isinstance(r, CyclicDependencyError)]
+        assert len(errors) >= 1
@@ -0,0 +1,147 @@
+from injectable.container.static_registrations import (
+    StaticRegistration,
+    extract_registrations,
+)
+
+
+def write_module(tmp_path, source: str, name: str = "module.py") -> str:
+    filepath = tmp_path / name
+    filepath.write_text(source)
+    return str(filepath)
+
+
+class TestExtractRegistrations:
+    def test__extract_registrations__with_bare_decorator(self, tmp_path):
+        # given
+        filepath = write_module(
+            tmp_path, "from injectable import injectable\n@injectable\nclass Foo: ...\n"
+        )
+
+        # when
+        registrations = extract_registrations(filepath)
+
+        # then
+        assert registrations == [StaticRegistration("Foo", "class", ("Foo", "object"))]
+
+    def test__extract_registrations__with_literal_arguments(self, tmp_path):
+        # given
+        filepath = write_module(
+            tmp_path,
+            "import injectable as di\n"
+            "class Outer:\n"
+            "    @di.injectable(qualifier='foo', namespace='ns', group='g',"
+            " primary=True, singleton=True)\n"
+            "    class Foo(Exception): ...\n",
+        )
+
+        # when
+        registrations = extract_registrations(filepath)
+
+        # then
+        assert registrations == [
+            StaticRegistration(
+                "Outer.Foo",
+                "class",
+                ("Outer.Foo", "Exception", "BaseException", "object"),
+                qualifier="foo",
+                primary=True,
+                namespace="ns",
+                group="g",
+                singleton=True,
+            )
+        ]
+
+    def test__extract_registrations__with_groups(self, tmp_path):
+        # given
+        filepath = write_module(
+            tmp_path,
+            "from injectable import injectable\n"
+            "@injectable(group='eu', groups=['acme', 'beta'])\n"
+            "class Foo: ...\n",
+        )
+
+        # when
+        registrations = extract_registrations(filepath)
+
+        # then
+        assert registrations == [
+            StaticRegistration(
+                "Foo", "class", ("Foo", "object"), group="eu", groups=("acme", "beta")
+            )
+        ]
+
+    def test__extract_registrations__with_async_factory(self, tmp_path):
+        # given
+        filepath = write_module(
+            tmp_path,
+            "from injectable import injectable_factory\n"
+            "@injectable_factory(qualifier='foo')\n"
+            "async def foo_factory(): ...\n",
+        )
+
+        # when
+        registrations = extract_registrations(filepath)
+
+        # then
+        assert registrations == [
+            StaticRegistration(
+                "foo_factory", "factory", (), qualifier="foo", is_async=True
+            )
+        ]
+
+    def test__extract_registrations__follows_imported_bases(self, tmp_path):
+        # given
+        write_module(tmp_path, "class Base: ...\nclass Mid(Base): ...\n", "base.py")
+        filepath = write_module(
+            tmp_path,
+            "from injectable import injectable_factory as factory\n"
+            "from .base import Mid\n"
+            "@factory(Mid, qualifier='mid')\n"
+            "def mid_factory(): ...\n",
+        )
+
+        # when
+        registrations = extract_registrations(filepath)
+
+        # then
+        assert registrations == [
+            StaticRegistration(
+                "mid_factory", "factory", ("Mid", "Base"), qualifier="mid"
+            )
+        ]
+
+    def test__extract_registrations__with_non_literal_arguments(self, tmp_path):
+        # given
+        filepath = write_module(
+            tmp_path,
+            "from injectable import injectable\n"
+            "QUALIFIER = 'foo'\n"
+            "@injectable(qualifier=QUALIFIER)\n"
+            "class Foo: ...\n",
+        )
+
+        # then
+        assert extract_registrations(filepath) is None
+
+    def test__extract_registrations__with_direct_call(self, tmp_path):
+        # given
+        filepath = write_module(
+            tmp_path,
+            "from injectable import injectable\nclass Foo: ...\ninjectable(Foo)\n",
+        )
+
+        # then
+        assert extract_registrations(filepath) is None
+
+    def test__extract_registrations__with_decorator_inside_function(self, tmp_path):
+        # given
+        filepath = write_module(
+            tmp_path,
+            "from injectable import injectable\n"
+            "def register():\n"
+            "    @injectable\n"
+            "    class Foo: ...\n",
+        )
+
+        # then
+        assert extract_registrations(filepath) is None
@@ -0,0 +1,110 @@
+import threading
+
+import pytest
+
+from injectable import Autowired, Injectable, autowired, warm_up
+from injectable.container.warm_up import start_background_constructions
+from injectable.testing import register_injectables, reset_injection_container
+
+
+@pytest.fixture(autouse=True)
+def reset_injection_container_before_test():
+    reset_injection_container()
+
+
+class TestWarmUp:
+    def test__warm_up__constructs_singletons_in_dependency_order(self):
+        # given
+        constructed = []
+
+        class Pool:
+            def __init__(self):
+                constructed.append("pool")
+
+        class Repository:
+            @autowired
+            def __init__(self, pool: Autowired("pool")):
+                constructed.append("repository")
+                self.pool = pool
+
+        class Service:
+            @autowired
+            def __init__(self, repository: Autowired("repository")):
+                constructed.append("service")
+                self.repository = repository
+
+        pool = Injectable(Pool, "pool", singleton=True)
+        register_injectables({pool}, qualifier="pool")
+        register_injectables(
+            {Injectable(Repository, "repository")}, qualifier="repository"
+        )
+        service = Injectable(Service, "service", singleton=True)
+        register_injectables({service}, qualifier="service")
+
+        # when
+        times = warm_up()
+
+        # then
+        assert list(times) == ["pool", "service"]
+        assert constructed[0] == "pool"
+        assert service.singleton_instance.repository.pool is pool.singleton_instance
+
+    def test__warm_up__constructs_independent_singletons_in_parallel(self):
+        # given
+        barrier = threading.Barrier(2, timeout=5)
+        injectables = {
+            Injectable(lambda: barrier.wait(), str(i), singleton=True) for i in range(2)
+        }
+        register_injectables(injectables, qualifier="TEST")
+
+        # when
+        times = warm_up(max_workers=2)
+
+        # then
+        assert sorted(times) == ["0", "1"]
+        assert all(injectable.singleton_constructed for injectable in injectables)
+
+    def test__warm_up__filters_by_namespace_and_group(self):
+        # given
+        selected = Injectable(object, "selected", group="g", singleton=True)
+        other_group = Injectable(object, "other_group", singleton=True)
+        other_namespace = Injectable(object, "other_namespace", group="g")
+        register_injectables({selected, other_group}, qualifier="TEST")
+        register_injectables({other_namespace}, qualifier="TEST", namespace="other")
+
+        # when
+        times = warm_up("DEFAULT_NAMESPACE", group="g")
+
+        # then
+        assert list(times) == ["selected"]
+        assert other_group.singleton_constructed is False
+
+    def test__warm_up__raises_construction_errors(self):
+        # given
+        def fail():
+            raise ValueError()
+
+        register_injectables(
+            {Injectable(fail, "failing", singleton=True)}, qualifier="TEST"
+        )
+
+        # then
+        with pytest.raises(ValueError):
+            warm_up()
+
+
+class TestStartBackgroundConstructions:
+    def test__start_background_constructions(self):
+        # given
+        background = Injectable(object, "background", singleton=True, init="background")
+        on_demand = Injectable(object, "on_demand", singleton=True)
+        register_injectables({background, on_demand}, qualifier="TEST")
+
+        # when
+        started = start_background_constructions()
+        background._state.background_thread.join(5)
+
+        # then
+        assert started == [background]
+        assert background.singleton_constructed is True
+        assert on_demand.singleton_constructed is False
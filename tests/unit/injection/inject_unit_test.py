@@ -1,13 +1,21 @@
+import asyncio
 from unittest.mock import MagicMock
 
 import pytest
 from pytest import fixture
 from pytest_mock import MockFixture
 
-from injectable import inject, Injectable, inject_multiple
+from injectable import ainject, ainject_multiple, inject, Injectable, inject_multiple
 from injectable.errors import InjectionError
 from injectable.constants import DEFAULT_NAMESPACE
 from injectable.injection.injection_utils import RegistryType
+from injectable.testing import register_injectables, reset_injection_container
+
+
+@fixture(autouse=True)
+def reset_injection_container_before_test():
+    # resolutions cached in namespaces left by other tests would bypass the mocks
+    reset_injection_container()
 
 
 @fixture
@@ -66,10 +74,12 @@ class TestInject:
             dependency_name_arg,
             registry_type_arg,
             namespace_arg,
+            dependency_arg,
         ) = get_namespace_injectables_mock.call_args[0]
         assert dependency_name_arg is dependency_name
         assert registry_type_arg is registry_type
         assert namespace_arg is DEFAULT_NAMESPACE
+        assert dependency_arg is dependency
         assert filter_by_group_mock.called is False
         assert resolve_single_injectable_mock.called is True
         (
@@ -229,6 +239,7 @@ class TestInject:
             dependency_name_arg,
             registry_type_arg,
             namespace_arg,
+            dependency_arg,
         ) = get_namespace_injectables_mock.call_args[0]
         assert dependency_name_arg is dependency_name
         assert registry_type_arg is registry_type
@@ -283,10 +294,12 @@ class TestInjectMultiple:
             dependency_name_arg,
             registry_type_arg,
             namespace_arg,
+            dependency_arg,
         ) = get_namespace_injectables_mock.call_args[0]
         assert dependency_name_arg is dependency
         assert registry_type_arg is registry_type
         assert namespace_arg is DEFAULT_NAMESPACE
+        assert dependency_arg is dependency
         assert filter_by_group_mock.called is False
         assert all(injectable.get_instance.called is True for injectable in injectables)
         assert all(
@@ -431,6 +444,7 @@ class TestInjectMultiple:
             dependency_name_arg,
             registry_type_arg,
             namespace_arg,
+            dependency_arg,
         ) = get_namespace_injectables_mock.call_args[0]
         assert dependency_name_arg is dependency_name
         assert registry_type_arg is registry_type
@@ -449,3 +463,54 @@ class TestInjectMultiple:
         )
         assert len(instances) == len(expected_instances)
         assert all(instance in expected_instances for instance in instances)
+
+
+class TestAinject:
+    def test__ainject__awaits_async_factory(self):
+        # given
+        async def factory():
+            return "instance"
+
+        register_injectables({Injectable(factory)}, qualifier="TEST")
+
+        # when
+        instance = asyncio.run(ainject("TEST"))
+
+        # then
+        assert instance == "instance"
+
+    def test__ainject__with_no_matches_when_optional(self):
+        # when
+        instance = asyncio.run(ainject("TEST", optional=True))
+
+        # then
+        assert instance is None
+
+    def test__ainject__with_no_matches_when_non_optional(self):
+        # then
+        with pytest.raises(InjectionError):
+            asyncio.run(ainject("TEST"))
+
+    def test__ainject_multiple__mixes_sync_and_async_factories(self):
+        # given
+        async def factory():
+            return "async"
+
+        injectables = {Injectable(factory), Injectable(lambda: "sync")}
+        register_injectables(injectables, qualifier="TEST")
+
+        # when
+        instances = asyncio.run(ainject_multiple("TEST"))
+
+        # then
+        assert sorted(instances) == ["async", "sync"]
+
+    def test__inject__with_async_factory_raises(self):
+        # given
+        async def factory(): ...
+
+        register_injectables({Injectable(factory)}, qualifier="TEST")
+
+        # then
+        with pytest.raises(TypeError):
+            inject("TEST")
@@ -1,10 +1,12 @@
 import os
 from unittest.mock import MagicMock
 
+import pytest
 from pytest import fixture
 from pytest_mock import MockFixture
 
 from injectable import injectable
+from injectable.errors import InjectableLoadError
 
 
 @fixture
@@ -90,6 +92,9 @@ class TestInjectableDecorator:
             namespace_arg,
             group_arg,
             singleton_arg,
+            scope_arg,
+            init_arg,
+            groups_arg,
         ) = injection_container_mock._register_injectable.call_args[0]
         assert klass_arg is klass
         assert caller_filepath_arg is caller_filepath
@@ -98,6 +103,9 @@ class TestInjectableDecorator:
         assert namespace_arg is None
         assert group_arg is None
         assert singleton_arg is False
+        assert scope_arg is None
+        assert init_arg is None
+        assert groups_arg is None
 
     def test__injectable__with_explicit_args(
         self, get_caller_filepath_mock, injection_container_mock
@@ -131,6 +139,9 @@ class TestInjectableDecorator:
             namespace_arg,
             group_arg,
             singleton_arg,
+            scope_arg,
+            init_arg,
+            groups_arg,
         ) = injection_container_mock._register_injectable.call_args[0]
         assert klass_arg is klass
         assert caller_filepath_arg is caller_filepath
@@ -139,3 +150,61 @@ class TestInjectableDecorator:
         assert namespace_arg is namespace
         assert group_arg is group
         assert singleton_arg is True
+
+    def test__injectable__records_decoration_when_not_loading(
+        self, get_caller_filepath_mock, injection_container_mock
+    ):
+        # given
+        root = "/" if os.name != "nt" else "C:\\"
+        caller_filepath = os.path.join(root, "fake", "path", "caller_file.py")
+        get_caller_filepath_mock.return_value = caller_filepath
+        injection_container_mock.LOADING_FILEPATH = None
+        klass = MagicMock
+
+        # when
+        injectable(klass)
+
+        # then
+        assert injection_container_mock._register_injectable.called is False
+        record_decoration = injection_container_mock._record_decoration
+        assert record_decoration.called is True
+        filepath_arg, qualname_arg, registration_arg = record_decoration.call_args[0]
+        assert filepath_arg is caller_filepath
+        assert qualname_arg == MagicMock.__qualname__
+
+        # and when
+        registration_arg()
+
+        # then
+        assert injection_container_mock._register_injectable.called is True
+        assert injection_container_mock._register_injectable.call_args[0][0] is klass
+
+    def test__injectable__with_groups_generator(
+        self, get_caller_filepath_mock, injection_container_mock
+    ):
+        # given
+        get_caller_filepath_mock.return_value = "caller_file.py"
+        injection_container_mock.LOADING_FILEPATH = "caller_file.py"
+
+        # when
+        injectable(groups=(group for group in ["eu", "acme"]))(MagicMock)
+
+        # then
+        groups_arg = injection_container_mock._register_injectable.call_args[0][9]
+        assert groups_arg == ("eu", "acme")
+
+    @pytest.mark.parametrize(
+        "options",
+        [
+            {"scope": "thread", "singleton": True},
+            {"scope": "process"},
+            {"init": "background"},
+            {"init": "startup", "singleton": True},
+            {"groups": "eu"},
+            {"groups": ["eu", None]},
+        ],
+    )
+    def test__injectable__with_invalid_options_raises(self, options):
+        # then
+        with pytest.raises(InjectableLoadError):
+            injectable(**options)
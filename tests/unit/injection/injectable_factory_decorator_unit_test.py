@@ -100,6 +100,9 @@ class TestInjectableFactoryDecorator:
             namespace_arg,
             group_arg,
             singleton_arg,
+            scope_arg,
+            init_arg,
+            groups_arg,
         ) = injection_container_mock._register_factory.call_args[0]
         assert factory_arg is factory
         assert caller_filepath_arg is caller_filepath
@@ -109,6 +112,9 @@ class TestInjectableFactoryDecorator:
         assert namespace_arg is None
         assert group_arg is None
         assert singleton_arg is False
+        assert scope_arg is None
+        assert init_arg is None
+        assert groups_arg is None
 
     def test__injectable_factory__with_explicit_args(
         self, get_caller_filepath_mock, injection_container_mock
@@ -145,6 +151,9 @@ class TestInjectableFactoryDecorator:
             namespace_arg,
             group_arg,
             singleton_arg,
+            scope_arg,
+            init_arg,
+            groups_arg,
         ) = injection_container_mock._register_factory.call_args[0]
         assert factory_arg is factory
         assert caller_filepath_arg is caller_filepath
@@ -154,3 +163,31 @@ class TestInjectableFactoryDecorator:
         assert namespace_arg is namespace
         assert group_arg is group
         assert singleton_arg is True
+
+    def test__injectable_factory__records_decoration_when_not_loading(
+        self, get_caller_filepath_mock, injection_container_mock
+    ):
+        # given
+        root = "/" if os.name != "nt" else "C:\\"
+        caller_filepath = os.path.join(root, "fake", "path", "caller_file.py")
+        get_caller_filepath_mock.return_value = caller_filepath
+        injection_container_mock.LOADING_FILEPATH = None
+        factory = MagicMock
+
+        # when
+        injectable_factory(qualifier="any")(factory)
+
+        # then
+        assert injection_container_mock._register_factory.called is False
+        record_decoration = injection_container_mock._record_decoration
+        assert record_decoration.called is True
+        filepath_arg, qualname_arg, registration_arg = record_decoration.call_args[0]
+        assert filepath_arg is caller_filepath
+        assert qualname_arg == MagicMock.__qualname__
+
+        # and when
+        registration_arg()
+
+        # then
+        assert injection_container_mock._register_factory.called is True
+        assert injection_container_mock._register_factory.call_args[0][0] is factory
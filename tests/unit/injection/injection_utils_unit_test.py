@@ -12,6 +12,7 @@ from injectable.injection.injection_utils import (
     RegistryType,
     filter_by_group,
     resolve_single_injectable,
+    resolve_cached,
 )
 
 
@@ -39,25 +40,49 @@ class TestGetNamespaceInjectables:
         )
 
         # then
-        assert namespace.class_registry.get.called == (
+        assert namespace.get_named_injectables.called == (
             registry_type is RegistryType.CLASS
         )
         assert namespace.qualifier_registry.get.called == (
             registry_type is RegistryType.QUALIFIER
         )
-        registry = (
-            namespace.class_registry
+        lookup = (
+            namespace.get_named_injectables
             if registry_type is RegistryType.CLASS
-            else namespace.qualifier_registry
+            else namespace.qualifier_registry.get
         )
-        assert registry.get.call_args[0][0] is dependency_name
-        assert injectables == registry.get.return_value
+        assert lookup.call_args[0][0] is dependency_name
+        assert injectables == lookup.return_value
+
+    def test__get_namespace_injectables__with_class_dependency(
+        self, injection_container_mock: InjectionContainer
+    ):
+        # given
+        dependency_name = "TEST"
+        namespace_key = "TEST_NAMESPACE"
+        namespace = MagicMock(spec=Namespace)()
+        injection_container_mock.NAMESPACES = {namespace_key: namespace}
+
+        # when
+        injectables = get_namespace_injectables(
+            dependency_name, RegistryType.CLASS, namespace_key, MagicMock
+        )
+
+        # then
+        namespace.get_class_injectables.assert_called_once_with(
+            MagicMock, dependency_name
+        )
+        assert injectables == namespace.get_class_injectables.return_value
 
 
 class TestFilterByGroup:
     def test__filter_by_group__when_exclude_groups_is_none(self):
         # given
-        injectables = [MagicMock(group="A"), MagicMock(group="A"), MagicMock(group="B")]
+        injectables = [
+            MagicMock(group="A", groups={"A"}),
+            MagicMock(group="A", groups={"A"}),
+            MagicMock(group="B", groups={"B"}),
+        ]
 
         # when
         matches = filter_by_group({*injectables}, group="A")
@@ -68,7 +93,11 @@ class TestFilterByGroup:
 
     def test__filter_by_group__when_group_is_none(self):
         # given
-        injectables = [MagicMock(group="A"), MagicMock(group="A"), MagicMock(group="B")]
+        injectables = [
+            MagicMock(group="A", groups={"A"}),
+            MagicMock(group="A", groups={"A"}),
+            MagicMock(group="B", groups={"B"}),
+        ]
 
         # when
         matches = filter_by_group({*injectables}, exclude_groups=["B"])
@@ -79,7 +108,11 @@ class TestFilterByGroup:
 
     def test__filter_by_group__when_group_and_exclude_groups_are_set(self):
         # given
-        injectables = [MagicMock(group="A"), MagicMock(group="A"), MagicMock(group="B")]
+        injectables = [
+            MagicMock(group="A", groups={"A"}),
+            MagicMock(group="A", groups={"A"}),
+            MagicMock(group="B", groups={"B"}),
+        ]
 
         # when
         matches = filter_by_group({*injectables}, group="A", exclude_groups=["A"])
@@ -87,6 +120,53 @@ class TestFilterByGroup:
         # then
         assert len(matches) == 0
 
+    def test__filter_by_group__with_multiple_groups(self):
+        # given
+        injectables = [
+            Injectable(MagicMock, group="eu", groups=["acme"]),
+            Injectable(MagicMock, groups=["eu", "globex"]),
+            Injectable(MagicMock, groups=["us", "acme"]),
+        ]
+
+        # when
+        matches = filter_by_group(injectables, group="eu", exclude_groups=["globex"])
+
+        # then
+        assert matches == {injectables[0]}
+
+    @pytest.mark.parametrize(
+        "group,exclude_groups,expected",
+        [
+            ("eu", None, [0, 1]),
+            ("acme", ["us"], [0]),
+            (None, ["acme"], [1, 3]),
+            (None, ["unknown"], [0, 1, 2, 3]),
+            ("unknown", None, []),
+        ],
+    )
+    def test__filter_by_group__with_namespace(
+        self, injection_container_mock, group, exclude_groups, expected
+    ):
+        # given
+        namespace = Namespace()
+        injectables = [
+            Injectable(MagicMock, group="eu", groups=["acme"]),
+            Injectable(MagicMock, groups=["eu", "globex"]),
+            Injectable(MagicMock, groups=["us", "acme"]),
+            Injectable(MagicMock),
+        ]
+        for injectable in injectables:
+            namespace.register_injectable(injectable, qualifier="foo")
+        injection_container_mock.NAMESPACES = {"TEST_NAMESPACE": namespace}
+
+        # when
+        matches = filter_by_group(
+            injectables, group, exclude_groups, namespace="TEST_NAMESPACE"
+        )
+
+        # then
+        assert matches == tuple(injectables[index] for index in expected)
+
 
 class TestResolveSingleInjectable:
     def test__resolve_single_injectable__obvious_case(self):
@@ -129,3 +209,49 @@ class TestResolveSingleInjectable:
 
         # then
         assert injectable is primary_injectable
+
+
+class TestResolveCached:
+    def test__resolve_cached__caches_by_namespace_generation(
+        self, injection_container_mock
+    ):
+        # given
+        namespace = Namespace()
+        injection_container_mock.NAMESPACES = {"TEST_NAMESPACE": namespace}
+        resolver = MagicMock(side_effect=["first", "second"])
+
+        # when
+        first = resolve_cached("TEST_NAMESPACE", "key", resolver, 1)
+        cached = resolve_cached("TEST_NAMESPACE", "key", resolver, 1)
+        namespace.register_injectable(MagicMock(spec=Injectable), qualifier="foo")
+        second = resolve_cached("TEST_NAMESPACE", "key", resolver, 1)
+
+        # then
+        assert (first, cached, second) == ("first", "first", "second")
+        assert resolver.call_count == 2
+        resolver.assert_called_with(1)
+
+    def test__resolve_cached__without_namespace(self, injection_container_mock):
+        # given
+        injection_container_mock.NAMESPACES = {}
+        resolver = MagicMock(return_value="resolution")
+
+        # when
+        resolve_cached("TEST_NAMESPACE", "key", resolver)
+        resolve_cached("TEST_NAMESPACE", "key", resolver)
+
+        # then
+        assert resolver.call_count == 2
+
+    def test__resolve_cached__does_not_cache_errors(self, injection_container_mock):
+        # given
+        injection_container_mock.NAMESPACES = {"TEST_NAMESPACE": Namespace()}
+        resolver = MagicMock(side_effect=[InjectionError("class", "TEST"), "found"])
+
+        # when
+        with pytest.raises(InjectionError):
+            resolve_cached("TEST_NAMESPACE", "key", resolver)
+        resolution = resolve_cached("TEST_NAMESPACE", "key", resolver)
+
+        # then
+        assert resolution == "found"
@@ -0,0 +1,58 @@
+import os
+from unittest.mock import MagicMock
+
+from pytest import fixture
+from pytest_mock import MockFixture
+
+from injectable.__main__ import main
+from injectable.constants import DEFAULT_NAMESPACE
+from injectable.container.load_report import LoadReport
+
+
+@fixture
+def build_manifest_mock(mocker: MockFixture):
+    return mocker.patch("injectable.__main__.build_manifest")
+
+
+class TestMain:
+    def test__build_manifest(self, build_manifest_mock, capsys):
+        # given
+        build_manifest_mock.return_value = MagicMock(
+            filepath="manifest.json", modules=[MagicMock(injectables=[1, 2])]
+        )
+
+        # when
+        exit_code = main(["build-manifest", "src", "-o", "manifest.json"])
+
+        # then
+        assert exit_code == 0
+        build_manifest_mock.assert_called_once_with(
+            "src",
+            "manifest.json",
+            default_namespace=DEFAULT_NAMESPACE,
+            encoding="utf-8",
+        )
+        assert "1 module(s), 2 injectable(s)" in capsys.readouterr().out
+
+    def test__profile_load(self, mocker, capsys):
+        # given
+        report = LoadReport()
+        report.files_walked = 3
+        report.record_execution("slow.py", 2.0)
+        report.record_execution("fast.py", 1.0)
+        report.registrations = {DEFAULT_NAMESPACE: 2}
+        load_injection_container = mocker.patch(
+            "injectable.__main__.load_injection_container", return_value=report
+        )
+
+        # when
+        exit_code = main(["profile-load", "src", "--top", "1"])
+
+        # then
+        assert exit_code == 0
+        assert load_injection_container.call_args[0][0] == os.path.abspath("src")
+        out = capsys.readouterr().out
+        assert "Walked 3 file(s)" in out
+        assert f"Registered 2 injectable(s) in {DEFAULT_NAMESPACE}" in out
+        assert "slow.py" in out
+        assert "fast.py" not in out
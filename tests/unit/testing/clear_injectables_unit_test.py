@@ -1,13 +1,14 @@
 import sys
 from unittest.mock import MagicMock, call
 
+import pytest
 from pytest import fixture
 from pytest_mock import MockFixture
 
-from injectable import InjectionContainer, Injectable
+from injectable import InjectionContainer, Injectable, inject, load_injection_container
 from injectable.container.namespace import Namespace
 from injectable.constants import DEFAULT_NAMESPACE
-from injectable.testing import clear_injectables
+from injectable.testing import clear_injectables, reset_injection_container
 
 
 @fixture(autouse=True)
@@ -30,12 +31,35 @@ def get_dependency_name_mock(mocker: MockFixture):
 
 
 class TestClearInjectables:
-    def test__clear_injectables__with_class_dependency(self, get_dependency_name_mock):
+    def test__clear_injectables__with_class_dependency(self):
+        # given
+        class Client: ...
+
+        expected_injectables = {Injectable(Client)}
+        namespace_key = "TEST_NAMESPACE"
+        namespace = Namespace()
+        namespace.register_injectable(next(iter(expected_injectables)), Client)
+        InjectionContainer.NAMESPACES[namespace_key] = namespace
+
+        # when
+        cleared_injectables = clear_injectables(Client, namespace_key)
+
+        # then
+        assert cleared_injectables == expected_injectables
+        assert namespace.type_registry == {}
+        assert namespace.type_names == {}
+        assert namespace.qualified_type_names == {}
+
+    def test__clear_injectables__with_class_dependency_registered_by_name(
+        self, get_dependency_name_mock
+    ):
         # given
         expected_injectables = [MagicMock(spec=Injectable)()]
         namespace_key = "TEST_NAMESPACE"
         namespace = MagicMock(spec=Namespace)()
-        namespace.class_registry.__getitem__.return_value = expected_injectables
+        namespace.find_type_name.return_value = None
+        namespace.group_masks = {}
+        namespace.class_registry.pop.return_value = expected_injectables
         InjectionContainer.NAMESPACES[namespace_key] = namespace
         dependency_name = "TEST"
         get_dependency_name_mock.return_value = dependency_name
@@ -44,14 +68,32 @@ class TestClearInjectables:
         cleared_injectables = clear_injectables(MagicMock, namespace_key)
 
         # then
-        assert call.class_registry.__getitem__(dependency_name) in namespace.mock_calls
-        assert (
-            call.class_registry.__setitem__(dependency_name, set())
-            in namespace.mock_calls
-        )
+        assert call.class_registry.pop(dependency_name) in namespace.mock_calls
         assert namespace.qualifier_registry.__getitem__.called is False
         assert cleared_injectables is expected_injectables
 
+    def test__clear_injectables__with_same_named_classes(self):
+        # given
+        first = type("Client", (), {"__module__": "first"})
+        second = type("Client", (), {"__module__": "second"})
+        namespace_key = "TEST_NAMESPACE"
+        namespace = Namespace()
+        first_injectable = Injectable(first, groups=frozenset({"eu"}))
+        second_injectable = Injectable(second, groups=frozenset({"eu"}))
+        namespace.register_injectable(first_injectable, first)
+        namespace.register_injectable(second_injectable, second)
+        InjectionContainer.NAMESPACES[namespace_key] = namespace
+
+        # when
+        cleared_injectables = clear_injectables(first, namespace_key)
+
+        # then
+        assert cleared_injectables == {first_injectable}
+        assert namespace.get_class_injectables(second) == {second_injectable}
+        assert namespace.type_names == {"second.Client": [second]}
+        assert first_injectable.unique_id not in namespace.group_masks
+        assert second_injectable.unique_id in namespace.group_masks
+
     def test__clear_injectables__with_qualifier_dependency(self):
         # given
         expected_injectables = [MagicMock(spec=Injectable)()]
@@ -93,3 +135,31 @@ class TestClearInjectables:
         )
         assert namespace.class_registry.__getitem__.called is False
         assert cleared_injectables is expected_injectables
+
+    def test__clear_injectables__with_class_loaded_in_run_mode(
+        self, tmp_path, monkeypatch
+    ):
+        # given
+        reset_injection_container()
+        package = tmp_path / "clear_injectables_pkg"
+        package.mkdir()
+        (package / "__init__.py").write_text("")
+        (package / "svc.py").write_text(
+            "from injectable import injectable\n@injectable\nclass Svc: ...\n"
+        )
+        monkeypatch.syspath_prepend(str(tmp_path))
+        load_injection_container(str(package))
+        from clear_injectables_pkg.svc import Svc
+
+        try:
+            # when
+            cleared_injectables = clear_injectables(Svc)
+
+            # then
+            assert len(cleared_injectables) == 1
+            assert inject(Svc, optional=True) is None
+            with pytest.raises(KeyError):
+                clear_injectables(Svc)
+        finally:
+            sys.modules.pop("clear_injectables_pkg.svc")
+            sys.modules.pop("clear_injectables_pkg")